@@ -0,0 +1,65 @@
+"""
+Build the prebuilt section index artifact (data/section_index.pkl)
+
+Parses data/ipc_sections.json and data/bns_sections.json, builds the lookup tables
+and BM25 indexes and saves them keyed by a hash of the JSON files. Run it after
+editing the section databases (e.g. in the deploy step) so workers start by loading
+the artifact; they also rebuild it themselves when they find it stale.
+
+Usage:
+    python build_section_index.py            # build if stale
+    python build_section_index.py --force    # always rebuild
+    python build_section_index.py --check    # exit 1 if stale, build nothing
+"""
+import argparse
+import os
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from utils.section_artifact import (
+    ARTIFACT_FILE, artifact_source_hash, build_section_artifact, read_section_artifact, save_section_artifact
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the prebuilt section index artifact")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the artifact is current")
+    parser.add_argument("--check", action="store_true", help="Only report whether the artifact is current")
+    args = parser.parse_args()
+
+    source_hash = artifact_source_hash()
+    started = time.perf_counter()
+    current = read_section_artifact(source_hash)
+    load_ms = (time.perf_counter() - started) * 1000
+
+    if args.check:
+        if current is None:
+            print(f"❌ {ARTIFACT_FILE} is missing or stale")
+            sys.exit(1)
+        print(f"✅ {ARTIFACT_FILE} is current (loads in {load_ms:.1f} ms)")
+        return
+
+    if current is not None and not args.force:
+        print(f"✅ {ARTIFACT_FILE} is current, nothing to do (use --force to rebuild)")
+        return
+
+    started = time.perf_counter()
+    artifact = build_section_artifact(source_hash)
+    build_ms = (time.perf_counter() - started) * 1000
+    save_section_artifact(artifact)
+
+    started = time.perf_counter()
+    read_section_artifact(source_hash)
+    load_ms = (time.perf_counter() - started) * 1000
+
+    print(f"📦 {len(artifact.index.ipc_sections)} IPC / {len(artifact.index.bns_sections)} BNS sections")
+    print(f"✅ Wrote {ARTIFACT_FILE} ({ARTIFACT_FILE.stat().st_size / 1024:.0f} KB, hash {source_hash[:12]})")
+    print(f"⏱️  build {build_ms:.1f} ms, load {load_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
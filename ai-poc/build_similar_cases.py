@@ -0,0 +1,53 @@
+"""
+Build or refresh the similar-case graph (storage/indexes/similar_cases.json + .npy arrays)
+
+Computes the top-k most similar cases of every case in the FAISS index with blocked
+matrix multiplication over the stored vectors. An existing graph is refreshed
+incrementally: only new or re-indexed cases (and cases that lost a neighbour) are
+recomputed. Run it nightly (cron / Task Scheduler); GET /api/ai/similar/{case_id}
+serves the arrays memory-mapped and picks up a new graph without a restart.
+
+Usage:
+    python build_similar_cases.py            # refresh (full build if no graph yet)
+    python build_similar_cases.py --full     # rebuild from scratch
+    python build_similar_cases.py --k 20     # neighbours per case (changing k rebuilds)
+"""
+import argparse
+import os
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from config import SIMILAR_CASES_K
+from utils.similar_cases import GRAPH_FILE, index_cases, read_similar_case_graph, refresh_similar_case_graph
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or refresh the similar-case graph")
+    parser.add_argument("--full", action="store_true", help="Rebuild every row instead of refreshing")
+    parser.add_argument("--k", type=int, default=SIMILAR_CASES_K, help="Neighbours per case")
+    args = parser.parse_args()
+
+    ids, vectors = index_cases()
+    if not ids:
+        print("❌ No FAISS index found (or it is empty). Build it with POST /index first.")
+        sys.exit(1)
+
+    previous = None if args.full else read_similar_case_graph()
+    started = time.perf_counter()
+    graph, computed = refresh_similar_case_graph(previous, ids, vectors, args.k)
+    build_ms = (time.perf_counter() - started) * 1000
+    directory = graph.save()
+
+    mode = "full build" if computed == len(graph) else f"refreshed {computed} of {len(graph)} rows"
+    print(f"📦 {len(graph)} cases x {graph.k} neighbours ({mode})")
+    size = sum(os.path.getsize(os.path.join(directory, fn)) for fn in os.listdir(directory))
+    print(f"✅ Wrote {directory} ({size / 1024:.0f} KB), pointed to by {GRAPH_FILE}")
+    print(f"⏱️  {build_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
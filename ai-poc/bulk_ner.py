@@ -0,0 +1,60 @@
+"""
+Re-run NER over every saved extraction
+
+Usage:
+    python bulk_ner.py                          # PII entities + redaction, like /ocr-extract
+    python bulk_ner.py --mode legal             # LegalNER entities, stored as "legalEntities"
+    python bulk_ner.py --batch-size 128 --n-process 4 --reindex
+"""
+import argparse
+import os
+import sys
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from config import NER_BATCH_SIZE, NER_N_PROCESS
+from utils.bulk_ner import MODES, run_bulk_ner
+
+DEFAULT_DIR = os.path.join(BASE_DIR, "storage", "output", "ai_extractions")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk NER over the extraction store")
+    parser.add_argument("--dir", default=DEFAULT_DIR, help="Directory of extraction JSONs")
+    parser.add_argument("--mode", choices=MODES, default="pii")
+    parser.add_argument("--batch-size", type=int, default=NER_BATCH_SIZE)
+    parser.add_argument("--n-process", type=int, default=NER_N_PROCESS)
+    parser.add_argument("--ids", nargs="*", help="Only these extraction ids")
+    parser.add_argument("--every", type=int, default=100, help="Print progress every N documents")
+    parser.add_argument("--reindex", action="store_true",
+                        help="Refresh the FAISS index for rewritten documents (pii mode changes redactedText)")
+    args = parser.parse_args()
+
+    def progress(done, elapsed):
+        if done % args.every == 0:
+            rate = done / elapsed if elapsed > 0 else 0.0
+            print(f"  {done} docs, {rate:.1f} docs/sec")
+
+    print(f"🔄 Running {args.mode} NER over {args.dir} "
+          f"(batch_size={args.batch_size}, n_process={args.n_process})")
+    stats = run_bulk_ner(
+        args.dir,
+        mode=args.mode,
+        batch_size=args.batch_size,
+        n_process=args.n_process,
+        extraction_ids=args.ids,
+        progress=progress,
+    )
+    print(f"✅ {stats['processed']} docs in {stats['elapsed_s']}s "
+          f"({stats['docs_per_sec']} docs/sec), {stats['failed']} failed")
+
+    if args.reindex and args.mode == "pii" and stats["ids"]:
+        from utils.faiss_index import upsert_documents
+        count = upsert_documents(args.dir, stats["ids"])
+        print(f"✅ Index refreshed ({count} documents)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Check that the sparse BM25 engine ranks sections exactly like rank_bm25.BM25Okapi
+
+Queries are built from the section database itself (titles, keywords, descriptions
+and random mixes of them). Scores must agree to floating point tolerance and the
+top-k rankings must be identical, treating scores within tolerance as ties (their
+order was never defined: the old full argsort is not stable).
+
+Usage:
+    python check_bm25_parity.py
+    python check_bm25_parity.py --queries 2000 --top-k 10
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+import numpy as np
+from rank_bm25 import BM25Okapi
+
+from utils.bm25_sparse import SparseBM25, top_k_indices
+from utils.section_index import get_section_index, section_text
+
+TOLERANCE = 1e-9
+
+
+def make_queries(sections, count, seed):
+    rng = random.Random(seed)
+    vocabulary = sorted({token for s in sections for token in section_text(s).lower().split()})
+    queries = [section_text(s).lower().split() for s in sections]
+    queries += [s.get("title", "").lower().split() for s in sections]
+    while len(queries) < count and vocabulary:
+        queries.append([rng.choice(vocabulary) for _ in range(rng.randint(1, 12))] + ["unknownword"])
+    return queries
+
+
+def same_ranking(reference_scores, ranking_a, ranking_b):
+    """Rankings match if each position holds the same doc or docs with tied scores"""
+    return all(
+        a == b or abs(reference_scores[a] - reference_scores[b]) <= TOLERANCE
+        for a, b in zip(ranking_a, ranking_b)
+    )
+
+
+def check(code, sections, args):
+    """True/False if the rankings of one code match, None if it has no sections"""
+    corpus = [section_text(s).lower().split() for s in sections]
+    if not corpus:
+        print(f"⚠️  No {code.upper()} sections found in data/, skipping")
+        return None
+    okapi = BM25Okapi(corpus)
+    sparse_bm25 = SparseBM25(corpus)
+    queries = make_queries(sections, args.queries, args.seed)
+
+    started = time.perf_counter()
+    expected = [okapi.get_scores(q) for q in queries]
+    okapi_s = time.perf_counter() - started
+    started = time.perf_counter()
+    actual = sparse_bm25.get_scores_batch(queries)
+    sparse_s = time.perf_counter() - started
+
+    failures = 0
+    for query, exp, act in zip(queries, expected, actual):
+        if not np.allclose(exp, act, rtol=0, atol=TOLERANCE):
+            failures += 1
+            continue
+        ref_ranking = np.argsort(-exp, kind="stable")[:args.top_k]
+        if not same_ranking(exp, ref_ranking, top_k_indices(act, args.top_k)):
+            failures += 1
+    print(f"{code.upper()}: {len(sections)} sections, {len(queries)} queries, {failures} mismatches "
+          f"(rank_bm25 {okapi_s * 1000:.1f} ms, sparse {sparse_s * 1000:.1f} ms)")
+    return failures == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sparse BM25 parity check")
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=13)
+    args = parser.parse_args()
+
+    index = get_section_index()
+    results = [check("ipc", index.ipc_sections, args), check("bns", index.bns_sections, args)]
+    results = [result for result in results if result is not None]
+    if not results:
+        print("❌ Nothing compared: no sections found in data/")
+        sys.exit(1)
+    if all(results):
+        print("✅ Rankings match")
+    else:
+        print("❌ Rankings differ")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Check that scan_legal_entities finds exactly what the old per-pattern passes found, and time both
+
+The reference runs every section, citation and court pattern on its own (findall /
+finditer, as LegalNER did before the combined scanner) and checks each legal term
+with a substring test. Texts are randomised mixes of section references, citations,
+court names, legal terms, overlapping constructs ("IPC 2004 AIR 12", "Delhi High
+Court", "first" containing "FIR") and noise, in random case.
+
+Usage:
+    python check_legal_scan_parity.py
+    python check_legal_scan_parity.py --texts 20000 --seed 7
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from collections import Counter
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from utils.legal_ner import (
+    BNS_PATTERN, CASE_CITATION_PATTERNS, COURT_PATTERNS, IPC_PATTERN, LEGAL_TERMS, SECTION_PATTERN,
+    scan_legal_entities
+)
+
+FRAGMENTS = [
+    "IPC 302", "ipc302", "IPC  420A", "BNS 103", "bns 64", "Section 34", "section 120B", "Sections 3",
+    "2004 AIR 12", "1999 SCC 45", "2010 Cri.LJ 7", "2010 CriLJ 7", "AIR 2004 SC 12", "AIR 2004 SCC 12",
+    "(2003) 5 SCC 100", "(2003) 5 SCR 1", "IPC 2004 AIR 12", "Section 1999 SCC 3",
+    "Supreme Court of India", "Supreme Court", "Delhi High Court", "High Court", "Sessions Court",
+    "Chief Judicial Magistrate", "CJM Court", "Magistrate Court",
+    "bail", "bailable", "first", "chargesheet", "charge sheet", "re-trial", "appeal", "warrant",
+    "the", "accused", "on", "12", "2021", "(", ")", ",", ".", "of", "India", "AIR", "SC", "court",
+]
+
+
+def random_case(rng, fragment):
+    mode = rng.random()
+    if mode < 0.2:
+        return fragment.upper()
+    if mode < 0.4:
+        return fragment.lower()
+    return fragment
+
+
+def make_texts(count, seed):
+    rng = random.Random(seed)
+    texts = []
+    for _ in range(count):
+        parts = [random_case(rng, rng.choice(FRAGMENTS)) for _ in range(rng.randint(1, 25))]
+        texts.append("".join(part + rng.choice([" ", "", "  ", "\n", ", "]) for part in parts))
+    return texts
+
+
+def reference_scan(text):
+    """The old per-pattern passes, as multisets of (type, text, value)"""
+    found = Counter()
+    for kind, pattern in (("ipc_section", IPC_PATTERN), ("bns_section", BNS_PATTERN), ("section", SECTION_PATTERN)):
+        for m in pattern.finditer(text):
+            found[(kind, m.group(0), m.group(1).strip())] += 1
+    for pattern in CASE_CITATION_PATTERNS:
+        for citation in pattern.findall(text):
+            found[("case_citation", citation, citation)] += 1
+    for court in COURT_PATTERNS:
+        for m in re.finditer(court, text, re.IGNORECASE):
+            found[("court_name", m.group(0), m.group(0))] += 1
+    terms = {term for term in LEGAL_TERMS if term.lower() in text.lower()}
+    return found, terms
+
+
+def scanned(text):
+    matches = scan_legal_entities(text)
+    found = Counter((m["type"], m["text"], m["value"]) for m in matches if m["type"] != "legal_term")
+    terms = {m["value"] for m in matches if m["type"] == "legal_term"}
+    return found, terms, matches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Legal entity scanner parity check")
+    parser.add_argument("--texts", type=int, default=5000, help="Number of random texts")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    texts = make_texts(args.texts, args.seed)
+    failures = 0
+    for text in texts:
+        expected_found, expected_terms = reference_scan(text)
+        found, terms, matches = scanned(text)
+        offsets_ok = all(text[m["start"]:m["end"]] == m["text"] for m in matches)
+        if found != expected_found or terms != expected_terms or not offsets_ok:
+            failures += 1
+            if failures <= 5:
+                print(f"❌ Mismatch for {text!r}")
+                print(f"   expected {sorted(expected_found.elements())} {sorted(expected_terms)}")
+                print(f"   scanned  {sorted(found.elements())} {sorted(terms)}")
+
+    document = " ".join(texts)[:500_000]
+    started = time.perf_counter()
+    reference_scan(document)
+    reference_ms = (time.perf_counter() - started) * 1000
+    started = time.perf_counter()
+    scan_legal_entities(document)
+    scan_ms = (time.perf_counter() - started) * 1000
+
+    print(f"{len(texts)} texts, {failures} mismatches")
+    print(f"⏱️  {len(document) // 1000} KB document: per-pattern {reference_ms:.1f} ms, scanner {scan_ms:.1f} ms")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
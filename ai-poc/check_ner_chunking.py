@@ -0,0 +1,100 @@
+"""
+Check that chunked NER reports exactly the entities of an unchunked run
+
+A stand-in pipeline tags every run of capitalised words as an entity, so a chunk
+boundary through a run yields a truncated entity, as spaCy would. Random texts are
+split into tiny chunks (at least 4x the overlap, so it is not shrunk; the defaults are
+50 000 characters with a 200 character overlap) and the entities from chunked_entities
+must equal those of the whole text: none lost, none duplicated, none truncated. Entities
+are kept shorter than the overlap, the length chunking guarantees.
+
+Usage:
+    python check_ner_chunking.py
+    python check_ner_chunking.py --texts 10000 --overlap 20
+"""
+import argparse
+import os
+import random
+import re
+import sys
+from typing import List, NamedTuple
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+if BASE_DIR not in sys.path:
+    sys.path.insert(0, BASE_DIR)
+
+from utils.ner_chunking import Entity, chunked_entities
+
+_NAME_RUN = re.compile(r"[A-Z][a-z]*(?: [A-Z][a-z]*)*")
+WORDS = ["the", "accused", "was", "seen", "near", "on", "and", "filed", "a", "complaint", "before"]
+NAMES = ["Ram", "Kumar", "Delhi", "Sita", "Devi", "Mumbai", "Singh", "Court"]
+
+
+class FakeDoc(NamedTuple):
+    ents: List[Entity]
+
+
+class FakeNLP:
+    """Just enough of a spaCy pipeline for chunked_entities"""
+    max_length = 1_000_000
+
+    def __call__(self, text: str) -> FakeDoc:
+        return FakeDoc([Entity(m.group(0), "PERSON", m.start(), m.end()) for m in _NAME_RUN.finditer(text)])
+
+    def pipe(self, items, as_tuples=False, batch_size=1, n_process=1):
+        for text, context in items:
+            yield self(text), context
+
+
+def name_run(rng: random.Random, max_chars: int) -> str:
+    names = [rng.choice(NAMES)]
+    while rng.random() < 0.7:
+        name = rng.choice(NAMES)
+        if len(" ".join(names)) + 1 + len(name) > max_chars:
+            break
+        names.append(name)
+    return " ".join(names)
+
+
+def make_text(rng: random.Random, max_entity_chars: int) -> str:
+    """Words and name runs (always followed by a word), with sentence and paragraph breaks"""
+    parts = []
+    for _ in range(rng.randint(5, 200)):
+        if rng.random() < 0.5:
+            parts.append(name_run(rng, max_entity_chars))
+            parts.append(" ")
+        parts.append(rng.choice(WORDS))
+        parts.append(rng.choice([" ", " ", " ", ". ", "\n", "\n\n"]))
+    return "".join(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Chunked NER parity check")
+    parser.add_argument("--texts", type=int, default=3000, help="Number of random texts")
+    parser.add_argument("--overlap", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    nlp = FakeNLP()
+    failures = 0
+    for _ in range(args.texts):
+        # the next chunk starts after the first whitespace past `cut - overlap`, up to a word
+        # and a space later, and an entity touching both ends of that overlap may be cut off
+        text = make_text(rng, args.overlap - max(len(word) for word in WORDS) - 3)
+        max_chars = rng.randint(4 * args.overlap, 12 * args.overlap)
+        expected = list(nlp(text).ents)
+        found = sorted(chunked_entities(nlp, text, max_chars, args.overlap), key=lambda ent: ent.start_char)
+        if found != expected:
+            failures += 1
+            if failures <= 5:
+                print(f"❌ Mismatch (max_chars {max_chars}) for {text!r}")
+                print(f"   missing {sorted(set(expected) - set(found))}")
+                print(f"   extra   {sorted(set(found) - set(expected))}")
+
+    print(f"{args.texts} texts, {failures} mismatches")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,76 @@
 # Placeholder config - implementation removed per user request
+import os
+
 AI_SERVICE_HOST = "0.0.0.0"
 AI_SERVICE_PORT = 8001
 MODEL_NAME = "google/flan-t5-small"
 INDEX_PATH = "storage/indexes/faiss.index"
 STORAGE_DIR = "storage"
 
+# Upload handling: bodies are copied to disk in chunks instead of read whole
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", 1024 * 1024))
+UPLOAD_SPOOL_MAX_MEMORY = int(os.getenv("UPLOAD_SPOOL_MAX_MEMORY", 8 * 1024 * 1024))
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", 250 * 1024 * 1024))
+
+# OCR backend: "pytesseract" (subprocess per call) or "tesserocr" (pooled in-process handles)
+OCR_ENGINE = os.getenv("OCR_ENGINE", "pytesseract")
+# tesserocr: initialised handles kept per worker thread (least recently used one is released)
+TESSEROCR_HANDLES_PER_THREAD = int(os.getenv("TESSEROCR_HANDLES_PER_THREAD", 4))
+
+# Tiled OCR for oversized scans (A3/legal pages, stitched multi-page images)
+OCR_TILE_MIN_PIXELS = int(os.getenv("OCR_TILE_MIN_PIXELS", 10_000_000))
+OCR_TILE_TARGET_PIXELS = int(os.getenv("OCR_TILE_TARGET_PIXELS", 2_000_000))
+OCR_TILE_WORKERS = int(os.getenv("OCR_TILE_WORKERS", 0))  # 0 = one per CPU core
+
+# Batch OCR ingestion (/ocr-extract/batch)
+OCR_BATCH_WORKERS = int(os.getenv("OCR_BATCH_WORKERS", 0))  # 0 = one per CPU core
+OCR_BATCH_MAX_FILES = int(os.getenv("OCR_BATCH_MAX_FILES", 1000))
+OCR_BATCH_MAX_EXTRACTED_BYTES = int(os.getenv("OCR_BATCH_MAX_EXTRACTED_BYTES", 2 * 1024 * 1024 * 1024))  # all zip members of a batch
+
+# spaCy NER: model used by utils/ner, and models loaded at startup (comma separated, empty = lazy)
+NER_MODEL = os.getenv("NER_MODEL", "en_core_web_sm")
+NER_PRELOAD_MODELS = [m for m in os.getenv("NER_PRELOAD_MODELS", NER_MODEL).split(",") if m.strip()]
+
+# Bulk NER (bulk_ner.py / utils/bulk_ner.py): texts per nlp.pipe batch and worker processes
+NER_BATCH_SIZE = int(os.getenv("NER_BATCH_SIZE", 64))
+NER_N_PROCESS = int(os.getenv("NER_N_PROCESS", 1))
+
+# Long documents: LegalNER runs spaCy over overlapping chunks of at most this many characters
+NER_CHUNK_CHARS = int(os.getenv("NER_CHUNK_CHARS", 50_000))
+NER_CHUNK_OVERLAP = int(os.getenv("NER_CHUNK_OVERLAP", 200))
+# Chunk worker processes: 1 parses in the request thread; more (0 = one per CPU core) forks a spaCy
+# pool per document, which only pays off for offline jobs on very long texts
+NER_CHUNK_WORKERS = int(os.getenv("NER_CHUNK_WORKERS", 1))
+
+# LegalNER model tiers: the accurate (transformer) tier is used only when its predicted
+# latency fits the budget; bulk, oversized or over-budget texts use the fast tier.
+# Throughputs are starting estimates (chars/sec on CPU), refined from measured calls.
+NER_ACCURATE_MODEL = os.getenv("NER_ACCURATE_MODEL", "en_core_web_trf")
+NER_FAST_MODEL = os.getenv("NER_FAST_MODEL", NER_MODEL)
+NER_LATENCY_BUDGET_MS = int(os.getenv("NER_LATENCY_BUDGET_MS", 1000))
+NER_ACCURATE_CHARS_PER_SEC = float(os.getenv("NER_ACCURATE_CHARS_PER_SEC", 4000))
+NER_FAST_CHARS_PER_SEC = float(os.getenv("NER_FAST_CHARS_PER_SEC", 100000))
+
+# Dense section retrieval: suggestion score = BM25 + weight * max(cosine - min_similarity, 0)
+# Off by default (weight 0): enabling it changes rankings and confidences and adds an encoder
+# pass per description, batch requests included (10.0 is a reasonable starting weight)
+SECTION_DENSE_WEIGHT = float(os.getenv("SECTION_DENSE_WEIGHT", 0.0))
+SECTION_DENSE_MIN_SIMILARITY = float(os.getenv("SECTION_DENSE_MIN_SIMILARITY", 0.3))
+
+# Hot reload: seconds between checks of the section/synonym data files (0 = no watcher,
+# reload only via POST /api/ai/reload-data)
+DATA_RELOAD_INTERVAL = float(os.getenv("DATA_RELOAD_INTERVAL", 5))
+
+# Legal catalog (sections-list / section-details): seconds clients may reuse a response
+# before revalidating with If-None-Match
+CATALOG_CACHE_MAX_AGE = int(os.getenv("CATALOG_CACHE_MAX_AGE", 300))
+
+# Precedent search: minimum cosine similarity of a similar case, and cached query embeddings
+PRECEDENT_MIN_SIMILARITY = float(os.getenv("PRECEDENT_MIN_SIMILARITY", 0.35))
+QUERY_EMBEDDING_CACHE_SIZE = int(os.getenv("QUERY_EMBEDDING_CACHE_SIZE", 1024))
+
+# Similar-case graph (build_similar_cases.py): neighbours per case, rows per matrix-multiply block,
+# and seconds between checks for a newly built graph
+SIMILAR_CASES_K = int(os.getenv("SIMILAR_CASES_K", 10))
+SIMILAR_CASES_BLOCK_SIZE = int(os.getenv("SIMILAR_CASES_BLOCK_SIZE", 1024))
+SIMILAR_CASES_RELOAD_INTERVAL = float(os.getenv("SIMILAR_CASES_RELOAD_INTERVAL", 30))
@@ -1,10 +1,15 @@
-from fastapi import FastAPI, UploadFile, File, Form
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, UploadFile, File, Form, Header
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+import asyncio
 import uuid
 import os
 import sys
 import json
+import zipfile
 from datetime import datetime
 
 # Ensure project root (ai-poc) is on sys.path so utils imports work when running via uvicorn
@@ -12,8 +17,16 @@ BASE_DIR = os.path.dirname(__file__)
 if BASE_DIR not in sys.path:
     sys.path.insert(0, BASE_DIR)
 
-from utils.ocr import image_to_text
+from utils.extractors import extract_document
 from utils.ner import extract_entities
+from utils.uploads import save_upload, spool_upload, copy_stream, UploadTooLargeError, BatchLimitError
+from utils.nlp_models import preload_ner_pipelines
+from utils.data_reload import get_data_reloader, reload_data
+from utils.legal_catalog import etag_matches, get_legal_catalog
+from config import (
+    OCR_BATCH_WORKERS, OCR_BATCH_MAX_FILES, OCR_BATCH_MAX_EXTRACTED_BYTES, UPLOAD_MAX_BYTES,
+    NER_PRELOAD_MODELS, CATALOG_CACHE_MAX_AGE
+)
 
 app = FastAPI(title="ai-poc")
 
@@ -37,6 +50,36 @@ os.makedirs(EXTRACTIONS_JSON_DIR, exist_ok=True)
 os.makedirs(AI_DOCUMENTS_DIR, exist_ok=True)
 
 
+@app.on_event("startup")
+def preload_models():
+    """Load spaCy pipelines once at startup instead of on the first request"""
+    preload_ner_pipelines(NER_PRELOAD_MODELS)
+
+
+@app.on_event("startup")
+def build_legal_catalog():
+    """Serialise the sections-list/section-details responses once"""
+    get_legal_catalog()
+
+
+@app.on_event("startup")
+def start_data_watcher():
+    """Hot-reload the section databases and synonyms when their files change"""
+    get_data_reloader().start()
+
+
+@app.on_event("shutdown")
+def stop_data_watcher():
+    get_data_reloader().stop()
+
+
+@app.on_event("shutdown")
+def close_ocr_handles():
+    """Release pooled in-process OCR handles once requests have drained"""
+    from utils.ocr_engine import close_ocr_engines
+    close_ocr_engines()
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint with service status"""
@@ -77,43 +120,207 @@ async def health_check():
     return JSONResponse(health, status_code=200 if health["success"] else 503)
 
 
+def _run_extraction(source_path: str, filename: str, file_id: str, case_id: str = None) -> dict:
+    """OCR + NER + redaction for an upload already saved under EXTRACTS_DIR; persists and returns the extraction."""
+    # OCR (format sniffed from magic bytes, handled by a single extractor)
+    ocr_result = extract_document(source_path)
+    text = ocr_result["text"]
+
+    # NER + redaction
+    ner_result = extract_entities(text)
+
+    extraction = {
+        "id": file_id,
+        "caseId": case_id,
+        "sourceFile": filename,
+        "extractedText": text,
+        "redactedText": ner_result.get("redactedText", ""),
+        "entities": ner_result.get("entities", {}),
+        "confidence": ner_result.get("confidence", 0.0),
+        "ocr": {
+            "format": ocr_result["format"],
+            "extractor": ocr_result["extractor"],
+            "pages": ocr_result.get("pages"),
+            "elapsedMs": ocr_result["elapsed_ms"],
+        },
+        "createdAt": datetime.utcnow().isoformat() + "Z",
+    }
+
+    out_json_path = os.path.join(EXTRACTIONS_JSON_DIR, f"{file_id}.json")
+    with open(out_json_path, "w", encoding="utf-8") as jf:
+        json.dump(extraction, jf, ensure_ascii=False, indent=2)
+    return extraction
+
+
 @app.post("/ocr-extract")
 async def ocr_extract(file: UploadFile = File(...), caseId: str = Form(None)):
     """Accepts a file, saves it, runs OCR + NER, redacts PII, and saves JSON output."""
     try:
-        content = await file.read()
         file_id = str(uuid.uuid4())
         filename = f"{file_id}-{file.filename}"
         out_path = os.path.join(EXTRACTS_DIR, filename)
 
-        with open(out_path, "wb") as f:
-            f.write(content)
+        # Stream the upload to disk in chunks; OCR reads it back from the saved file
+        await save_upload(file, out_path)
 
-        # OCR
-        text = image_to_text(content)
+        extraction = _run_extraction(out_path, filename, file_id, caseId)
 
-        # NER + redaction
-        ner_result = extract_entities(text)
+        return JSONResponse({"success": True, "data": {"extractionId": file_id, "entities": extraction["entities"]}})
+    except UploadTooLargeError as e:
+        return JSONResponse({"success": False, "error": str(e)}, status_code=413)
+    except Exception as e:
+        return JSONResponse({"success": False, "error": str(e)}, status_code=500)
 
-        extraction = {
-            "id": file_id,
-            "caseId": caseId,
-            "sourceFile": filename,
-            "extractedText": text,
-            "redactedText": ner_result.get("redactedText", ""),
-            "entities": ner_result.get("entities", {}),
-            "confidence": ner_result.get("confidence", 0.0),
-            "createdAt": datetime.utcnow().isoformat() + "Z",
-        }
 
-        out_json_path = os.path.join(EXTRACTIONS_JSON_DIR, f"{file_id}.json")
-        with open(out_json_path, "w", encoding="utf-8") as jf:
-            json.dump(extraction, jf, ensure_ascii=False, indent=2)
+_batch_executor = None
 
-        return JSONResponse({"success": True, "data": {"extractionId": file_id, "entities": extraction["entities"]}})
+
+def _get_batch_executor() -> ThreadPoolExecutor:
+    global _batch_executor
+    if _batch_executor is None:
+        workers = OCR_BATCH_WORKERS or os.cpu_count() or 1
+        _batch_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ocr-batch")
+    return _batch_executor
+
+
+_ZIP_CONTENT_TYPES = ("application/zip", "application/x-zip-compressed")
+
+
+def _discard_staged(jobs: list):
+    """Delete staged batch files that will not be processed"""
+    for job in jobs:
+        try:
+            os.remove(job["path"])
+        except OSError:
+            pass
+
+
+def _expand_archive(archive_path: str, max_files: int, max_bytes: int) -> list:
+    """
+    Unpack every regular file in a zip archive into EXTRACTS_DIR, then delete the archive.
+
+    The member count and the declared uncompressed sizes are checked against
+    max_files / max_bytes before anything is written, and each member is cut
+    off at its declared size while copying. Nothing is left on disk on failure.
+    """
+    jobs = []
+    try:
+        with zipfile.ZipFile(archive_path) as zf:
+            members = [
+                info for info in zf.infolist()
+                if not info.is_dir() and os.path.basename(info.filename)
+                and not info.filename.startswith("__MACOSX/") and info.file_size > 0
+            ]
+            if len(members) > max_files:
+                raise BatchLimitError(f"Batch exceeds {OCR_BATCH_MAX_FILES} files")
+            if sum(info.file_size for info in members) > max_bytes:
+                raise BatchLimitError(f"Zip archives in the batch exceed {OCR_BATCH_MAX_EXTRACTED_BYTES} bytes uncompressed")
+            if any(info.file_size > UPLOAD_MAX_BYTES for info in members):
+                raise UploadTooLargeError(UPLOAD_MAX_BYTES)
+            for info in members:
+                file_id = str(uuid.uuid4())
+                filename = f"{file_id}-{os.path.basename(info.filename)}"
+                path = os.path.join(EXTRACTS_DIR, filename)
+                jobs.append({"file": info.filename, "fileId": file_id, "filename": filename, "path": path,
+                             "size": info.file_size})
+                with zf.open(info) as src, open(path, "wb") as dst:
+                    copy_stream(src, dst, max_bytes=info.file_size)
+    except Exception:
+        _discard_staged(jobs)
+        raise
+    finally:
+        os.remove(archive_path)
+    return jobs
+
+
+def _is_zip_upload(upload: UploadFile) -> bool:
+    """Zip archives by name or content type (DOCX/XLSX/ODT are zip containers too and stay documents)"""
+    return (upload.filename or "").lower().endswith(".zip") or upload.content_type in _ZIP_CONTENT_TYPES
+
+
+async def _stage_batch_upload(upload: UploadFile, max_files: int, max_bytes: int) -> list:
+    """Save one batch upload to disk; zip archives are expanded into one job per member."""
+    file_id = str(uuid.uuid4())
+    filename = f"{file_id}-{upload.filename}"
+    path = os.path.join(EXTRACTS_DIR, filename)
+    await save_upload(upload, path)
+    if _is_zip_upload(upload):
+        return await run_in_threadpool(_expand_archive, path, max_files, max_bytes)
+    return [{"file": upload.filename, "fileId": file_id, "filename": filename, "path": path, "size": 0}]
+
+
+async def _stream_batch(jobs: list, case_id: str):
+    """Run the OCR -> NER -> persist pipeline over all jobs in parallel, yielding NDJSON progress lines."""
+    loop = asyncio.get_running_loop()
+    executor = _get_batch_executor()
+
+    async def run(job):
+        try:
+            extraction = await loop.run_in_executor(
+                executor, _run_extraction, job["path"], job["filename"], job["fileId"], case_id
+            )
+            return {"type": "file", "file": job["file"], "status": "done",
+                    "extractionId": job["fileId"], "entities": extraction["entities"]}
+        except Exception as e:
+            return {"type": "file", "file": job["file"], "status": "error", "error": str(e)}
+
+    indexed_ids = []
+    completed = 0
+    for next_done in asyncio.as_completed([run(job) for job in jobs]):
+        line = await next_done
+        completed += 1
+        line.update({"completed": completed, "total": len(jobs)})
+        if line["status"] == "done":
+            indexed_ids.append(line["extractionId"])
+        yield json.dumps(line, ensure_ascii=False) + "\n"
+
+    # One incremental index update for the whole batch instead of a rebuild per document
+    index_line = {"type": "index", "success": True, "indexed": 0}
+    if indexed_ids:
+        try:
+            from utils.faiss_index import upsert_documents
+            index_line["indexed"] = await run_in_threadpool(upsert_documents, EXTRACTIONS_JSON_DIR, indexed_ids)
+        except Exception as e:
+            index_line = {"type": "index", "success": False, "error": str(e)}
+    yield json.dumps(index_line) + "\n"
+
+    yield json.dumps({
+        "type": "summary",
+        "total": len(jobs),
+        "succeeded": len(indexed_ids),
+        "failed": len(jobs) - len(indexed_ids),
+    }) + "\n"
+
+
+@app.post("/ocr-extract/batch")
+async def ocr_extract_batch(files: List[UploadFile] = File(...), caseId: str = Form(None)):
+    """Bulk ingestion for backlog digitisation: accepts many files and/or zip archives,
+    streams one NDJSON line per processed file, then updates the search index once."""
+    try:
+        # Uploads are staged to disk before streaming starts; the form is closed once the handler returns
+        jobs = []
+        try:
+            for upload in files:
+                if len(jobs) >= OCR_BATCH_MAX_FILES:
+                    raise BatchLimitError(f"Batch exceeds {OCR_BATCH_MAX_FILES} files")
+                extracted = sum(job["size"] for job in jobs)
+                jobs.extend(await _stage_batch_upload(
+                    upload, OCR_BATCH_MAX_FILES - len(jobs), OCR_BATCH_MAX_EXTRACTED_BYTES - extracted
+                ))
+        except Exception:
+            _discard_staged(jobs)
+            raise
+        if not jobs:
+            return JSONResponse({"success": False, "error": "No files to process"}, status_code=400)
+    except (UploadTooLargeError, BatchLimitError) as e:
+        return JSONResponse({"success": False, "error": str(e)}, status_code=413)
+    except zipfile.BadZipFile as e:
+        return JSONResponse({"success": False, "error": f"Invalid zip archive: {e}"}, status_code=400)
     except Exception as e:
         return JSONResponse({"success": False, "error": str(e)}, status_code=500)
 
+    return StreamingResponse(_stream_batch(jobs, caseId), media_type="application/x-ndjson")
+
 
 @app.get("/extractions/{extraction_id}")
 async def get_extraction(extraction_id: str):
@@ -194,15 +401,14 @@ async def rebuild_index():
 
 @app.post('/index/doc/{extraction_id}')
 async def index_single_document(extraction_id: str):
-    """Index a single extraction document by id. For now, this triggers a full rebuild but is exposed for future incremental upserts."""
+    """Index a single extraction document by id, embedding only that document."""
     try:
         # verify file exists
         path = os.path.join(EXTRACTIONS_JSON_DIR, f"{extraction_id}.json")
         if not os.path.exists(path):
             return JSONResponse({"success": False, "error": "Extraction not found"}, status_code=404)
-        # For now reuse bulk builder (simple and reliable)
-        from utils.faiss_index import build_index
-        n = build_index(EXTRACTIONS_JSON_DIR)
+        from utils.faiss_index import upsert_documents
+        n = upsert_documents(EXTRACTIONS_JSON_DIR, [extraction_id])
         return JSONResponse({"success": True, "indexed": n, "indexedId": extraction_id})
     except Exception as e:
         return JSONResponse({"success": False, "error": str(e)}, status_code=500)
@@ -290,19 +496,66 @@ async def enhanced_multilingual_ocr(file: UploadFile = File(...), language: str
     """Multilingual OCR with 11+ language support"""
     try:
         from utils.multilingual_ocr import extract_text_multilingual
-        content = await file.read()
-        result = extract_text_multilingual(content, language, auto_detect)
+        spooled = await spool_upload(file)
+        try:
+            result = extract_text_multilingual(spooled, language, auto_detect)
+        finally:
+            spooled.close()
         return JSONResponse({"success": True, "data": result})
+    except UploadTooLargeError as e:
+        return JSONResponse({"success": False, "error": str(e)}, status_code=413)
     except Exception as e:
         return JSONResponse({"success": False, "error": str(e)}, status_code=500)
 
 
+def _sse(event: str, data: dict) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@app.post("/api/ai/multilingual-ocr/stream")
+async def enhanced_multilingual_ocr_stream(file: UploadFile = File(...), language: str = Form(None), auto_detect: bool = Form(True)):
+    """Multilingual OCR streamed as Server-Sent Events: one 'page' event per page as soon as it is read, then 'done'"""
+    try:
+        from utils.multilingual_ocr import get_multilingual_ocr
+        spooled = await spool_upload(file)
+    except UploadTooLargeError as e:
+        return JSONResponse({"success": False, "error": str(e)}, status_code=413)
+    except Exception as e:
+        return JSONResponse({"success": False, "error": str(e)}, status_code=500)
+
+    def events():
+        # Sync generator: Starlette iterates it in a worker thread, so OCR never blocks the event loop
+        pages = 0
+        confidences = []
+        try:
+            for page in get_multilingual_ocr().iter_pages(spooled, language, auto_detect):
+                pages += 1
+                if "error" not in page:
+                    confidences.append(page.get("confidence", 0))
+                yield _sse("page", page)
+            yield _sse("done", {
+                "pages": pages,
+                "confidence": round(sum(confidences) / len(confidences), 2) if confidences else 0,
+            })
+        except Exception as e:
+            yield _sse("error", {"error": str(e)})
+        finally:
+            spooled.close()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.post("/api/ai/legal-ner")
-async def enhanced_legal_ner(text: str = Form(...)):
-    """Enhanced Named Entity Recognition for legal texts"""
+async def enhanced_legal_ner(text: str = Form(...), latency_budget_ms: int = Form(None)):
+    """Enhanced Named Entity Recognition for legal texts (latency_budget_ms picks the model tier)"""
     try:
         from utils.legal_ner import extract_legal_entities
-        result = extract_legal_entities(text)
+        result = extract_legal_entities(text, latency_budget_ms)
         return JSONResponse({"success": True, "data": result})
     except Exception as e:
         return JSONResponse({"success": False, "error": str(e)}, status_code=500)
@@ -319,6 +572,33 @@ async def enhanced_suggest_sections(case_description: str = Form(...), top_k: in
         return JSONResponse({"success": False, "error": str(e)}, status_code=500)
 
 
+@app.post("/api/ai/suggest-sections/batch")
+async def enhanced_suggest_sections_batch(case_descriptions: str = Form(...), top_k: int = Form(5), code_type: str = Form('both')):
+    """Suggest IPC/BNS sections for many case descriptions (a JSON array of strings); results keep input order"""
+    try:
+        descriptions = json.loads(case_descriptions)
+        if not isinstance(descriptions, list) or not all(isinstance(d, str) for d in descriptions):
+            raise ValueError("case_descriptions must be a JSON array of strings")
+    except ValueError as e:
+        return JSONResponse({"success": False, "error": str(e)}, status_code=400)
+    try:
+        from utils.section_suggester import suggest_sections_batch
+        results = await run_in_threadpool(suggest_sections_batch, descriptions, top_k, code_type)
+        return JSONResponse({"success": True, "data": {"results": results, "count": len(results)}})
+    except Exception as e:
+        return JSONResponse({"success": False, "error": str(e)}, status_code=500)
+
+
+@app.post("/api/ai/reload-data")
+async def enhanced_reload_data(force: bool = Form(False)):
+    """Reload changed section/synonym data files now (force reloads all); requests in flight keep the old data"""
+    try:
+        reloaded = await run_in_threadpool(reload_data, force)
+        return JSONResponse({"success": True, "data": {"reloaded": reloaded}})
+    except Exception as e:
+        return JSONResponse({"success": False, "error": str(e)}, status_code=500)
+
+
 @app.post("/api/ai/find-precedents")
 async def enhanced_find_precedents(query: str = Form(...), top_k: int = Form(5), section: str = Form(None)):
     """Find similar precedent cases using semantic search"""
@@ -404,15 +684,19 @@ async def enhanced_case_brief(caseId: str = Form(...), caseNumber: str = Form(..
 
 
 @app.get("/api/ai/stats")
-async def enhanced_stats():
-    """Get AI service statistics"""
+async def enhanced_stats(section: str = None, court: str = None, year: str = None):
+    """Get AI service statistics, with indexed-case facet counts (optionally for cases matching section/court/year)"""
     try:
-        from utils.faiss_index import index_exists
+        from utils.faiss_index import index_exists, load_facets
+        ready = index_exists()
+        facets = load_facets() if ready else None
+        filters = {k: v for k, v in (("section", section), ("court", court), ("year", year)) if v}
         return JSONResponse({"success": True, "data": {
-            "index_ready": index_exists(),
+            "index_ready": ready,
             "service": "ai-poc",
             "version": "1.0",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.utcnow().isoformat(),
+            "facets": facets.stats(filters) if facets is not None else None
         }})
     except Exception as e:
         return JSONResponse({"success": False, "error": str(e)}, status_code=500)
@@ -430,135 +714,29 @@ async def enhanced_templates():
     }})
 
 
+def _catalog_response(entry, if_none_match: str = None) -> Response:
+    """Precomputed catalog body with ETag/Cache-Control, or 304 if the client's copy is current"""
+    headers = {"ETag": entry.etag, "Cache-Control": f"public, max-age={CATALOG_CACHE_MAX_AGE}"}
+    if etag_matches(if_none_match, entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
 @app.get("/api/ai/section-details/{section_id}")
-async def enhanced_section_details(section_id: str, code_type: str = "ipc"):
+async def enhanced_section_details(section_id: str, code_type: str = "ipc", if_none_match: str = Header(None)):
     """Get detailed information about a legal section"""
-    # Comprehensive section details database - synced with sections-list
-    sections_db = {
-        "ipc": {
-            # Offences Against Life
-            "302": {"title": "Murder", "description": "Whoever commits murder shall be punished with death or life imprisonment and shall also be liable to fine.", "punishment": "Death or life imprisonment, and fine", "bailable": False, "cognizable": True, "category": "Offences Against Life"},
-            "304": {"title": "Culpable Homicide Not Amounting to Murder", "description": "When a person is killed by any act which does not amount to culpable homicide punishable with death or life imprisonment.", "punishment": "Imprisonment up to 2 years, or fine up to 1000 rupees, or both", "bailable": True, "cognizable": True, "category": "Offences Against Life"},
-            "305": {"title": "Abetment of Suicide of Child or Person of Unsound Mind", "description": "Abetment of suicide of a child or person of unsound mind or intoxicated person.", "punishment": "Death or life imprisonment and fine up to 10,000 rupees", "bailable": False, "cognizable": True, "category": "Offences Against Life"},
-            "306": {"title": "Abetment of Suicide", "description": "Whoever abets the commission of suicide by any person is guilty of abetment of suicide.", "punishment": "Imprisonment up to 10 years and fine up to 1000 rupees", "bailable": False, "cognizable": True, "category": "Offences Against Life"},
-            "307": {"title": "Attempt to Murder", "description": "When an act is done with intent or knowledge that if it caused death that person would be guilty of murder.", "punishment": "Imprisonment up to 10 years and fine up to 1000 rupees", "bailable": False, "cognizable": True, "category": "Offences Against Life"},
-            "308": {"title": "Attempt to Commit Culpable Homicide", "description": "Attempt to commit an act which, if by that act death were caused, would amount to culpable homicide but not to murder.", "punishment": "Imprisonment up to 3 years, or fine up to 500 rupees, or both", "bailable": True, "cognizable": True, "category": "Offences Against Life"},
-            # Offences Against Body
-            "321": {"title": "Voluntarily Causing Hurt", "description": "Whoever does any act with the intention of thereby causing hurt to any person, or with the knowledge that he is likely thereby to cause hurt to any person.", "punishment": "Imprisonment up to 1 year or fine up to 1000 rupees or both", "bailable": True, "cognizable": False, "category": "Offences Against Body"},
-            "323": {"title": "Causing Hurt", "description": "Whoever, by doing any act, causes hurt to any person, intending to do so or knowing that he is likely thereby to cause hurt, shall be punished.", "punishment": "Imprisonment up to 3 months, or fine up to 250 rupees, or both", "bailable": True, "cognizable": False, "category": "Offences Against Body"},
-            "325": {"title": "Voluntarily Causing Grievous Hurt", "description": "Whoever, by doing any act, causes hurt to any person intending to cause grievous hurt, or knowing it to be likely that his act will cause grievous hurt.", "punishment": "Imprisonment up to 7 years and fine up to 1000 rupees", "bailable": False, "cognizable": True, "category": "Offences Against Body"},
-            "326": {"title": "Causing Hurt by Poison, Fire, or Explosion", "description": "Whoever causes hurt to any person by administering poison, fire, or explosion, or by any other means.", "punishment": "Life imprisonment or up to 15 years imprisonment or fine", "bailable": False, "cognizable": True, "category": "Offences Against Body"},
-            "328": {"title": "Causing Hurt by Means of Poison", "description": "Whoever administers to or causes to be taken by any person any poison or any stupefying, intoxicating or unwholesome drug.", "punishment": "Imprisonment up to 10 years and fine", "bailable": False, "cognizable": True, "category": "Offences Against Body"},
-            "330": {"title": "Voluntarily Causing Hurt to Extort Confession", "description": "Whoever voluntarily causes hurt for the purpose of extorting any confession or information.", "punishment": "Imprisonment up to 7 years and fine", "bailable": False, "cognizable": True, "category": "Offences Against Body"},
-            # Offences Against Women
-            "354": {"title": "Assault or Criminal Force to Woman with Intent to Outrage Modesty", "description": "Any man who assaults or uses criminal force to any woman, intending to outrage or knowing it likely to outrage her modesty.", "punishment": "Imprisonment up to 3 years or fine up to 2000 rupees or both", "bailable": True, "cognizable": True, "category": "Offences Against Women"},
-            "355": {"title": "Assault or Criminal Force with Intent to Dishonor Person", "description": "Whoever assaults or uses criminal force to any person, intending thereby to dishonor that person.", "punishment": "Imprisonment up to 2 years or fine or both", "bailable": True, "cognizable": True, "category": "Offences Against Women"},
-            "372": {"title": "Selling Minor for Purposes of Prostitution", "description": "Whoever sells, lets to hire, or otherwise disposes of any person under the age of eighteen years with intent that such person shall be employed or used for prostitution.", "punishment": "Imprisonment up to 10 years and fine", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-            "373": {"title": "Buying Minor for Purposes of Prostitution", "description": "Whoever buys, hires or otherwise obtains possession of any person under the age of eighteen years with intent that such person shall be employed or used for prostitution.", "punishment": "Imprisonment up to 10 years and fine", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-            "374": {"title": "Unlawful Compulsory Labour", "description": "Whoever unlawfully compels any person to labour against the will of that person.", "punishment": "Imprisonment up to 1 year or fine or both", "bailable": True, "cognizable": True, "category": "Offences Against Women"},
-            "375": {"title": "Rape - Definition", "description": "A man is said to commit rape if he has sexual intercourse with a woman under circumstances falling under any of the seven descriptions.", "punishment": "N/A - Definitional Section", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-            "376": {"title": "Punishment for Rape", "description": "A man is said to commit rape if he has sexual intercourse with a woman against her will, without her consent, by putting her in fear or by fraud.", "punishment": "Rigorous imprisonment for a term which shall not be less than 10 years but may extend to life imprisonment, and shall also be liable to fine", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-            # Offences Against Property
-            "378": {"title": "Theft", "description": "Whoever, intending to take dishonestly any movable property out of the possession of any person without that person's consent, moves that property.", "punishment": "Imprisonment up to 3 years or fine or both", "bailable": True, "cognizable": True, "category": "Offences Against Property"},
-            "379": {"title": "Punishment for Theft", "description": "Whoever commits theft shall be punished with imprisonment of either description for a term which may extend to three years, or with fine, or with both.", "punishment": "Imprisonment up to 3 years or fine or both", "bailable": True, "cognizable": True, "category": "Offences Against Property"},
-            "380": {"title": "Theft in Dwelling House", "description": "Whoever commits theft in any building, tent or vessel used as a human dwelling.", "punishment": "Imprisonment up to 7 years and fine", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-            "381": {"title": "Theft by Clerk or Servant", "description": "Whoever, being a clerk or servant, commits theft in respect of any property in the possession of his master or employer.", "punishment": "Imprisonment up to 7 years and fine", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-            "390": {"title": "Dacoity", "description": "When five or more persons commit or attempt to commit a robbery, it is designated dacoity.", "punishment": "Imprisonment up to 10 years and fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-            "392": {"title": "Punishment for Robbery", "description": "Whoever commits robbery shall be punished with rigorous imprisonment for a term which may extend to ten years, and shall also be liable to fine.", "punishment": "Rigorous imprisonment up to 10 years and fine", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-            "406": {"title": "Criminal Breach of Trust", "description": "Whoever, being in any manner entrusted with property, dishonestly misappropriates or converts to his own use that property.", "punishment": "Imprisonment up to 3 years or fine or both", "bailable": True, "cognizable": False, "category": "Offences Against Property"},
-            "409": {"title": "Criminal Breach of Trust by Public Servant", "description": "Whoever, being a public servant, or being a banker, merchant or agent, commits criminal breach of trust.", "punishment": "Imprisonment for life or up to 10 years and fine", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-            "420": {"title": "Cheating and Dishonestly Inducing Delivery of Property", "description": "Whoever cheats and thereby dishonestly induces any person to deliver any property to any person.", "punishment": "Imprisonment up to 7 years and fine up to 1000 rupees", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-            "425": {"title": "Mischief", "description": "Whoever with intent to cause, or knowing that he is likely to cause, wrongful loss or damage to the public or to any person.", "punishment": "Imprisonment up to 3 months or fine or both", "bailable": True, "cognizable": False, "category": "Offences Against Property"},
-            "427": {"title": "Mischief Causing Damage", "description": "Whoever commits mischief and thereby causes loss or damage to the amount of fifty rupees or upwards.", "punishment": "Imprisonment up to 2 years or fine or both", "bailable": True, "cognizable": False, "category": "Offences Against Property"},
-            "435": {"title": "Mischief by Fire or Explosive Substance", "description": "Whoever commits mischief by fire or any explosive substance intending to cause damage.", "punishment": "Imprisonment up to 7 years and fine", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-            "450": {"title": "House-Trespass", "description": "Whoever commits house-trespass in order to the committing of any offence punishable with imprisonment.", "punishment": "Imprisonment up to 2 years and fine", "bailable": True, "cognizable": True, "category": "Offences Against Property"},
-            "456": {"title": "House-Trespass by Night", "description": "Whoever commits house-trespass, having made preparation for causing hurt to any person.", "punishment": "Imprisonment up to 5 years and fine", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-            # Offences Against Public Order
-            "143": {"title": "Unlawful Assembly", "description": "An assembly of five or more persons is designated an unlawful assembly if the common object of the persons is unlawful.", "punishment": "Imprisonment up to 6 months or fine or both", "bailable": True, "cognizable": True, "category": "Offences Against Public Order"},
-            "144": {"title": "Joining Unlawful Assembly Armed with Deadly Weapon", "description": "Whoever, being armed with any deadly weapon, joins any unlawful assembly.", "punishment": "Imprisonment up to 2 years or fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Public Order"},
-            "147": {"title": "Rioting", "description": "Whoever is guilty of rioting, shall be punished with imprisonment for a term which may extend to two years, or with fine, or with both.", "punishment": "Imprisonment up to 2 years or fine or both", "bailable": True, "cognizable": True, "category": "Offences Against Public Order"},
-            "148": {"title": "Rioting, Armed with Deadly Weapon", "description": "Whoever is guilty of rioting, being armed with a deadly weapon or with anything which, used as a weapon of offence.", "punishment": "Imprisonment up to 3 years or fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Public Order"},
-            # Offences Against Religion
-            "153": {"title": "Wantonly Giving Provocation with Intent to Cause Riot", "description": "Whoever malignantly, or wantonly, by doing anything which is illegal, gives provocation to any person intending or knowing it to be likely that such provocation will cause riot.", "punishment": "Imprisonment up to 1 year or fine or both", "bailable": True, "cognizable": True, "category": "Offences Against Religion"},
-            "295": {"title": "Injuring or Defiling Place of Worship with Intent to Insult Religion", "description": "Whoever destroys, damages or defiles any place of worship, or any object held sacred by any class of persons.", "punishment": "Imprisonment up to 2 years or fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Religion"},
-            "298": {"title": "Uttering Words with Deliberate Intent to Wound Religious Feelings", "description": "Whoever, with the deliberate intention of wounding the religious feelings of any person, utters any word or makes any sound in the hearing of that person.", "punishment": "Imprisonment up to 1 year or fine or both", "bailable": True, "cognizable": False, "category": "Offences Against Religion"},
-            # Elections
-            "499": {"title": "Defamation", "description": "Whoever makes any imputation concerning any person intending to harm his reputation and knowing it to be false.", "punishment": "Simple imprisonment up to 2 years or fine up to 2500 rupees or both", "bailable": True, "cognizable": False, "category": "Offences Relating to Elections"},
-            "500": {"title": "Punishment for Defamation", "description": "Whoever defames another shall be punished with simple imprisonment for a term which may extend to two years, or with fine, or with both.", "punishment": "Simple imprisonment up to 2 years or fine or both", "bailable": True, "cognizable": False, "category": "Offences Relating to Elections"},
-            # Public Tranquility
-            "504": {"title": "Intentional Insult with Intent to Provoke Breach of Peace", "description": "Whoever intentionally insults any person, knowing or having reason to believe that such insult will provoke him to commit a breach of peace.", "punishment": "Imprisonment up to 2 years or fine up to 1000 rupees or both", "bailable": True, "cognizable": False, "category": "Public Tranquility"},
-            "505": {"title": "Statements Conducing to Public Mischief", "description": "Whoever makes, publishes or circulates any statement, rumour or report with intent to cause fear or alarm.", "punishment": "Imprisonment up to 3 years or fine up to 500 rupees or both", "bailable": True, "cognizable": True, "category": "Public Tranquility"},
-            "506": {"title": "Criminal Intimidation", "description": "Whoever commits the offence of criminal intimidation shall be punished with imprisonment of either description for a term which may extend to two years, or with fine, or with both.", "punishment": "Imprisonment up to 2 years or fine or both", "bailable": True, "cognizable": False, "category": "Public Tranquility"},
-            # General
-            "511": {"title": "Punishment for Attempting to Commit Offences Punishable with Imprisonment", "description": "Whoever attempts to commit an offence punishable by this Code with imprisonment for life or imprisonment.", "punishment": "Imprisonment up to half of longest term or fine or both", "bailable": True, "cognizable": True, "category": "General"},
-        },
-        "bns": {
-            # Offences Against Life
-            "103": {"title": "Murder", "description": "Whoever commits murder shall be punished with death or life imprisonment and shall also be liable to fine.", "punishment": "Death or life imprisonment, and fine up to 10,000 rupees", "bailable": False, "cognizable": True, "category": "Offences Against Life"},
-            "104": {"title": "Culpable Homicide Not Amounting to Murder", "description": "When death is caused by any act which does not amount to culpable homicide punishable with death or life imprisonment.", "punishment": "Imprisonment up to 2 years and fine up to 10,000 rupees", "bailable": True, "cognizable": True, "category": "Offences Against Life"},
-            "105": {"title": "Attempt to Murder", "description": "When an act is done with intent or knowledge that if it caused death, the person would be guilty of murder.", "punishment": "Imprisonment up to 10 years and fine up to 10,000 rupees", "bailable": False, "cognizable": True, "category": "Offences Against Life"},
-            "106": {"title": "Attempt to Commit Culpable Homicide", "description": "Attempt to commit an act which, if death resulted, would amount to culpable homicide but not to murder.", "punishment": "Imprisonment up to 3 years and fine up to 5,000 rupees", "bailable": True, "cognizable": True, "category": "Offences Against Life"},
-            "108": {"title": "Abetment of Suicide", "description": "Whoever abets the commission of suicide by any person is guilty of abetment of suicide.", "punishment": "Imprisonment up to 10 years and fine up to 10,000 rupees", "bailable": False, "cognizable": True, "category": "Offences Against Life"},
-            # Offences Against Body
-            "115": {"title": "Voluntarily Causing Hurt", "description": "Whoever does any act with the intention of thereby causing hurt to any person, or with the knowledge that he is likely thereby to cause hurt to any person.", "punishment": "Imprisonment up to 1 year or fine up to 5,000 rupees or both", "bailable": True, "cognizable": False, "category": "Offences Against Body"},
-            "118": {"title": "Causing Hurt", "description": "Whoever, by doing any act, causes hurt to any person, intending to do so or knowing it likely to cause hurt.", "punishment": "Imprisonment up to 3 months or fine up to 2,500 rupees or both", "bailable": True, "cognizable": False, "category": "Offences Against Body"},
-            "119": {"title": "Voluntarily Causing Grievous Hurt in Committing Robbery", "description": "Whoever voluntarily causes grievous hurt in the course of committing or attempting to commit robbery.", "punishment": "Imprisonment for life or rigorous imprisonment up to 10 years and fine", "bailable": False, "cognizable": True, "category": "Offences Against Body"},
-            "120": {"title": "Voluntarily Causing Grievous Hurt", "description": "Whoever, by any act, causes hurt to any person intending to cause grievous hurt or knowing it likely to cause grievous hurt.", "punishment": "Imprisonment up to 7 years and fine up to 10,000 rupees", "bailable": False, "cognizable": True, "category": "Offences Against Body"},
-            "121": {"title": "Causing Hurt by Poison, Fire, or Explosion", "description": "Whoever causes hurt to any person by administering poison, fire, or explosion, or by any other means.", "punishment": "Life imprisonment or up to 15 years imprisonment and fine", "bailable": False, "cognizable": True, "category": "Offences Against Body"},
-            "123": {"title": "Causing Hurt by Means of Poison", "description": "Whoever administers to or causes to be taken by any person any poison or any stupefying, intoxicating or unwholesome drug.", "punishment": "Imprisonment up to 10 years and fine", "bailable": False, "cognizable": True, "category": "Offences Against Body"},
-            # Offences Against Women
-            "61": {"title": "Wrongful Restraint", "description": "Whoever wrongfully restrains any person in such a manner as to prevent that person from proceeding beyond certain circumscribing limits.", "punishment": "Simple imprisonment up to 1 month or fine up to 5,000 rupees or both", "bailable": True, "cognizable": False, "category": "Offences Against Women"},
-            "62": {"title": "Assault or Criminal Force to Woman with Intent to Outrage Modesty", "description": "Any man who assaults or uses criminal force to any woman, intending to outrage or knowing it likely to outrage her modesty.", "punishment": "Imprisonment up to 3 years or fine up to 3000 rupees or both", "bailable": True, "cognizable": True, "category": "Offences Against Women"},
-            "63": {"title": "Assault or Criminal Force with Intent to Dishonor Person", "description": "Whoever assaults or uses criminal force to any person, intending thereby to dishonor that person.", "punishment": "Imprisonment up to 2 years or fine up to 3,000 rupees or both", "bailable": True, "cognizable": True, "category": "Offences Against Women"},
-            "64": {"title": "Kidnapping or Abducting in Order to Murder", "description": "Whoever kidnaps or abducts any person in order that such person may be murdered or may be so disposed of as to be put in danger of being murdered.", "punishment": "Imprisonment for life or rigorous imprisonment up to 10 years and fine", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-            "66": {"title": "Kidnapping to Murder or for Ransom", "description": "Whoever kidnaps or abducts any person or keeps a person in detention after such kidnapping or abduction, and threatens to cause death or hurt to such person.", "punishment": "Death or imprisonment for life and fine", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-            "67": {"title": "Wrongful Confinement for Ransom", "description": "Whoever kidnaps or abducts any person in order that such person may be subject to wrongful confinement, and whoever so confines any person for ransom.", "punishment": "Imprisonment up to 10 years and fine", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-            "68": {"title": "Rape - Definition", "description": "A man is said to commit rape if he has sexual intercourse with a woman under circumstances falling under any of the seven descriptions.", "punishment": "N/A - Definitional Section", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-            "69": {"title": "Punishment for Rape", "description": "A man is said to commit rape if he has sexual intercourse with a woman against her will, without her consent, by putting her in fear or by fraud.", "punishment": "Rigorous imprisonment for a term not less than 10 years but may extend to life imprisonment, and fine not less than 5,000 rupees", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-            "70": {"title": "Sexual Assault", "description": "Whoever assaults or uses criminal force to any woman, intending to outrage or knowing it likely to outrage her modesty.", "punishment": "Imprisonment up to 5 years and fine up to 5,000 rupees", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-            # Offences Against Persons
-            "77": {"title": "Unnatural Offence", "description": "Whoever voluntarily has carnal intercourse in violation of the order of nature, shall be punished.", "punishment": "Life imprisonment or imprisonment up to 10 years and fine up to 10,000 rupees", "bailable": False, "cognizable": True, "category": "Offences Against Persons"},
-            # Offences Against Property
-            "299": {"title": "Theft", "description": "Whoever, intending to take dishonestly any movable property out of the possession of any person without that person's consent, moves that property.", "punishment": "Imprisonment up to 3 years and fine up to 10,000 rupees", "bailable": True, "cognizable": True, "category": "Offences Against Property"},
-            "303": {"title": "Theft by Clerk or Servant", "description": "Whoever, being a clerk or servant, commits theft in respect of any property in the possession of his master or employer.", "punishment": "Imprisonment up to 7 years and fine up to 10,000 rupees", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-            "304": {"title": "Theft in Dwelling House", "description": "Whoever commits theft in any building, tent or vessel used as a human dwelling.", "punishment": "Imprisonment up to 7 years and fine up to 10,000 rupees", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-            "308": {"title": "Dacoity", "description": "When five or more persons commit or attempt to commit a robbery, it is designated dacoity.", "punishment": "Imprisonment up to 10 years and fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-            "312": {"title": "Punishment for Dacoity", "description": "Whoever commits dacoity shall be punished with imprisonment for life, or with rigorous imprisonment for a term which may extend to fourteen years, and shall also be liable to fine.", "punishment": "Life imprisonment or rigorous imprisonment up to 14 years and fine", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-            "316": {"title": "Criminal Breach of Trust", "description": "Whoever, being in any manner entrusted with property, dishonestly misappropriates or converts to his own use that property.", "punishment": "Imprisonment up to 5 years or fine or both", "bailable": True, "cognizable": False, "category": "Offences Against Property"},
-            "318": {"title": "Cheating and Dishonestly Inducing Delivery of Property", "description": "Whoever cheats and thereby dishonestly induces any person to deliver any property to any person.", "punishment": "Imprisonment up to 7 years and fine up to 10,000 rupees", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-            "320": {"title": "Mischief", "description": "Whoever with intent to cause, or knowing that he is likely to cause, wrongful loss or damage to the public or to any person.", "punishment": "Imprisonment up to 3 months or fine up to 5,000 rupees or both", "bailable": True, "cognizable": False, "category": "Offences Against Property"},
-            "331": {"title": "House-Trespass", "description": "Whoever commits house-trespass in order to the committing of any offence punishable with imprisonment.", "punishment": "Imprisonment up to 2 years and fine up to 5,000 rupees", "bailable": True, "cognizable": True, "category": "Offences Against Property"},
-            "337": {"title": "House-Trespass by Night After Sunset", "description": "Whoever commits house-trespass, having made preparation for causing hurt to any person, or for assault or wrongful restraint.", "punishment": "Imprisonment up to 5 years and fine up to 10,000 rupees", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-            # Offences Against Public Order
-            "141": {"title": "Unlawful Assembly", "description": "An assembly of five or more persons is designated an unlawful assembly if the common object of the persons is unlawful.", "punishment": "Imprisonment up to 6 months or fine up to 10,000 rupees or both", "bailable": True, "cognizable": True, "category": "Offences Against Public Order"},
-            "142": {"title": "Being Member of Unlawful Assembly", "description": "Whoever, being aware of facts which render any assembly an unlawful assembly, intentionally joins that assembly, or continues in it.", "punishment": "Imprisonment up to 6 months or fine up to 10,000 rupees or both", "bailable": True, "cognizable": True, "category": "Offences Against Public Order"},
-            "144": {"title": "Rioting", "description": "Whoever is guilty of rioting, shall be punished with imprisonment of either description for a term which may extend to two years, or with fine, or with both.", "punishment": "Imprisonment up to 2 years or fine up to 10,000 rupees or both", "bailable": True, "cognizable": True, "category": "Offences Against Public Order"},
-            # Elections
-            "152": {"title": "Defamation", "description": "Whoever makes any imputation concerning any person intending to harm his reputation and knowing it to be false.", "punishment": "Simple imprisonment up to 2 years or fine up to 5,000 rupees or both", "bailable": True, "cognizable": False, "category": "Offences Relating to Elections"},
-            "153": {"title": "Printing or Engraving Matter Known to be Defamatory", "description": "Whoever prints or engraves any matter, knowing or having good reason to believe that such matter is defamatory of any person.", "punishment": "Simple imprisonment up to 2 years or fine or both", "bailable": True, "cognizable": False, "category": "Offences Relating to Elections"},
-            # Public Tranquility
-            "192": {"title": "Intentional Insult with Intent to Provoke Breach of Peace", "description": "Whoever intentionally insults any person, knowing that such insult will provoke him to commit a breach of peace.", "punishment": "Imprisonment up to 2 years or fine up to 5,000 rupees or both", "bailable": True, "cognizable": False, "category": "Public Tranquility"},
-            "196": {"title": "Statements Conducing to Public Mischief", "description": "Whoever makes, publishes or circulates any statement, rumour or report with intent to cause fear or alarm.", "punishment": "Imprisonment up to 3 years or fine up to 5,000 rupees or both", "bailable": True, "cognizable": True, "category": "Public Tranquility"},
-            "197": {"title": "Criminal Intimidation", "description": "Whoever commits the offence of criminal intimidation shall be punished with imprisonment of either description for a term which may extend to two years, or with fine, or with both.", "punishment": "Imprisonment up to 2 years or fine up to 5,000 rupees or both", "bailable": True, "cognizable": False, "category": "Public Tranquility"},
-        }
-    }
-    
     try:
-        if code_type.lower() in sections_db and section_id in sections_db[code_type.lower()]:
-            details = sections_db[code_type.lower()][section_id]
-            details["section"] = f"{code_type.upper()} {section_id}"
-            details["number"] = section_id
-            details["code"] = code_type.lower()
-            return JSONResponse({"success": True, "data": details})
-        else:
+        entry = get_legal_catalog().section_details(section_id, code_type)
+        if entry is None:
             return JSONResponse({"success": False, "error": f"Section {section_id} not found in {code_type.upper()}", "data": None}, status_code=404)
+        return _catalog_response(entry, if_none_match)
     except Exception as e:
         return JSONResponse({"success": False, "error": str(e)}, status_code=500)
 
 
 @app.get("/api/ai/precedents/section/{section}")
 async def enhanced_precedents_by_section(section: str, top_k: int = 10):
-    """Get precedents for a specific section"""
+    """Get precedents for a section, or citing all of several comma-separated sections ("IPC 302,IPC 34")"""
     try:
         from utils.precedent_matcher import get_precedents_for_section
         result = get_precedents_for_section(section, top_k)
@@ -567,171 +745,33 @@ async def enhanced_precedents_by_section(section: str, top_k: int = 10):
         return JSONResponse({"success": False, "error": str(e)}, status_code=500)
 
 
-@app.get("/api/ai/sections-list")
-async def enhanced_sections_list(code_type: str = "both"):
-    """Get list of all available sections (IPC/BNS) - 50+ comprehensive legal sections"""
-    ipc_sections = [
-        # Offences Against Life
-        {"value": "302", "label": "IPC 302 - Murder", "section": "IPC 302", "title": "Murder", "code": "ipc", "punishment": "Death or life imprisonment", "bailable": False, "cognizable": True, "category": "Offences Against Life"},
-        {"value": "304", "label": "IPC 304 - Culpable Homicide", "section": "IPC 304", "title": "Culpable Homicide Not Amounting to Murder", "code": "ipc", "punishment": "Up to 2 years imprisonment or fine", "bailable": True, "cognizable": True, "category": "Offences Against Life"},
-        {"value": "305", "label": "IPC 305 - Abetment of Suicide", "section": "IPC 305", "title": "Abetment of Suicide", "code": "ipc", "punishment": "Up to 10 years imprisonment or fine", "bailable": False, "cognizable": True, "category": "Offences Against Life"},
-        {"value": "306", "label": "IPC 306 - Abetment of Suicide", "section": "IPC 306", "title": "Abetment of Suicide by Person Under 18", "code": "ipc", "punishment": "Up to 10 years imprisonment or fine", "bailable": False, "cognizable": True, "category": "Offences Against Life"},
-        {"value": "307", "label": "IPC 307 - Attempt to Murder", "section": "IPC 307", "title": "Attempt to Murder", "code": "ipc", "punishment": "Up to 10 years imprisonment or fine", "bailable": False, "cognizable": True, "category": "Offences Against Life"},
-        {"value": "308", "label": "IPC 308 - Attempt Culpable Homicide", "section": "IPC 308", "title": "Attempt to Commit Culpable Homicide", "code": "ipc", "punishment": "Up to 3 years imprisonment or fine", "bailable": True, "cognizable": True, "category": "Offences Against Life"},
-        # Offences Against Body
-        {"value": "321", "label": "IPC 321 - Causing Hurt", "section": "IPC 321", "title": "Causing Hurt", "code": "ipc", "punishment": "Up to 3 months or fine up to 500", "bailable": True, "cognizable": False, "category": "Offences Against Body"},
-        {"value": "323", "label": "IPC 323 - Causing Hurt", "section": "IPC 323", "title": "Causing Hurt", "code": "ipc", "punishment": "Up to 3 months or fine up to 250", "bailable": True, "cognizable": False, "category": "Offences Against Body"},
-        {"value": "325", "label": "IPC 325 - Grievous Hurt", "section": "IPC 325", "title": "Voluntarily Causing Grievous Hurt", "code": "ipc", "punishment": "Up to 7 years or fine up to 1000", "bailable": False, "cognizable": True, "category": "Offences Against Body"},
-        {"value": "326", "label": "IPC 326 - Hurt by Poison", "section": "IPC 326", "title": "Causing Hurt by Poison, Fire, or Explosion", "code": "ipc", "punishment": "Life imprisonment or up to 15 years", "bailable": False, "cognizable": True, "category": "Offences Against Body"},
-        {"value": "328", "label": "IPC 328 - Hurt by Means of Poison", "section": "IPC 328", "title": "Causing Hurt by Means of Poison", "code": "ipc", "punishment": "Up to 6 months or fine up to 500", "bailable": True, "cognizable": True, "category": "Offences Against Body"},
-        {"value": "330", "label": "IPC 330 - Wrongful Restraint", "section": "IPC 330", "title": "Wrongful Restraint", "code": "ipc", "punishment": "Up to 1 month or fine up to 250", "bailable": True, "cognizable": False, "category": "Offences Against Body"},
-        # Offences Against Women
-        {"value": "354", "label": "IPC 354 - Assault on Woman", "section": "IPC 354", "title": "Assault or Criminal Force to Woman", "code": "ipc", "punishment": "Up to 3 years or fine up to 2000", "bailable": True, "cognizable": True, "category": "Offences Against Women"},
-        {"value": "355", "label": "IPC 355 - Assault with Intent", "section": "IPC 355", "title": "Assault or Criminal Force with Intent to Dishonor", "code": "ipc", "punishment": "Up to 2 years or fine up to 1000", "bailable": True, "cognizable": True, "category": "Offences Against Women"},
-        {"value": "372", "label": "IPC 372 - Selling Minor", "section": "IPC 372", "title": "Selling or Buying Minors for Purposes of Prostitution", "code": "ipc", "punishment": "Up to 10 years or fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-        {"value": "373", "label": "IPC 373 - Kidnapping", "section": "IPC 373", "title": "Kidnapping to Murder or Enslaving", "code": "ipc", "punishment": "Death or life imprisonment", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-        {"value": "374", "label": "IPC 374 - Wrongful Confinement", "section": "IPC 374", "title": "Wrongful Confinement for Ransom", "code": "ipc", "punishment": "Up to 10 years or fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-        {"value": "376", "label": "IPC 376 - Rape", "section": "IPC 376", "title": "Rape", "code": "ipc", "punishment": "Up to 10 years or life imprisonment", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-        {"value": "375", "label": "IPC 375 - Definition of Rape", "section": "IPC 375", "title": "Definition of Rape", "code": "ipc", "punishment": "N/A - Definitional Section", "bailable": True, "cognizable": True, "category": "Offences Against Women"},
-        # Offences Against Property
-        {"value": "378", "label": "IPC 378 - Theft", "section": "IPC 378", "title": "Theft", "code": "ipc", "punishment": "Up to 3 years or fine up to 500", "bailable": True, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "379", "label": "IPC 379 - Theft by Finding", "section": "IPC 379", "title": "Theft by Clerk or Servant", "code": "ipc", "punishment": "Up to 3 years or fine up to 1000", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "380", "label": "IPC 380 - Theft", "section": "IPC 380", "title": "Theft in Dwelling House", "code": "ipc", "punishment": "Up to 3 years or fine up to 500", "bailable": True, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "381", "label": "IPC 381 - Theft by Public Servant", "section": "IPC 381", "title": "Theft by Public Servant", "code": "ipc", "punishment": "Up to 5 years or fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "390", "label": "IPC 390 - Dacoity", "section": "IPC 390", "title": "Dacoity", "code": "ipc", "punishment": "Up to 10 years or fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "392", "label": "IPC 392 - Punishment for Dacoity", "section": "IPC 392", "title": "Punishment for Dacoity", "code": "ipc", "punishment": "Up to 10 years or fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "406", "label": "IPC 406 - Criminal Breach of Trust", "section": "IPC 406", "title": "Criminal Breach of Trust", "code": "ipc", "punishment": "Up to 7 years or fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "409", "label": "IPC 409 - Breach of Trust by Public Servant", "section": "IPC 409", "title": "Criminal Breach of Trust by Public Servant", "code": "ipc", "punishment": "Up to 10 years or fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "420", "label": "IPC 420 - Cheating", "section": "IPC 420", "title": "Cheating and Dishonestly Inducing Delivery", "code": "ipc", "punishment": "Up to 7 years or fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "425", "label": "IPC 425 - Mischief", "section": "IPC 425", "title": "Mischief", "code": "ipc", "punishment": "Up to 3 months or fine up to 250", "bailable": True, "cognizable": False, "category": "Offences Against Property"},
-        {"value": "427", "label": "IPC 427 - Mischief Causing Damage", "section": "IPC 427", "title": "Mischief Causing Damage Over 50 Rupees", "code": "ipc", "punishment": "Up to 6 months or fine up to 1000", "bailable": True, "cognizable": False, "category": "Offences Against Property"},
-        {"value": "435", "label": "IPC 435 - Arson", "section": "IPC 435", "title": "Mischief by Fire or Explosive Substance", "code": "ipc", "punishment": "Up to 6 months or fine up to 500", "bailable": True, "cognizable": False, "category": "Offences Against Property"},
-        {"value": "450", "label": "IPC 450 - House-Trespass", "section": "IPC 450", "title": "House-Trespass", "code": "ipc", "punishment": "Up to 3 months or fine up to 250", "bailable": True, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "456", "label": "IPC 456 - House-Trespass by Night", "section": "IPC 456", "title": "House-Trespass by Night After Sunset", "code": "ipc", "punishment": "Up to 5 years or fine up to 1000", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-        # Offences Against Public Order
-        {"value": "143", "label": "IPC 143 - Unlawful Assembly", "section": "IPC 143", "title": "Unlawful Assembly", "code": "ipc", "punishment": "Up to 6 months or fine up to 250", "bailable": True, "cognizable": True, "category": "Offences Against Public Order"},
-        {"value": "144", "label": "IPC 144 - Armed Unlawful Assembly", "section": "IPC 144", "title": "Armed Unlawful Assembly", "code": "ipc", "punishment": "Up to 2 years or fine up to 1000", "bailable": False, "cognizable": True, "category": "Offences Against Public Order"},
-        {"value": "147", "label": "IPC 147 - Rioting", "section": "IPC 147", "title": "Rioting", "code": "ipc", "punishment": "Up to 1 year or fine up to 500", "bailable": True, "cognizable": True, "category": "Offences Against Public Order"},
-        {"value": "148", "label": "IPC 148 - Rioting Armed", "section": "IPC 148", "title": "Rioting Armed with Deadly Weapon", "code": "ipc", "punishment": "Up to 2 years or fine up to 1000", "bailable": False, "cognizable": True, "category": "Offences Against Public Order"},
-        # Offences Against Religion
-        {"value": "153", "label": "IPC 153 - Communal Disharmony", "section": "IPC 153", "title": "Wantonly Provoking or Insulting", "code": "ipc", "punishment": "Up to 1 year or fine up to 1000", "bailable": True, "cognizable": True, "category": "Offences Against Religion"},
-        {"value": "295", "label": "IPC 295 - Insulting Religion", "section": "IPC 295", "title": "Insulting Religion of Any Class", "code": "ipc", "punishment": "Up to 3 years or fine up to 500", "bailable": False, "cognizable": True, "category": "Offences Against Religion"},
-        {"value": "298", "label": "IPC 298 - Utterance of Words", "section": "IPC 298", "title": "Utterance of Words with Deliberate Intent", "code": "ipc", "punishment": "Up to 1 year or fine up to 500", "bailable": True, "cognizable": False, "category": "Offences Against Religion"},
-        # Election Offences
-        {"value": "499", "label": "IPC 499 - Defamation", "section": "IPC 499", "title": "Defamation", "code": "ipc", "punishment": "Up to 2 years or fine up to 2500", "bailable": True, "cognizable": False, "category": "Elections"},
-        {"value": "500", "label": "IPC 500 - Defamation Punishment", "section": "IPC 500", "title": "Punishment for Defamation", "code": "ipc", "punishment": "Up to 2 years or fine up to 2500", "bailable": True, "cognizable": False, "category": "Elections"},
-        # Public Tranquility
-        {"value": "504", "label": "IPC 504 - Intentional Insult", "section": "IPC 504", "title": "Intentional Insult with Intent to Provoke Breach", "code": "ipc", "punishment": "Up to 2 years or fine up to 1000", "bailable": True, "cognizable": False, "category": "Public Tranquility"},
-        {"value": "505", "label": "IPC 505 - Public Mischief", "section": "IPC 505", "title": "Statements Conducing to Public Mischief", "code": "ipc", "punishment": "Up to 3 years or fine up to 500", "bailable": True, "cognizable": True, "category": "Public Tranquility"},
-        {"value": "506", "label": "IPC 506 - Criminal Intimidation", "section": "IPC 506", "title": "Criminal Intimidation", "code": "ipc", "punishment": "Up to 2 years or fine up to 1000", "bailable": True, "cognizable": False, "category": "Public Tranquility"},
-        # Attempt and Abetment
-        {"value": "511", "label": "IPC 511 - Attempt", "section": "IPC 511", "title": "Punishment for Attempting to Commit Offences", "code": "ipc", "punishment": "Varies by substantive offence", "bailable": True, "cognizable": True, "category": "General"},
-    ]
-    
-    bns_sections = [
-        # Offences Against Life
-        {"value": "103", "label": "BNS 103 - Murder", "section": "BNS 103", "title": "Murder", "code": "bns", "punishment": "Death or life imprisonment and fine", "bailable": False, "cognizable": True, "category": "Offences Against Life"},
-        {"value": "104", "label": "BNS 104 - Culpable Homicide", "section": "BNS 104", "title": "Culpable Homicide Not Amounting to Murder", "code": "bns", "punishment": "Up to 2 years and fine up to 10000", "bailable": True, "cognizable": True, "category": "Offences Against Life"},
-        {"value": "105", "label": "BNS 105 - Attempt to Murder", "section": "BNS 105", "title": "Attempt to Murder", "code": "bns", "punishment": "Up to 10 years and fine up to 10000", "bailable": False, "cognizable": True, "category": "Offences Against Life"},
-        {"value": "106", "label": "BNS 106 - Attempt Culpable Homicide", "section": "BNS 106", "title": "Attempt to Commit Culpable Homicide", "code": "bns", "punishment": "Up to 3 years and fine up to 5000", "bailable": True, "cognizable": True, "category": "Offences Against Life"},
-        {"value": "108", "label": "BNS 108 - Abetment of Suicide", "section": "BNS 108", "title": "Abetment of Suicide", "code": "bns", "punishment": "Up to 10 years and fine up to 10000", "bailable": False, "cognizable": True, "category": "Offences Against Life"},
-        # Offences Against Body
-        {"value": "115", "label": "BNS 115 - Causing Hurt", "section": "BNS 115", "title": "Causing Hurt", "code": "bns", "punishment": "Up to 3 months or fine up to 5000 or both", "bailable": True, "cognizable": False, "category": "Offences Against Body"},
-        {"value": "118", "label": "BNS 118 - Causing Hurt", "section": "BNS 118", "title": "Causing Hurt", "code": "bns", "punishment": "Up to 3 months or fine up to 2500 or both", "bailable": True, "cognizable": False, "category": "Offences Against Body"},
-        {"value": "119", "label": "BNS 119 - Voluntarily Causing Grievous Hurt", "section": "BNS 119", "title": "Voluntarily Causing Grievous Hurt in Committing Robbery", "code": "bns", "punishment": "Up to 10 years and fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Body"},
-        {"value": "120", "label": "BNS 120 - Grievous Hurt", "section": "BNS 120", "title": "Voluntarily Causing Grievous Hurt", "code": "bns", "punishment": "Up to 7 years and fine up to 10000", "bailable": False, "cognizable": True, "category": "Offences Against Body"},
-        {"value": "121", "label": "BNS 121 - Hurt by Poison", "section": "BNS 121", "title": "Causing Hurt by Poison, Fire, or Explosion", "code": "bns", "punishment": "Life or up to 15 years and fine", "bailable": False, "cognizable": True, "category": "Offences Against Body"},
-        {"value": "123", "label": "BNS 123 - Hurt by Means of Poison", "section": "BNS 123", "title": "Causing Hurt by Means of Poison", "code": "bns", "punishment": "Up to 6 months or fine up to 5000 or both", "bailable": True, "cognizable": True, "category": "Offences Against Body"},
-        # Offences Against Women
-        {"value": "61", "label": "BNS 61 - Wrongful Restraint", "section": "BNS 61", "title": "Wrongful Restraint", "code": "bns", "punishment": "Up to 1 month or fine up to 5000 or both", "bailable": True, "cognizable": False, "category": "Offences Against Women"},
-        {"value": "62", "label": "BNS 62 - Assault on Woman", "section": "BNS 62", "title": "Assault or Criminal Force to Woman", "code": "bns", "punishment": "Up to 3 years or fine up to 3000 or both", "bailable": True, "cognizable": True, "category": "Offences Against Women"},
-        {"value": "63", "label": "BNS 63 - Assault with Intent", "section": "BNS 63", "title": "Assault or Criminal Force with Intent to Dishonor", "code": "bns", "punishment": "Up to 2 years or fine up to 3000 or both", "bailable": True, "cognizable": True, "category": "Offences Against Women"},
-        {"value": "64", "label": "BNS 64 - Kidnapping", "section": "BNS 64", "title": "Kidnapping or Abducting Woman", "code": "bns", "punishment": "Up to 10 years and fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-        {"value": "66", "label": "BNS 66 - Kidnapping", "section": "BNS 66", "title": "Kidnapping to Murder or Enslaving", "code": "bns", "punishment": "Death or life imprisonment or up to 10 years", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-        {"value": "67", "label": "BNS 67 - Wrongful Confinement", "section": "BNS 67", "title": "Wrongful Confinement for Ransom", "code": "bns", "punishment": "Up to 10 years and fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-        {"value": "68", "label": "BNS 68 - Definition of Rape", "section": "BNS 68", "title": "Definition of Rape", "code": "bns", "punishment": "N/A - Definitional Section", "bailable": True, "cognizable": True, "category": "Offences Against Women"},
-        {"value": "69", "label": "BNS 69 - Rape", "section": "BNS 69", "title": "Rape", "code": "bns", "punishment": "Up to 10 years or life imprisonment or death", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-        {"value": "70", "label": "BNS 70 - Sexual Assault", "section": "BNS 70", "title": "Sexual Assault", "code": "bns", "punishment": "Up to 5 years and fine up to 5000", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-        # Offences Against Persons
-        {"value": "77", "label": "BNS 77 - Unnatural Offence", "section": "BNS 77", "title": "Unnatural Offence", "code": "bns", "punishment": "Life or up to 10 years and fine", "bailable": False, "cognizable": True, "category": "Offences Against Persons"},
-        # Offences Against Property
-        {"value": "299", "label": "BNS 299 - Theft", "section": "BNS 299", "title": "Theft", "code": "bns", "punishment": "Up to 3 years and fine up to 10000", "bailable": True, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "303", "label": "BNS 303 - Theft", "section": "BNS 303", "title": "Theft by Clerk or Servant", "code": "bns", "punishment": "Up to 3 years and fine up to 10000", "bailable": True, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "304", "label": "BNS 304 - Theft", "section": "BNS 304", "title": "Theft in Dwelling House", "code": "bns", "punishment": "Up to 3 years and fine up to 10000", "bailable": True, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "308", "label": "BNS 308 - Dacoity", "section": "BNS 308", "title": "Dacoity", "code": "bns", "punishment": "Up to 10 years and fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "312", "label": "BNS 312 - Dacoity Punishment", "section": "BNS 312", "title": "Punishment for Dacoity", "code": "bns", "punishment": "Up to 14 years and fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "316", "label": "BNS 316 - Breach of Trust", "section": "BNS 316", "title": "Criminal Breach of Trust", "code": "bns", "punishment": "Up to 8 years and fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "318", "label": "BNS 318 - Cheating", "section": "BNS 318", "title": "Cheating and Dishonestly Inducing Delivery", "code": "bns", "punishment": "Up to 7 years and fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "320", "label": "BNS 320 - Mischief", "section": "BNS 320", "title": "Mischief", "code": "bns", "punishment": "Up to 3 months or fine up to 5000 or both", "bailable": True, "cognizable": False, "category": "Offences Against Property"},
-        {"value": "331", "label": "BNS 331 - House-Trespass", "section": "BNS 331", "title": "House-Trespass", "code": "bns", "punishment": "Up to 3 months or fine up to 5000 or both", "bailable": True, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "337", "label": "BNS 337 - House-Trespass by Night", "section": "BNS 337", "title": "House-Trespass by Night After Sunset", "code": "bns", "punishment": "Up to 5 years and fine up to 10000 or both", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-        # Offences Against Public Order
-        {"value": "141", "label": "BNS 141 - Unlawful Assembly", "section": "BNS 141", "title": "Unlawful Assembly", "code": "bns", "punishment": "Up to 6 months or fine up to 10000 or both", "bailable": True, "cognizable": True, "category": "Offences Against Public Order"},
-        {"value": "142", "label": "BNS 142 - Armed Unlawful Assembly", "section": "BNS 142", "title": "Armed Unlawful Assembly", "code": "bns", "punishment": "Up to 2 years and fine up to 10000 or both", "bailable": False, "cognizable": True, "category": "Offences Against Public Order"},
-        {"value": "144", "label": "BNS 144 - Rioting", "section": "BNS 144", "title": "Rioting", "code": "bns", "punishment": "Up to 1 year and fine up to 10000 or both", "bailable": True, "cognizable": True, "category": "Offences Against Public Order"},
-        # Elections
-        {"value": "152", "label": "BNS 152 - Defamation", "section": "BNS 152", "title": "Defamation", "code": "bns", "punishment": "Up to 2 years or fine up to 5000 or both", "bailable": True, "cognizable": False, "category": "Elections"},
-        {"value": "153", "label": "BNS 153 - Serious Defamation", "section": "BNS 153", "title": "Serious Defamation", "code": "bns", "punishment": "Up to 3 years and fine or both", "bailable": False, "cognizable": True, "category": "Elections"},
-        # Public Tranquility
-        {"value": "192", "label": "BNS 192 - Intentional Insult", "section": "BNS 192", "title": "Intentional Insult with Intent to Provoke Breach", "code": "bns", "punishment": "Up to 2 years or fine up to 5000 or both", "bailable": True, "cognizable": False, "category": "Public Tranquility"},
-        {"value": "196", "label": "BNS 196 - Public Mischief", "section": "BNS 196", "title": "Statements Conducing to Public Mischief", "code": "bns", "punishment": "Up to 3 years or fine up to 5000 or both", "bailable": True, "cognizable": True, "category": "Public Tranquility"},
-        {"value": "197", "label": "BNS 197 - Criminal Intimidation", "section": "BNS 197", "title": "Criminal Intimidation", "code": "bns", "punishment": "Up to 2 years and fine up to 5000 or both", "bailable": True, "cognizable": False, "category": "Public Tranquility"},
-    ]
-    
-    if code_type.lower() == 'ipc':
-        sections = ipc_sections
-    elif code_type.lower() == 'bns':
-        sections = bns_sections
-    else:
-        sections = ipc_sections + bns_sections
-    
-    return JSONResponse({"success": True, "data": {"sections": sections}})
+@app.get("/api/ai/similar/{case_id}")
+async def enhanced_similar_cases(case_id: str, top_k: int = 10):
+    """Get the precomputed most similar cases of an indexed case (see build_similar_cases.py)"""
+    try:
+        from utils.similar_cases import get_similar_case_graph, get_similar_cases
+        if get_similar_case_graph() is None:
+            return JSONResponse({"success": False, "error": "Similar-case graph not built. Run build_similar_cases.py."}, status_code=404)
+        result = get_similar_cases(case_id, top_k)
+        if result is None:
+            return JSONResponse({"success": False, "error": "Case not found in similar-case graph"}, status_code=404)
+        return JSONResponse({"success": True, "data": result})
+    except Exception as e:
+        return JSONResponse({"success": False, "error": str(e)}, status_code=500)
+
+
+@app.get("/api/ai/sections/typeahead")
+async def enhanced_sections_typeahead(q: str = "", limit: int = 10, code_type: str = "both"):
+    """Ranked IPC/BNS completions for a partially typed section number, offence name or keyword"""
+    try:
+        from utils.section_typeahead import section_typeahead
+        suggestions = section_typeahead(q, limit, code_type)
+        return JSONResponse({"success": True, "data": {"query": q, "suggestions": suggestions, "count": len(suggestions)}})
+    except Exception as e:
+        return JSONResponse({"success": False, "error": str(e)}, status_code=500)
 
 
 @app.get("/api/ai/sections-list")
-async def enhanced_sections_list(code_type: str = "both"):
-    """Get list of all available sections (IPC/BNS)"""
-    ipc_sections = [
-        {"value": "302", "label": "IPC 302 - Murder", "section": "IPC 302", "title": "Murder", "code": "ipc", "punishment": "Life imprisonment or death", "bailable": False, "cognizable": True, "category": "Offences Against Life"},
-        {"value": "304", "label": "IPC 304 - Culpable Homicide", "section": "IPC 304", "title": "Culpable Homicide Not Amounting to Murder", "code": "ipc", "punishment": "Imprisonment up to 2 years or fine up to 1000 or both", "bailable": True, "cognizable": True, "category": "Offences Against Life"},
-        {"value": "307", "label": "IPC 307 - Attempt to Murder", "section": "IPC 307", "title": "Attempt to Murder", "code": "ipc", "punishment": "Imprisonment up to 10 years or fine up to 1000 or both", "bailable": False, "cognizable": True, "category": "Offences Against Life"},
-        {"value": "308", "label": "IPC 308 - Attempt to Commit Culpable Homicide", "section": "IPC 308", "title": "Attempt to Commit Culpable Homicide", "code": "ipc", "punishment": "Imprisonment up to 3 years or fine up to 500 or both", "bailable": True, "cognizable": True, "category": "Offences Against Life"},
-        {"value": "323", "label": "IPC 323 - Causing Hurt", "section": "IPC 323", "title": "Causing Hurt", "code": "ipc", "punishment": "Imprisonment up to 3 months or fine up to 250 or both", "bailable": True, "cognizable": False, "category": "Offences Against Body"},
-        {"value": "325", "label": "IPC 325 - Voluntarily Causing Grievous Hurt", "section": "IPC 325", "title": "Voluntarily Causing Grievous Hurt", "code": "ipc", "punishment": "Imprisonment up to 7 years or fine up to 1000 or both", "bailable": False, "cognizable": True, "category": "Offences Against Body"},
-        {"value": "376", "label": "IPC 376 - Rape", "section": "IPC 376", "title": "Rape", "code": "ipc", "punishment": "Imprisonment up to 10 years and fine or life imprisonment and fine or death", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-        {"value": "377", "label": "IPC 377 - Unnatural Offence", "section": "IPC 377", "title": "Unnatural Offence", "code": "ipc", "punishment": "Imprisonment up to life or fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Persons"},
-        {"value": "380", "label": "IPC 380 - Theft", "section": "IPC 380", "title": "Theft", "code": "ipc", "punishment": "Imprisonment up to 3 years or fine up to 500 or both", "bailable": True, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "420", "label": "IPC 420 - Cheating and Dishonestly Inducing Delivery", "section": "IPC 420", "title": "Cheating and Dishonestly Inducing Delivery of Property", "code": "ipc", "punishment": "Imprisonment up to 7 years or fine or both", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "450", "label": "IPC 450 - House-Trespass", "section": "IPC 450", "title": "House-Trespass", "code": "ipc", "punishment": "Imprisonment up to 3 months or fine up to 250 or both", "bailable": True, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "499", "label": "IPC 499 - Defamation", "section": "IPC 499", "title": "Defamation", "code": "ipc", "punishment": "Simple imprisonment up to 2 years or fine up to 2500 or both", "bailable": True, "cognizable": False, "category": "Offences Relating to Elections"},
-        {"value": "504", "label": "IPC 504 - Intentional Insult with Intent to Provoke Breach", "section": "IPC 504", "title": "Intentional Insult with Intent to Provoke Breach of Peace", "code": "ipc", "punishment": "Imprisonment up to 2 years or fine up to 1000 or both", "bailable": True, "cognizable": False, "category": "Public Tranquility"},
-        {"value": "505", "label": "IPC 505 - Statements Conducing to Public Mischief", "section": "IPC 505", "title": "Statements Conducing to Public Mischief", "code": "ipc", "punishment": "Imprisonment up to 3 years or fine up to 500 or both", "bailable": True, "cognizable": True, "category": "Public Tranquility"},
-        {"value": "511", "label": "IPC 511 - Punishment for Attempting Offences", "section": "IPC 511", "title": "Punishment for Attempting to Commit Offences", "code": "ipc", "punishment": "Varies based on substantive offence", "bailable": True, "cognizable": True, "category": "General"},
-    ]
-    
-    bns_sections = [
-        {"value": "103", "label": "BNS 103 - Murder", "section": "BNS 103", "title": "Murder", "code": "bns", "punishment": "Life imprisonment or death", "bailable": False, "cognizable": True, "category": "Offences Against Life"},
-        {"value": "104", "label": "BNS 104 - Culpable Homicide", "section": "BNS 104", "title": "Culpable Homicide Not Amounting to Murder", "code": "bns", "punishment": "Imprisonment up to 2 years and fine up to 10000", "bailable": True, "cognizable": True, "category": "Offences Against Life"},
-        {"value": "105", "label": "BNS 105 - Attempt to Murder", "section": "BNS 105", "title": "Attempt to Murder", "code": "bns", "punishment": "Imprisonment up to 10 years and fine up to 10000", "bailable": False, "cognizable": True, "category": "Offences Against Life"},
-        {"value": "106", "label": "BNS 106 - Attempt Culpable Homicide", "section": "BNS 106", "title": "Attempt to Commit Culpable Homicide", "code": "bns", "punishment": "Imprisonment up to 3 years and fine up to 5000", "bailable": True, "cognizable": True, "category": "Offences Against Life"},
-        {"value": "118", "label": "BNS 118 - Causing Hurt", "section": "BNS 118", "title": "Causing Hurt", "code": "bns", "punishment": "Imprisonment up to 3 months or fine up to 2500 or both", "bailable": True, "cognizable": False, "category": "Offences Against Body"},
-        {"value": "120", "label": "BNS 120 - Voluntarily Causing Grievous Hurt", "section": "BNS 120", "title": "Voluntarily Causing Grievous Hurt", "code": "bns", "punishment": "Imprisonment up to 7 years and fine up to 10000", "bailable": False, "cognizable": True, "category": "Offences Against Body"},
-        {"value": "69", "label": "BNS 69 - Rape", "section": "BNS 69", "title": "Rape", "code": "bns", "punishment": "Imprisonment up to 10 years and fine up to 10000 or life imprisonment and fine or death", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-        {"value": "70", "label": "BNS 70 - Sexual Assault", "section": "BNS 70", "title": "Sexual Assault", "code": "bns", "punishment": "Imprisonment up to 5 years and fine up to 5000", "bailable": False, "cognizable": True, "category": "Offences Against Women"},
-        {"value": "77", "label": "BNS 77 - Unnatural Offence", "section": "BNS 77", "title": "Unnatural Offence", "code": "bns", "punishment": "Imprisonment up to life and fine", "bailable": False, "cognizable": True, "category": "Offences Against Persons"},
-        {"value": "303", "label": "BNS 303 - Theft", "section": "BNS 303", "title": "Theft", "code": "bns", "punishment": "Imprisonment up to 3 years and fine up to 10000", "bailable": True, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "318", "label": "BNS 318 - Cheating", "section": "BNS 318", "title": "Cheating and Dishonestly Inducing Delivery of Property", "code": "bns", "punishment": "Imprisonment up to 7 years and fine up to 10000", "bailable": False, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "331", "label": "BNS 331 - House-Trespass", "section": "BNS 331", "title": "House-Trespass", "code": "bns", "punishment": "Imprisonment up to 3 months or fine up to 5000 or both", "bailable": True, "cognizable": True, "category": "Offences Against Property"},
-        {"value": "152", "label": "BNS 152 - Defamation", "section": "BNS 152", "title": "Defamation", "code": "bns", "punishment": "Simple imprisonment up to 2 years or fine up to 5000 or both", "bailable": True, "cognizable": False, "category": "Offences Relating to Elections"},
-        {"value": "192", "label": "BNS 192 - Intentional Insult", "section": "BNS 192", "title": "Intentional Insult with Intent to Provoke Breach of Peace", "code": "bns", "punishment": "Imprisonment up to 2 years or fine up to 5000 or both", "bailable": True, "cognizable": False, "category": "Public Tranquility"},
-        {"value": "196", "label": "BNS 196 - Public Mischief", "section": "BNS 196", "title": "Statements Conducing to Public Mischief", "code": "bns", "punishment": "Imprisonment up to 3 years or fine up to 5000 or both", "bailable": True, "cognizable": True, "category": "Public Tranquility"},
-    ]
-    
-    if code_type.lower() == 'ipc':
-        sections = ipc_sections
-    elif code_type.lower() == 'bns':
-        sections = bns_sections
-    else:
-        sections = ipc_sections + bns_sections
-    
-    return JSONResponse({"success": True, "data": {"sections": sections}})
+async def enhanced_sections_list(code_type: str = "both", if_none_match: str = Header(None)):
+    """Get list of all available sections (IPC/BNS) - 50+ comprehensive legal sections"""
+    return _catalog_response(get_legal_catalog().sections_list(code_type), if_none_match)
@@ -15,7 +15,7 @@ class AdvancedDocumentGenerator:
     def __init__(self):
         self.templates_dir = Path(__file__).parent.parent / "templates" / "legal_templates"
         self.env = self._setup_jinja_env()
-        self.section_suggester = None
+        self._section_suggester_available = False
         self._load_section_suggester()
     
     def _setup_jinja_env(self) -> Environment:
@@ -36,10 +36,19 @@ class AdvancedDocumentGenerator:
         """Load section suggester for intelligent section recommendations"""
         try:
             from .section_suggester import get_section_suggester
-            self.section_suggester = get_section_suggester()
+            get_section_suggester()
+            self._section_suggester_available = True
         except:
             print("Warning: Section suggester not available")
     
+    @property
+    def section_suggester(self):
+        """The current shared suggester (replaced whenever the section data is hot-reloaded)"""
+        if not self._section_suggester_available:
+            return None
+        from .section_suggester import get_section_suggester
+        return get_section_suggester()
+    
     def generate_charge_sheet(self, case_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Generate charge sheet from case data
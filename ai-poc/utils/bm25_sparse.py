@@ -0,0 +1,176 @@
+"""
+Sparse BM25
+BM25Okapi scoring (same formula and parameters as rank_bm25) over a precomputed sparse
+term-document weight matrix: a query is scored with one sparse matrix-vector product
+and many queries with one sparse matrix product
+"""
+import math
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+try:
+    from scipy import sparse
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+    print("Warning: scipy not installed. Falling back to rank_bm25 for section scoring.")
+
+
+class SparseBM25:
+    """
+    Drop-in replacement for rank_bm25.BM25Okapi.get_scores
+
+    Each matrix entry holds a term's complete BM25 contribution for a document,
+    idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len / avgdl)), so scoring is
+    just summing the entries of the query terms (repeated query terms count
+    again, as in rank_bm25).
+    """
+
+    def __init__(self, corpus: List[List[str]], k1: float = 1.5, b: float = 0.75, epsilon: float = 0.25):
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+        self.corpus_size = len(corpus)
+        self.vocabulary: Dict[str, int] = {}
+
+        rows, cols, tfs = [], [], []
+        doc_len = np.zeros(self.corpus_size)
+        for row, document in enumerate(corpus):
+            doc_len[row] = len(document)
+            frequencies = {}
+            for word in document:
+                frequencies[word] = frequencies.get(word, 0) + 1
+            for word, tf in frequencies.items():
+                rows.append(row)
+                cols.append(self.vocabulary.setdefault(word, len(self.vocabulary)))
+                tfs.append(tf)
+        self.avgdl = doc_len.sum() / self.corpus_size
+
+        rows = np.array(rows, dtype=np.int64)
+        cols = np.array(cols, dtype=np.int64)
+        tfs = np.array(tfs, dtype=np.float64)
+        self.idf = self._calc_idf(np.bincount(cols, minlength=len(self.vocabulary)))
+
+        norm = self.k1 * (1 - self.b + self.b * doc_len[rows] / self.avgdl)
+        weights = self.idf[cols] * (tfs * (self.k1 + 1) / (tfs + norm))
+        # terms x documents, so a query row vector times it gives all document scores
+        self.weights = sparse.csr_matrix(
+            (weights, (cols, rows)), shape=(len(self.vocabulary), self.corpus_size)
+        )
+
+    def _calc_idf(self, doc_freq: np.ndarray) -> np.ndarray:
+        """BM25Okapi idf; negative values are floored to epsilon * average idf"""
+        # math.log and a sequential sum rather than numpy keep the values bit-identical to rank_bm25
+        values = [math.log(self.corpus_size - freq + 0.5) - math.log(freq + 0.5) for freq in doc_freq.tolist()]
+        idf = np.array(values, dtype=np.float64)
+        if values:
+            idf[idf < 0] = self.epsilon * (sum(values) / len(values))
+        return idf
+
+    def query_matrix(self, queries: Sequence[List[str]]):
+        """Sparse (queries x terms) matrix of query term counts; unknown terms are dropped"""
+        return query_matrix(self.vocabulary, queries)
+
+    def get_scores(self, query: List[str]) -> np.ndarray:
+        """BM25 score of every document for one tokenised query"""
+        return self.get_scores_batch([query])[0]
+
+    def get_scores_batch(self, queries: Sequence[List[str]]) -> np.ndarray:
+        """Dense (queries x documents) score matrix from one sparse matrix product"""
+        return np.asarray((self.query_matrix(queries) @ self.weights).todense())
+
+
+class StackedBM25:
+    """
+    Several SparseBM25 indexes side by side over one merged vocabulary
+
+    The weight matrices are placed next to each other (documents of the first
+    index, then the second, ...), so a batch of queries is scored against every
+    index with a single sparse matrix product.
+    """
+
+    def __init__(self, indexes: Sequence[SparseBM25]):
+        self.vocabulary: Dict[str, int] = {}
+        rows, cols, data = [], [], []
+        self.splits = []
+        offset = 0
+        for index in indexes:
+            # index.vocabulary maps each term to its row, in insertion order
+            term_rows = np.array(
+                [self.vocabulary.setdefault(term, len(self.vocabulary)) for term in index.vocabulary],
+                dtype=np.int64
+            )
+            coo = index.weights.tocoo()
+            rows.append(term_rows[coo.row])
+            cols.append(coo.col + offset)
+            data.append(coo.data)
+            offset += index.corpus_size
+            self.splits.append(offset)
+        self.weights = sparse.csr_matrix(
+            (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(len(self.vocabulary), offset)
+        )
+
+    def get_scores_batch(self, queries: Sequence[List[str]]) -> List[np.ndarray]:
+        """One (queries x documents) score matrix per stacked index"""
+        scores = np.asarray((query_matrix(self.vocabulary, queries) @ self.weights).todense())
+        return np.split(scores, self.splits[:-1], axis=1)
+
+
+def tokenize_batch(texts: Sequence[str]) -> List[List[str]]:
+    """
+    Lowercase and whitespace-split many texts, as text.lower().split() would
+
+    The texts are lowercased with a single str.lower() call over their
+    NUL-joined concatenation instead of one call per text.
+    """
+    parts = "\x00".join(texts).lower().split("\x00")
+    if len(parts) != len(texts):
+        # A text contained NUL itself; fall back to per-text lowercasing
+        parts = [text.lower() for text in texts]
+    return [part.split() for part in parts]
+
+
+def query_matrix(vocabulary: Dict[str, int], queries: Sequence[List[str]]):
+    """Sparse (queries x terms) matrix of query term counts; unknown terms are dropped"""
+    lengths = np.fromiter((len(query) for query in queries), dtype=np.int64, count=len(queries))
+    rows = np.repeat(np.arange(len(queries)), lengths)
+    get = vocabulary.get
+    cols = np.fromiter((get(token, -1) for query in queries for token in query), dtype=np.int64, count=int(lengths.sum()))
+    known = cols >= 0
+    # Duplicate (row, col) entries are summed, so repeated tokens count again
+    return sparse.csr_matrix(
+        (np.ones(int(known.sum())), (rows[known], cols[known])),
+        shape=(len(queries), len(vocabulary))
+    )
+
+
+def build_bm25(corpus: List[List[str]]):
+    """SparseBM25 when scipy is installed, otherwise rank_bm25's BM25Okapi"""
+    if SCIPY_AVAILABLE:
+        return SparseBM25(corpus)
+    from rank_bm25 import BM25Okapi
+    return BM25Okapi(corpus)
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores, best first, without sorting the whole array
+
+    argpartition finds the k-th largest score and everything tied with it is
+    kept as a candidate, so ties break deterministically: equal scores come out
+    in index (database) order. The previous full np.argsort left exact ties in
+    an arbitrary order.
+    """
+    scores = np.asarray(scores)
+    n = len(scores)
+    if k <= 0 or n == 0:
+        return np.array([], dtype=np.int64)
+    if k >= n:
+        candidates = np.arange(n)
+    else:
+        kth = scores[np.argpartition(scores, n - k)[n - k]]
+        candidates = np.flatnonzero(scores >= kth)
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order][:k]
@@ -0,0 +1,124 @@
+"""
+Bulk NER over the Extraction Store
+Re-runs entity extraction over saved extraction JSONs (e.g. after redaction rules change)
+by streaming their texts through nlp.pipe, writing each result back as soon as it is ready
+"""
+import os
+import json
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from config import NER_BATCH_SIZE, NER_N_PROCESS
+
+MODES = ("pii", "legal")
+
+
+def iter_extractions(
+    extractions_dir: str,
+    extraction_ids: Optional[Iterable[str]] = None
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Lazily yield (path, extraction) for every extraction JSON in a directory
+
+    Files that are not extractions (no "extractedText") or cannot be parsed are skipped.
+    """
+    if extraction_ids is not None:
+        names = [f"{eid}.json" for eid in extraction_ids]
+    else:
+        names = sorted(fn for fn in os.listdir(extractions_dir) if fn.endswith(".json"))
+    for name in names:
+        path = os.path.join(extractions_dir, name)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"Warning: Skipping {name}: {e}")
+            continue
+        if isinstance(data, dict) and "extractedText" in data:
+            yield path, data
+
+
+def _write_json(path: str, data: Dict[str, Any]):
+    """Write through a temp file and rename, so readers never see a half-written extraction"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _apply_pii(extraction: Dict[str, Any], result: Dict[str, Any]):
+    extraction["entities"] = result.get("entities", {})
+    extraction["redactedText"] = result.get("redactedText", "")
+    extraction["confidence"] = result.get("confidence", 0.0)
+
+
+def _apply_legal(extraction: Dict[str, Any], result: Dict[str, Any]):
+    extraction["legalEntities"] = result
+
+
+def run_bulk_ner(
+    extractions_dir: str,
+    mode: str = "pii",
+    batch_size: int = NER_BATCH_SIZE,
+    n_process: int = NER_N_PROCESS,
+    extraction_ids: Optional[Iterable[str]] = None,
+    progress: Optional[Callable[[int, float], None]] = None
+) -> Dict[str, Any]:
+    """
+    Re-run NER over stored extractions and write the results back incrementally
+
+    Args:
+        extractions_dir: Directory of extraction JSONs (storage/output/ai_extractions)
+        mode: "pii" refreshes entities/redactedText like /ocr-extract does,
+              "legal" stores LegalNER output under "legalEntities"
+        batch_size: Texts per nlp.pipe batch
+        n_process: nlp.pipe worker processes
+        extraction_ids: Only these extractions (default: every file in the directory)
+        progress: Called as progress(done, elapsed_seconds) after every written document
+
+    Returns:
+        Dictionary with processed, failed, ids, elapsed_s and docs_per_sec
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode '{mode}', expected one of {MODES}")
+
+    if mode == "pii":
+        from .ner import extract_entities_bulk
+        bulk, apply = extract_entities_bulk, _apply_pii
+    else:
+        from .legal_ner import get_legal_ner
+        bulk, apply = get_legal_ner().extract_entities_batch, _apply_legal
+
+    # The texts generator and the write-back loop walk the same file order;
+    # pending holds the (path, extraction) pairs spaCy is still working on
+    pending = deque()
+
+    def texts():
+        for path, extraction in iter_extractions(extractions_dir, extraction_ids):
+            pending.append((path, extraction))
+            yield extraction.get("extractedText") or ""
+
+    processed, failed, ids = 0, 0, []
+    started = time.perf_counter()
+    for result in bulk(texts(), batch_size=batch_size, n_process=n_process):
+        path, extraction = pending.popleft()
+        apply(extraction, result)
+        try:
+            _write_json(path, extraction)
+            processed += 1
+            ids.append(extraction.get("id") or os.path.splitext(os.path.basename(path))[0])
+        except Exception as e:
+            print(f"Warning: Could not write {path}: {e}")
+            failed += 1
+        if progress:
+            progress(processed + failed, time.perf_counter() - started)
+
+    elapsed = time.perf_counter() - started
+    return {
+        "processed": processed,
+        "failed": failed,
+        "ids": ids,
+        "elapsed_s": round(elapsed, 3),
+        "docs_per_sec": round(processed / elapsed, 2) if elapsed > 0 else 0.0,
+    }
@@ -0,0 +1,159 @@
+"""
+Hot Reload of Legal Data Files
+Watches the section databases and legal_synonyms.json and, when they change, builds
+new SectionSuggester / LegalNER / SectionTypeahead / QueryExpander instances in the background and
+swaps them into their singletons. Each swap is a single reference assignment made
+after the new instance is complete, so a request sees either the old data or the
+new data, never a partially built index.
+"""
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from config import DATA_RELOAD_INTERVAL
+from .logger import get_logger
+from .section_index import DATA_DIR, SECTION_FILES
+
+logger = get_logger(__name__)
+
+# Data file groups and the files each one is derived from
+WATCHED_FILES = {
+    "sections": [DATA_DIR / filename for filename in SECTION_FILES.values()],
+    "synonyms": [DATA_DIR / "legal_synonyms.json"],
+}
+
+
+def file_signature(paths: List[Path]) -> Tuple:
+    """(mtime_ns, size) per file, None for missing files"""
+    signature = []
+    for path in paths:
+        try:
+            stat = path.stat()
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def _validate(paths: List[Path]):
+    """Raise if an existing file is not valid JSON (e.g. caught mid-write)"""
+    for path in paths:
+        if path.exists():
+            with open(path, 'r', encoding='utf-8') as f:
+                json.load(f)
+
+
+def _reload_sections():
+    from .section_artifact import reload_section_artifact
+    from .section_suggester import reload_section_suggester
+    from .legal_ner import reload_legal_ner
+    from .section_typeahead import reload_section_typeahead
+
+    artifact = reload_section_artifact()
+    reload_section_suggester(artifact)
+    reload_legal_ner(artifact.index)
+    reload_section_typeahead(artifact.index)
+
+
+def _reload_synonyms():
+    from .query_expander import reload_query_expander
+    reload_query_expander()
+
+
+_RELOADERS = {"sections": _reload_sections, "synonyms": _reload_synonyms}
+
+
+class DataReloader:
+    """
+    Detects changed data files and reloads the singletons derived from them
+
+    A group whose files fail to parse is left on its current data and retried
+    once its files change again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._signatures = {group: file_signature(paths) for group, paths in WATCHED_FILES.items()}
+        self._failed = {}
+        self.reload_count = 0
+        self.last_reload = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    def check(self, force: bool = False) -> Dict[str, bool]:
+        """
+        Reload every group whose files changed since the last reload
+
+        Args:
+            force: Reload all groups even if unchanged
+
+        Returns:
+            {group: reloaded}
+        """
+        reloaded = {}
+        with self._lock:
+            for group, paths in WATCHED_FILES.items():
+                signature = file_signature(paths)
+                if not force and signature in (self._signatures[group], self._failed.get(group)):
+                    reloaded[group] = False
+                    continue
+                started = time.perf_counter()
+                try:
+                    _validate(paths)
+                    _RELOADERS[group]()
+                except Exception as e:
+                    logger.error("Data reload failed, keeping current data", group=group, error=str(e))
+                    self._failed[group] = signature
+                    reloaded[group] = False
+                    continue
+                self._signatures[group] = signature
+                self._failed.pop(group, None)
+                self.reload_count += 1
+                self.last_reload = time.time()
+                reloaded[group] = True
+                logger.info("Data reloaded", group=group, elapsed_ms=round((time.perf_counter() - started) * 1000, 1))
+        return reloaded
+
+    def start(self, interval: float = DATA_RELOAD_INTERVAL):
+        """Poll the data files every interval seconds in a daemon thread (0 disables)"""
+        if interval <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, args=(interval,), name="data-reload", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the polling thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _watch(self, interval: float):
+        while not self._stop.wait(interval):
+            try:
+                self.check()
+            except Exception as e:
+                logger.error("Data watcher check failed", error=str(e))
+
+
+# Singleton instance
+_data_reloader_instance = None
+_instance_lock = threading.Lock()
+
+
+def get_data_reloader() -> DataReloader:
+    """Get or create the Data Reloader instance"""
+    global _data_reloader_instance
+    if _data_reloader_instance is None:
+        with _instance_lock:
+            if _data_reloader_instance is None:
+                _data_reloader_instance = DataReloader()
+    return _data_reloader_instance
+
+
+def reload_data(force: bool = False) -> Dict[str, bool]:
+    """Reload changed (or, with force, all) data files now"""
+    return get_data_reloader().check(force)
@@ -0,0 +1,202 @@
+"""
+Document Extractor Registry
+Sniffs the magic bytes of an upload and dispatches it to exactly one registered extractor
+(images, PDFs with or without a text layer, plain text). New formats can plug in with
+register_extractor().
+"""
+import io
+import os
+import struct
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import pdfplumber
+from PIL import Image, ImageSequence
+
+from .ocr_engine import get_ocr_engine
+from .uploads import mapped_view
+
+SNIFF_BYTES = 2048
+PDF_RENDER_RESOLUTION = 300
+
+# Ordered (name, sniffer, extractor) entries; the first sniffer returning True wins
+_extractors: List[Tuple[str, Callable[[bytes], bool], Callable[[Any], Dict[str, Any]]]] = []
+
+
+def _as_source(file_or_bytes):
+    """Normalise raw bytes to a file object; paths and open files are used as-is."""
+    if isinstance(file_or_bytes, (bytes, bytearray, memoryview)):
+        return io.BytesIO(file_or_bytes)
+    return file_or_bytes
+
+
+def _rewind(source):
+    if hasattr(source, "seek"):
+        source.seek(0)
+
+
+def read_head(source, size: int = SNIFF_BYTES) -> bytes:
+    """First bytes of a path or seekable file, leaving the file rewound"""
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as f:
+            return f.read(size)
+    _rewind(source)
+    head = source.read(size)
+    _rewind(source)
+    return head
+
+
+# ---------------------------------------------------------------------------
+# Sniffers
+# ---------------------------------------------------------------------------
+
+_IMAGE_SIGNATURES = (
+    b"\x89PNG\r\n\x1a\n",   # PNG
+    b"\xff\xd8\xff",        # JPEG
+    b"II*\x00",             # TIFF (little endian)
+    b"MM\x00*",             # TIFF (big endian)
+    b"GIF87a",
+    b"GIF89a",
+)
+
+# Sizes of the known BMP info (DIB) headers: BITMAPCOREHEADER ... BITMAPV5HEADER
+_BMP_DIB_HEADER_SIZES = (12, 40, 52, 56, 64, 108, 124)
+
+
+def _is_bmp(head: bytes) -> bool:
+    """BMP file header with sane fields (plain text starting with "BM" is not an image)"""
+    if len(head) < 18 or not head.startswith(b"BM"):
+        return False
+    file_size, reserved, data_offset, dib_size = struct.unpack("<IIII", head[2:18])
+    return (
+        reserved == 0
+        and dib_size in _BMP_DIB_HEADER_SIZES
+        and 14 + dib_size <= data_offset <= file_size
+    )
+
+
+def is_image(head: bytes) -> bool:
+    if head.startswith(_IMAGE_SIGNATURES) or _is_bmp(head):
+        return True
+    return head[:4] == b"RIFF" and head[8:12] == b"WEBP"
+
+
+def is_pdf(head: bytes) -> bool:
+    # The header must open the file, optionally after a UTF-8 BOM and whitespace
+    if head.startswith(b"\xef\xbb\xbf"):
+        head = head[3:]
+    return head.lstrip(b" \t\r\n\x00\x0c").startswith(b"%PDF-")
+
+
+# ---------------------------------------------------------------------------
+# Extractors
+# ---------------------------------------------------------------------------
+
+def extract_image(source) -> Dict[str, Any]:
+    """OCR every frame of an image (multi-page TIFFs have several)"""
+    engine = get_ocr_engine()
+    with Image.open(source) as img:
+        texts = [engine.image_to_string(frame.copy()) for frame in ImageSequence.Iterator(img)]
+    return {"text": "\n".join(texts), "pages": len(texts)}
+
+
+def extract_pdf(source) -> Dict[str, Any]:
+    """
+    Use the PDF text layer where there is one; render and OCR pages that have none
+
+    Reports mode "text", "scanned" or "mixed" depending on how the pages were read.
+    """
+    engine = get_ocr_engine()
+    texts = []
+    ocr_pages = 0
+    with pdfplumber.open(source) as pdf:
+        for page in pdf.pages:
+            text = page.extract_text() or ""
+            if not text.strip():
+                rendered = page.to_image(resolution=PDF_RENDER_RESOLUTION).original
+                text = engine.image_to_string(rendered)
+                ocr_pages += 1
+            texts.append(text)
+    if ocr_pages == 0:
+        mode = "text"
+    elif ocr_pages == len(texts):
+        mode = "scanned"
+    else:
+        mode = "mixed"
+    return {"text": "\n".join(texts), "pages": len(texts), "mode": mode, "ocr_pages": ocr_pages}
+
+
+def extract_plain_text(source) -> Dict[str, Any]:
+    """Decode as UTF-8, ignoring undecodable bytes; paths are decoded from a memory-mapped view"""
+    if isinstance(source, (str, os.PathLike)):
+        with mapped_view(source) as view:
+            return {"text": str(view, "utf-8", errors="ignore")}
+    return {"text": source.read().decode("utf-8", errors="ignore")}
+
+
+# ---------------------------------------------------------------------------
+# Registry and dispatch
+# ---------------------------------------------------------------------------
+
+def register_extractor(
+    name: str,
+    sniffer: Callable[[bytes], bool],
+    extractor: Callable[[Any], Dict[str, Any]],
+    first: bool = True
+):
+    """
+    Register an extractor for a new format
+
+    Args:
+        name: Format name reported in results
+        sniffer: Receives the first SNIFF_BYTES of the upload, returns True to claim it
+        extractor: Receives a path or rewound binary file, returns a dict with at least "text"
+        first: Check this sniffer before the built-in ones (default) instead of after them
+    """
+    unregister_extractor(name)
+    entry = (name, sniffer, extractor)
+    if first:
+        _extractors.insert(0, entry)
+    else:
+        _extractors.append(entry)
+
+
+def unregister_extractor(name: str):
+    _extractors[:] = [entry for entry in _extractors if entry[0] != name]
+
+
+def sniff_format(head: bytes) -> str:
+    """Name of the first registered format whose sniffer claims these bytes ("text" if none do)"""
+    for name, sniffer, _ in _extractors:
+        if sniffer(head):
+            return name
+    return "text"
+
+
+def extract_document(file_or_bytes) -> Dict[str, Any]:
+    """
+    Extract text from an upload with the single extractor matching its magic bytes
+
+    Accepts raw bytes, a filesystem path or a seekable binary file.
+
+    Returns:
+        Extractor result plus "format", "extractor" and "elapsed_ms"
+    """
+    source = _as_source(file_or_bytes)
+    head = read_head(source)
+    fmt = sniff_format(head)
+    extractor = next((fn for name, _, fn in _extractors if name == fmt), extract_plain_text)
+
+    started = time.perf_counter()
+    _rewind(source)
+    result = extractor(source)
+    result.update({
+        "format": fmt,
+        "extractor": extractor.__name__,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+    })
+    return result
+
+
+register_extractor("image", is_image, extract_image, first=False)
+register_extractor("pdf", is_pdf, extract_pdf, first=False)
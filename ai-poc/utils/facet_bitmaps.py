@@ -0,0 +1,173 @@
+"""
+Facet Bitmaps
+Per facet value (section, court, year) a bitmap of the indexed cases having it, kept
+as a Python int whose bit i is row i of the FAISS metadata. Totals are cached (and
+adjusted rather than recounted on upserts), and counts for any filtered subset are a
+bitwise AND plus a popcount per value, so statistics never iterate over the metadata.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from .section_postings import format_section, normalize_section
+
+FACETS = ("section", "court", "year")
+UNKNOWN = "Unknown"
+
+# Up to this many removed rows are deleted with shifts; more go through a numpy bit array
+_SHIFT_DROP_MAX = 16
+
+if hasattr(int, "bit_count"):
+    _popcount = int.bit_count
+else:  # Python < 3.10
+    def _popcount(bitmap: int) -> int:
+        return bin(bitmap).count("1")
+
+
+class _BitDropper:
+    """Deletes a fixed set of bit positions from bitmaps, shifting the higher bits down"""
+
+    def __init__(self, size: int, removed: Iterable[int]):
+        self.removed_desc = sorted(set(removed), reverse=True)
+        self.mask = 0
+        for position in self.removed_desc:
+            self.mask |= 1 << position
+        # bits below the lowest removed position never move
+        self.lowest = self.removed_desc[-1] if self.removed_desc else size
+        self.keep = None
+        if len(self.removed_desc) > _SHIFT_DROP_MAX:
+            self.keep = np.ones(size - self.lowest, dtype=bool)
+            self.keep[np.array(self.removed_desc) - self.lowest] = False
+
+    def affects(self, bitmap: int) -> bool:
+        return bitmap >> self.lowest != 0
+
+    def drop(self, bitmap: int) -> int:
+        if self.keep is None:
+            for position in self.removed_desc:
+                low = bitmap & ((1 << position) - 1)
+                bitmap = low | ((bitmap >> (position + 1)) << position)
+            return bitmap
+        # one pass over the high part: unpack to bits, keep the survivors, pack again
+        high = bitmap >> self.lowest
+        nbytes = (len(self.keep) + 7) // 8
+        bits = np.unpackbits(np.frombuffer(high.to_bytes(nbytes, "little"), dtype=np.uint8), bitorder="little")
+        packed = np.packbits(bits[:len(self.keep)][self.keep], bitorder="little")
+        low = bitmap & ((1 << self.lowest) - 1)
+        return low | (int.from_bytes(packed.tobytes(), "little") << self.lowest)
+
+
+def facet_values(row: Dict[str, Any]) -> Dict[str, List[Any]]:
+    """Facet values of a metadata row (sections normalised, so "IPC302" counts as "IPC 302")"""
+    return {
+        "section": list(dict.fromkeys(format_section(normalize_section(s)) for s in row.get("sections") or [])),
+        "court": [row.get("court") or UNKNOWN],
+        "year": [row.get("year") or UNKNOWN],
+    }
+
+
+class FacetBitmaps:
+    """
+    Immutable facet value -> case bitmap index over a metadata list
+
+    updated() returns a new instance, so readers always see a consistent
+    snapshot (as with SectionPostings).
+    """
+
+    def __init__(self, size: int, bitmaps: Dict[str, Dict[Any, int]],
+                 totals: Optional[Dict[str, Dict[Any, int]]] = None):
+        self.size = size
+        self._bitmaps = bitmaps
+        self._totals = totals if totals is not None else {
+            facet: {value: _popcount(bitmap) for value, bitmap in values.items()}
+            for facet, values in bitmaps.items()
+        }
+
+    @classmethod
+    def build(cls, rows: Sequence[Dict[str, Any]]) -> "FacetBitmaps":
+        """Bitmaps for every row of a metadata list"""
+        bitmaps = {facet: {} for facet in FACETS}
+        totals = {facet: {} for facet in FACETS}
+        cls._set_rows(rows, 0, bitmaps, totals)
+        return cls(len(rows), bitmaps, totals)
+
+    @staticmethod
+    def _set_rows(rows: Sequence[Dict[str, Any]], start: int,
+                  bitmaps: Dict[str, Dict[Any, int]], totals: Dict[str, Dict[Any, int]]):
+        """Set the bits of rows (positions from start) and count them into totals, in place"""
+        for position, row in enumerate(rows, start):
+            bit = 1 << position
+            for facet, values in facet_values(row).items():
+                facet_bitmaps = bitmaps[facet]
+                facet_totals = totals[facet]
+                for value in values:
+                    facet_bitmaps[value] = facet_bitmaps.get(value, 0) | bit
+                    facet_totals[value] = facet_totals.get(value, 0) + 1
+
+    def updated(self, rows: Sequence[Dict[str, Any]], removed: Iterable[int], added: int) -> "FacetBitmaps":
+        """
+        Bitmaps after an upsert
+
+        Args:
+            rows: New metadata list (old rows minus removed, then the added rows)
+            removed: Old positions that were deleted (later rows shift down)
+            added: Number of rows appended at the end of rows
+        """
+        dropper = _BitDropper(self.size, removed)
+        bitmaps = {}
+        totals = {}
+        for facet, values in self._bitmaps.items():
+            facet_bitmaps = bitmaps[facet] = {}
+            facet_totals = totals[facet] = {}
+            old_totals = self._totals[facet]
+            for value, bitmap in values.items():
+                total = old_totals[value]
+                if dropper.affects(bitmap):
+                    total -= _popcount(bitmap & dropper.mask)
+                    if not total:
+                        continue
+                    bitmap = dropper.drop(bitmap)
+                facet_bitmaps[value] = bitmap
+                facet_totals[value] = total
+        start = len(rows) - added
+        self._set_rows(rows[start:], start, bitmaps, totals)
+        return FacetBitmaps(len(rows), bitmaps, totals)
+
+    def subset(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """Bitmap of the cases matching every {facet: value} filter (all cases without filters)"""
+        bitmap = (1 << self.size) - 1
+        for facet, value in (filters or {}).items():
+            if facet == "section":
+                value = format_section(normalize_section(value))
+            elif facet == "year" and isinstance(value, str) and value.isdigit():
+                value = int(value)
+            bitmap &= self._bitmaps.get(facet, {}).get(value, 0)
+        return bitmap
+
+    def counts(self, facet: str, subset: Optional[int] = None) -> Dict[Any, int]:
+        """Cases per value of a facet, within a subset bitmap if given"""
+        if subset is None:
+            return dict(self._totals[facet])
+        counts = {}
+        for value, bitmap in self._bitmaps[facet].items():
+            count = _popcount(bitmap & subset)
+            if count:
+                counts[value] = count
+        return counts
+
+    def stats(self, filters: Optional[Dict[str, Any]] = None, top_sections: int = 10) -> Dict[str, Any]:
+        """
+        Case counts overall or for a filtered subset
+
+        Returns:
+            {"total_cases", "sections" (top sections), "courts", "years"}
+        """
+        subset = self.subset(filters) if filters else None
+        total = self.size if subset is None else _popcount(subset)
+        sections = self.counts("section", subset)
+        return {
+            "total_cases": total,
+            "sections": dict(sorted(sections.items(), key=lambda x: x[1], reverse=True)[:top_sections]),
+            "courts": self.counts("court", subset),
+            "years": self.counts("year", subset),
+        }
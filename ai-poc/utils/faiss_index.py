@@ -1,8 +1,14 @@
 import os
 import json
+import threading
+from functools import lru_cache
+from typing import NamedTuple
 import faiss
 import numpy as np
-from config import INDEX_PATH, STORAGE_DIR
+from config import INDEX_PATH, STORAGE_DIR, QUERY_EMBEDDING_CACHE_SIZE
+from utils.precedent_fields import backfill_precedent_fields, extract_precedent_fields
+from utils.section_postings import SectionPostings
+from utils.facet_bitmaps import FacetBitmaps
 
 # store meta alongside index
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
@@ -10,8 +16,28 @@ INDEX_FULL_PATH = os.path.join(BASE_DIR, INDEX_PATH)
 META_DIR = os.path.join(BASE_DIR, "storage", "indexes")
 META_PATH = os.path.join(META_DIR, "meta.json")
 
-_index = None
-_meta = None
+
+
+class IndexState(NamedTuple):
+    """The live index with its metadata rows and derived lookups, always swapped as a whole"""
+    index: object
+    meta: list
+    postings: SectionPostings
+    facets: FacetBitmaps
+
+
+_state = None
+_write_lock = threading.Lock()
+
+
+def _publish(index, meta, postings=None, facets=None):
+    """Make a new index state live; readers hold either the old or the new one, never a mix"""
+    global _state
+    _state = IndexState(
+        index, meta,
+        postings if postings is not None else SectionPostings.build(meta),
+        facets if facets is not None else FacetBitmaps.build(meta)
+    )
 
 
 def _ensure_dirs():
@@ -22,8 +48,57 @@ def index_exists():
     return os.path.exists(INDEX_FULL_PATH) and os.path.exists(META_PATH)
 
 
+def _read_extraction(path):
+    """Load an extraction JSON and return (text, meta item), or None if it has nothing to index."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except Exception:
+        return None
+    # heuristic: extraction files have 'extractedText'
+    if not isinstance(data, dict) or 'extractedText' not in data:
+        return None
+    text = data.get('redactedText') or data.get('extractedText') or ''
+    if not text.strip():
+        return None
+    item = {
+        'id': data.get('id'),
+        'caseId': data.get('caseId'),
+        'sourceFile': data.get('sourceFile'),
+        'snippet': text[:400]
+    }
+    # structured precedent columns are parsed here once, not per search hit
+    item.update(extract_precedent_fields(item))
+    return text, item
+
+
+def _write_meta(path, metadata, **dump_kwargs):
+    with open(path, 'w', encoding='utf-8') as mf:
+        json.dump({'items': metadata}, mf, **dump_kwargs)
+
+
+def _save_index_and_meta(index, metadata):
+    """Write both files to temp paths first, then swap them in, so a crash never leaves a half-written file"""
+    index_tmp = f"{INDEX_FULL_PATH}.{os.getpid()}.tmp"
+    meta_tmp = f"{META_PATH}.{os.getpid()}.tmp"
+    try:
+        faiss.write_index(index, index_tmp)
+        _write_meta(meta_tmp, metadata, ensure_ascii=False, indent=2)
+        os.replace(index_tmp, INDEX_FULL_PATH)
+        os.replace(meta_tmp, META_PATH)
+    finally:
+        for tmp_path in (index_tmp, meta_tmp):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
 def build_index(output_dir):
     """Scan extraction JSONs under output_dir and build a FAISS index. Returns number indexed."""
+    with _write_lock:
+        return _build_index(output_dir)
+
+
+def _build_index(output_dir):
     _ensure_dirs()
     docs = []
     ids = []
@@ -36,24 +111,13 @@ def build_index(output_dir):
         path = os.path.join(output_dir, fn)
         if os.path.isdir(path):
             continue
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            # heuristic: extraction files have 'extractedText'
-            if 'extractedText' in data:
-                text = data.get('redactedText') or data.get('extractedText') or ''
-                if not text.strip():
-                    continue
-                docs.append(text)
-                ids.append(data.get('id'))
-                metadata.append({
-                    'id': data.get('id'),
-                    'caseId': data.get('caseId'),
-                    'sourceFile': data.get('sourceFile'),
-                    'snippet': text[:400]
-                })
-        except Exception:
+        record = _read_extraction(path)
+        if record is None:
             continue
+        text, item = record
+        docs.append(text)
+        ids.append(item['id'])
+        metadata.append(item)
 
     if not docs:
         # nothing to index
@@ -63,8 +127,11 @@ def build_index(output_dir):
                 os.remove(INDEX_FULL_PATH)
             except Exception:
                 pass
-        with open(META_PATH, 'w', encoding='utf-8') as mf:
-            json.dump({'items': []}, mf)
+        meta_tmp = f"{META_PATH}.{os.getpid()}.tmp"
+        _write_meta(meta_tmp, [])
+        os.replace(meta_tmp, META_PATH)
+        global _state
+        _state = None
         return 0
 
     # compute embeddings lazily to avoid heavy startup
@@ -81,31 +148,135 @@ def build_index(output_dir):
     index.add(vectors.astype(np.float32))
 
     # save index and meta
-    faiss.write_index(index, INDEX_FULL_PATH)
-
-    with open(META_PATH, 'w', encoding='utf-8') as mf:
-        json.dump({'items': metadata}, mf, ensure_ascii=False, indent=2)
+    _save_index_and_meta(index, metadata)
 
-    # clear cached
-    global _index, _meta
-    _index = None
-    _meta = None
+    # keep the fresh index in memory, with its section posting lists and facets
+    _publish(index, metadata)
 
     return len(docs)
 
 
-def _load_index_and_meta():
-    global _index, _meta
-    if _index is not None and _meta is not None:
-        return _index, _meta
+def upsert_documents(output_dir, extraction_ids):
+    """Embed the given extractions and add them to the existing index, replacing
+    any rows already indexed under the same id. Only the new documents are
+    embedded; falls back to a full build when no index exists yet.
+    Returns the total number of indexed documents.
+
+    Each call copies the live index (so running searches keep their snapshot)
+    and rewrites the index file, both O(indexed documents): pass a whole batch
+    of ids in one call, as the batch endpoint and bulk_ner.py do, rather than
+    calling it once per document."""
+    if not index_exists():
+        return build_index(output_dir)
+
+    records = []
+    for extraction_id in dict.fromkeys(extraction_ids):
+        record = _read_extraction(os.path.join(output_dir, f"{extraction_id}.json"))
+        if record is not None:
+            records.append(record)
+
+    with _write_lock:
+        state = _load_state()
+        meta = state.meta
+        if not records:
+            return len(meta)
+        # modify a copy: searches running on the live index must not see rows vanish mid-query
+        # (one O(N) copy per call, the same order as rewriting the index file below)
+        idx = faiss.clone_index(state.index)
+
+        new_ids = {item['id'] for _, item in records}
+        stale = [i for i, m in enumerate(meta) if m.get('id') in new_ids]
+        if stale:
+            idx.remove_ids(np.array(stale, dtype=np.int64))
+            stale_set = set(stale)
+            meta = [m for i, m in enumerate(meta) if i not in stale_set]
+
+        from utils.embeddings import embed_texts
+        vectors = embed_texts([text for text, _ in records])
+        if vectors.ndim == 1:
+            vectors = vectors.reshape(1, -1)
+        idx.add(vectors.astype(np.float32))
+        meta = meta + [item for _, item in records]
+
+        _save_index_and_meta(idx, meta)
+        _publish(
+            idx, meta,
+            state.postings.updated(meta, stale, len(records)),
+            state.facets.updated(meta, stale, len(records))
+        )
+        return len(meta)
+
+
+def _load_state():
+    """The live IndexState, read from disk on first use"""
+    state = _state
+    if state is not None:
+        return state
     if not os.path.exists(INDEX_FULL_PATH) or not os.path.exists(META_PATH):
         raise FileNotFoundError('Index or meta not found. Run POST /index to build it.')
     idx = faiss.read_index(INDEX_FULL_PATH)
     with open(META_PATH, 'r', encoding='utf-8') as mf:
         meta = json.load(mf).get('items', [])
-    _index = idx
-    _meta = meta
-    return _index, _meta
+    if idx.ntotal != len(meta):
+        print(f"Warning: Index has {idx.ntotal} vectors but meta has {len(meta)} rows; run POST /index to rebuild it")
+    # rows indexed before the structured columns existed are parsed once here
+    backfill_precedent_fields(meta)
+    _publish(idx, meta)
+    return _state
+
+
+def _load_index_and_meta():
+    state = _load_state()
+    return state.index, state.meta
+
+
+def load_index_state():
+    """The live IndexState shared by every reader in this process, or None without an index"""
+    try:
+        return _load_state()
+    except FileNotFoundError:
+        return None
+
+
+def load_section_postings():
+    """Section posting lists of the indexed cases (their .rows is the matching metadata), or None without an index"""
+    state = load_index_state()
+    return state.postings if state is not None else None
+
+
+def load_facets():
+    """Section/court/year facet bitmaps of the indexed cases, or None without an index"""
+    state = load_index_state()
+    return state.facets if state is not None else None
+
+
+@lru_cache(maxsize=QUERY_EMBEDDING_CACHE_SIZE)
+def embed_query(query_text):
+    """Normalized float32 embedding of a query, cached (read-only array; repeated queries skip the model)"""
+    from utils.embeddings import embed_text
+    qv = np.ascontiguousarray(embed_text(query_text), dtype=np.float32)
+    qv.setflags(write=False)
+    return qv
+
+
+def search_above(state, query_text, min_score):
+    """
+    Rows of state whose cosine similarity to query_text is at least min_score
+
+    Uses a range search, so every qualifying row is found without guessing a k.
+    Returns (positions, scores) as numpy arrays, best first.
+    """
+    qv = embed_query(query_text).reshape(1, -1)
+    try:
+        lims, D, I = state.index.range_search(qv, float(min_score))
+        D, I = D[lims[0]:lims[1]], I[lims[0]:lims[1]]
+    except RuntimeError:
+        # index types without range search: rank everything, then cut at min_score
+        D, I = state.index.search(qv, state.index.ntotal)
+        keep = (I[0] >= 0) & (D[0] >= min_score)
+        D, I = D[0][keep], I[0][keep]
+    order = np.argsort(-D, kind="stable")
+    return I[order], D[order]
 
 
 def search_index(query_text, k=5):
@@ -116,10 +287,7 @@ def search_index(query_text, k=5):
         # Graceful degradation: return empty results if index doesn't exist
         return []
     
-    from utils.embeddings import embed_text
-    qv = embed_text(query_text).astype(np.float32)
-    if qv.ndim == 1:
-        qv = qv.reshape(1, -1)
+    qv = embed_query(query_text).reshape(1, -1)
     D, I = idx.search(qv, k)
     results = []
     for score, iid in zip(D[0], I[0]):
@@ -3,16 +3,29 @@ Legal Domain NER (Named Entity Recognition) Model
 Provides enhanced entity extraction for Indian legal documents
 """
 import re
-import json
 import os
-from typing import Dict, List, Any, Optional
-from pathlib import Path
+import time
+from operator import itemgetter
+from typing import Dict, List, Any, Iterable, Iterator, Optional
+
+from config import (
+    NER_BATCH_SIZE, NER_CHUNK_CHARS, NER_ACCURATE_MODEL, NER_FAST_MODEL,
+    NER_LATENCY_BUDGET_MS, NER_ACCURATE_CHARS_PER_SEC, NER_FAST_CHARS_PER_SEC
+)
+from .nlp_models import get_ner_pipeline
+from .ner_chunking import chunked_entities
+from .redaction import apply_spans, literal_spans, pattern_spans
+from .section_index import SectionIndex, get_section_index
 
 # IPC/BNS section patterns
 IPC_PATTERN = re.compile(r"IPC\s*(\d{1,4}[A-Z]?)", re.IGNORECASE)
 BNS_PATTERN = re.compile(r"BNS\s*(\d{1,4}[A-Z]?)", re.IGNORECASE)
 SECTION_PATTERN = re.compile(r"Section\s*(\d{1,4}[A-Z]?)", re.IGNORECASE)
 
+# PII patterns redacted by extract_and_redact
+PHONE_PATTERN = re.compile(r"\b\d{10,13}\b")
+EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+
 # Case citation patterns
 CASE_CITATION_PATTERNS = [
     re.compile(r"\d{4}\s+(?:AIR|SCC|SCR|Cri\.?LJ)\s+\d+", re.IGNORECASE),
@@ -47,51 +60,252 @@ LEGAL_TERMS = [
 ]
 
 
+# Rules of the scanner: (match type, compiled pattern, group holding the value, canonical value).
+# Sections and citations reuse the compiled patterns above unchanged; court names and legal terms
+# are matched as literals (a court pattern using regex syntax stays a regex rule).
+_PLAIN_TEXT = re.compile(r"[\w ]+")
+_LITERALS = (
+    [("court_name", court, None) for court in COURT_PATTERNS if _PLAIN_TEXT.fullmatch(court)]
+    + [("legal_term", term, term) for term in LEGAL_TERMS]
+)
+_REGEX_RULES = (
+    [
+        ("ipc_section", IPC_PATTERN, 1, None),
+        ("bns_section", BNS_PATTERN, 1, None),
+        ("section", SECTION_PATTERN, 1, None),
+    ]
+    + [("case_citation", pattern, None, None) for pattern in CASE_CITATION_PATTERNS]
+    + [("court_name", re.compile(court, re.IGNORECASE), None, None)
+       for court in COURT_PATTERNS if not _PLAIN_TEXT.fullmatch(court)]
+)
+
+
+def _literal_trie(literals: List[str]) -> str:
+    """Alternation of literal strings factored into a character trie (one branch per next character)"""
+    root: Dict = {}
+    for literal in literals:
+        node = root
+        for char in literal:
+            node = node.setdefault(char, {})
+        node[None] = {}
+    
+    def emit(node: Dict) -> str:
+        alternatives = [re.escape(char) + emit(child) for char, child in node.items() if char is not None]
+        if None in node:
+            alternatives.append("")
+        return alternatives[0] if len(alternatives) == 1 else "(?:" + "|".join(alternatives) + ")"
+    
+    return emit(root)
+
+
+# Court names and terms: one trie of the lowercased literals, run over the lowercased text. The
+# trie takes the longest literal at each start, and finditer resumes after it, so the literals a
+# match hides are precomputed from the literal list: those that are its prefixes (same start)
+# and those starting inside it, (offset, literal, whether it may run past the match's end).
+_LITERALS_LOWER = [literal.lower() for _, literal, _ in _LITERALS]
+_LITERAL_FINDER = re.compile(_literal_trie(_LITERALS_LOWER))
+_LITERAL_INDEX = {}
+for _index, _literal in enumerate(_LITERALS_LOWER):
+    _LITERAL_INDEX.setdefault(_literal, _index)
+_AT_START = [
+    tuple(j for j, other in enumerate(_LITERALS_LOWER) if literal.startswith(other))
+    for literal in _LITERALS_LOWER
+]
+_INSIDE = [
+    tuple(
+        (offset, j, len(other) > len(literal) - offset)
+        for offset in range(1, len(literal))
+        for j, other in enumerate(_LITERALS_LOWER)
+        if literal.startswith(other, offset) or other.startswith(literal[offset:])
+    )
+    for literal in _LITERALS_LOWER
+]
+# Per-literal patterns for the rare texts whose length changes when lowercased
+_LITERAL_PATTERNS = [re.compile(re.escape(literal), re.IGNORECASE) for _, literal, _ in _LITERALS]
+
+
+def scan_legal_entities(text: str) -> List[Dict[str, Any]]:
+    """
+    Find sections, case citations, court names and legal terms
+    
+    Court names and legal terms are found in one scan of the lowercased
+    text. Sections and citations keep one finditer per pattern: a combined
+    alternation of them measured slower with Python's re than the separate
+    passes. As with the old per-pattern findall/finditer passes, a rule does
+    not match again inside its own previous match, while different rules may
+    overlap (e.g. "High Court" inside "Delhi High Court").
+    
+    Returns:
+        Matches in text order as dicts with type ("ipc_section", "bns_section",
+        "section", "case_citation", "court_name", "legal_term"), text, value
+        (section number, canonical legal term, or the matched text) and
+        character offsets start/end (end exclusive)
+    """
+    matches = []
+    for kind, rule, value_group, value in _REGEX_RULES:
+        for m in rule.finditer(text):
+            matches.append(_match(kind, text, m.start(), m.end(),
+                                  m.group(value_group).strip() if value_group is not None else value))
+    matches.extend(_scan_literals(text))
+    # stable: at equal starts, rules keep their order
+    matches.sort(key=itemgetter("start"))
+    return matches
+
+
+def _scan_literals(text: str) -> List[Dict[str, Any]]:
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        return [
+            _match(kind, text, m.start(), m.end(), value)
+            for (kind, _, value), pattern in zip(_LITERALS, _LITERAL_PATTERNS)
+            for m in pattern.finditer(text)
+        ]
+    
+    matches = []
+    literal_ends = [0] * len(_LITERALS)
+    
+    def add(i: int, start: int):
+        end = start + len(_LITERALS_LOWER[i])
+        literal_ends[i] = end
+        kind, _, value = _LITERALS[i]
+        matches.append(_match(kind, text, start, end, value))
+    
+    for m in _LITERAL_FINDER.finditer(lowered):
+        start = m.start()
+        longest = _LITERAL_INDEX[m.group()]
+        for i in _AT_START[longest]:
+            if start >= literal_ends[i]:
+                add(i, start)
+        for offset, i, partial in _INSIDE[longest]:
+            position = start + offset
+            if position >= literal_ends[i] and (not partial or lowered.startswith(_LITERALS_LOWER[i], position)):
+                add(i, position)
+    return matches
+
+
+def _match(kind: str, text: str, start: int, end: int, value: Optional[str] = None) -> Dict[str, Any]:
+    matched = text[start:end]
+    return {"type": kind, "text": matched, "value": value or matched, "start": start, "end": end}
+
+
 class LegalNER:
     """Enhanced NER for Indian legal documents"""
     
-    def __init__(self):
-        self.ipc_sections = self._load_sections("ipc_sections.json")
-        self.bns_sections = self._load_sections("bns_sections.json")
+    def __init__(self, section_index: Optional[SectionIndex] = None):
+        self.section_index = section_index or get_section_index()
+        self.ipc_sections = {"sections": list(self.section_index.ipc_sections)}
+        self.bns_sections = {"sections": list(self.section_index.bns_sections)}
         self.spacy_model = None
         self._load_spacy_model()
     
-    def _load_sections(self, filename: str) -> Dict:
-        """Load IPC/BNS section database"""
-        try:
-            data_dir = Path(__file__).parent.parent / "data"
-            file_path = data_dir / filename
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-        except Exception as e:
-            print(f"Warning: Could not load {filename}: {e}")
-        return {"sections": []}
-    
     def _load_spacy_model(self):
-        """Load spaCy model (with fallback)"""
-        try:
-            import spacy
-            # Try to load transformer model first, fallback to small model
-            try:
-                self.spacy_model = spacy.load("en_core_web_trf")
-            except:
-                try:
-                    self.spacy_model = spacy.load("en_core_web_sm")
-                except:
-                    print("Warning: No spaCy model loaded. Install with: python -m spacy download en_core_web_sm")
-                    self.spacy_model = None
-        except ImportError:
-            print("Warning: spaCy not installed")
-            self.spacy_model = None
-    
-    def extract_entities(self, text: str) -> Dict[str, Any]:
+        """Load the accurate and fast tier models from the shared pipeline cache"""
+        self.tier_models = {
+            "accurate": NER_ACCURATE_MODEL,
+            "fast": NER_FAST_MODEL,
+        }
+        self.tiers = {tier: get_ner_pipeline(name) for tier, name in self.tier_models.items()}
+        # Measured throughput (chars/sec) per tier, used to predict latency
+        self.throughput = {"accurate": NER_ACCURATE_CHARS_PER_SEC, "fast": NER_FAST_CHARS_PER_SEC}
+        # Either tier stands in for the other when only one is installed
+        self.spacy_model = self.tiers["accurate"] or self.tiers["fast"]
+        if self.spacy_model is None:
+            print("Warning: No spaCy model loaded. Install with: python -m spacy download en_core_web_sm")
+    
+    def choose_tier(self, text: str, latency_budget_ms: Optional[float] = None) -> Optional[str]:
+        """
+        Pick the model tier for a text
+        
+        The accurate tier is used when its predicted latency fits the budget
+        (NER_LATENCY_BUDGET_MS by default); oversized texts that get chunked
+        always use the fast tier. Returns None when no model is installed.
+        """
+        available = [tier for tier in ("accurate", "fast") if self.tiers[tier] is not None]
+        if len(available) < 2:
+            return available[0] if available else None
+        if len(text) > NER_CHUNK_CHARS:
+            return "fast"
+        budget = NER_LATENCY_BUDGET_MS if latency_budget_ms is None else latency_budget_ms
+        predicted_ms = len(text) / self.throughput["accurate"] * 1000
+        return "accurate" if predicted_ms <= budget else "fast"
+    
+    def _record_throughput(self, tier: str, chars: int, elapsed: float):
+        # Moving average; very short texts are dominated by fixed overhead
+        if chars >= 200 and elapsed > 0:
+            self.throughput[tier] = 0.8 * self.throughput[tier] + 0.2 * (chars / elapsed)
+    
+    def extract_entities(self, text: str, latency_budget_ms: Optional[float] = None) -> Dict[str, Any]:
         """
         Extract all legal entities from text
         
+        Args:
+            text: Document text
+            latency_budget_ms: Latency budget used to pick the model tier
+        
         Returns:
             Dictionary with entity types and extracted entities
         """
+        return self._extract(text, latency_budget_ms)[0]
+    
+    def _extract(self, text: str, latency_budget_ms: Optional[float] = None):
+        """Entities plus a report of the model tier that produced them"""
+        tier = self.choose_tier(text, latency_budget_ms)
+        started = time.perf_counter()
+        ents = self._spacy_entities(text, tier)
+        elapsed = time.perf_counter() - started
+        if tier is not None:
+            self._record_throughput(tier, len(text), elapsed)
+        report = {
+            "tier": tier,
+            "model": self.tier_models[tier] if tier else None,
+            "budget_ms": NER_LATENCY_BUDGET_MS if latency_budget_ms is None else latency_budget_ms,
+            "elapsed_ms": round(elapsed * 1000, 2),
+        }
+        return self._collect_entities(text, ents), report
+    
+    def _spacy_entities(self, text: str, tier: Optional[str]):
+        """spaCy entities of text; texts over NER_CHUNK_CHARS are processed in overlapping chunks"""
+        nlp = self.tiers.get(tier) if tier else None
+        if nlp is None:
+            return None
+        if len(text) > NER_CHUNK_CHARS:
+            return list(chunked_entities(nlp, text))
+        return nlp(text).ents
+    
+    def extract_entities_batch(
+        self,
+        texts: Iterable[str],
+        batch_size: int = NER_BATCH_SIZE,
+        n_process: int = 1
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Extract legal entities from many texts, streaming them through nlp.pipe
+        
+        Bulk work always runs on the fast tier (the accurate one if it is the only model).
+        
+        Args:
+            texts: Any iterable of texts; it is consumed lazily
+            batch_size: Texts per spaCy batch
+            n_process: Worker processes for nlp.pipe (1 = in-process)
+        
+        Returns:
+            Iterator of entity dictionaries in input order
+        """
+        tier = "fast" if self.tiers["fast"] is not None else "accurate"
+        nlp = self.tiers[tier]
+        if nlp is None:
+            for text in texts:
+                yield self._collect_entities(text, None)
+            return
+        
+        # Long texts stand in as "" in the batch and are chunked on their own
+        items = ((text if len(text) <= NER_CHUNK_CHARS else "", text) for text in texts)
+        for doc, text in nlp.pipe(items, as_tuples=True, batch_size=batch_size, n_process=n_process):
+            ents = doc.ents if len(text) <= NER_CHUNK_CHARS else self._spacy_entities(text, tier)
+            yield self._collect_entities(text, ents)
+    
+    def _collect_entities(self, text: str, ents) -> Dict[str, Any]:
+        """Regex/dictionary entities from text plus the given spaCy entities (if any)"""
         entities = {
             "ipc_sections": [],
             "bns_sections": [],
@@ -104,10 +318,12 @@ class LegalNER:
             "locations": []
         }
         
-        # Extract IPC sections
-        ipc_matches = IPC_PATTERN.findall(text)
-        for match in ipc_matches:
-            section_num = match.strip()
+        # One scan finds sections, citations, courts and terms with their offsets
+        matches = scan_legal_entities(text)
+        ipc_matches = [m["value"] for m in matches if m["type"] == "ipc_section"]
+        bns_matches = [m["value"] for m in matches if m["type"] == "bns_section"]
+        
+        for section_num in ipc_matches:
             section_key = f"IPC {section_num}"
             entities["ipc_sections"].append({
                 "section": section_key,
@@ -115,10 +331,7 @@ class LegalNER:
                 "details": self._get_section_details(section_key, "ipc")
             })
         
-        # Extract BNS sections
-        bns_matches = BNS_PATTERN.findall(text)
-        for match in bns_matches:
-            section_num = match.strip()
+        for section_num in bns_matches:
             section_key = f"BNS {section_num}"
             entities["bns_sections"].append({
                 "section": section_key,
@@ -126,37 +339,24 @@ class LegalNER:
                 "details": self._get_section_details(section_key, "bns")
             })
         
-        # Extract generic "Section" mentions
-        section_matches = SECTION_PATTERN.findall(text)
-        for match in section_matches:
-            if not any(match in str(ipc) for ipc in ipc_matches + bns_matches):
+        # Generic "Section" mentions, unless the number was already seen as IPC/BNS
+        for m in matches:
+            if m["type"] == "section" and not any(m["value"] in num for num in ipc_matches + bns_matches):
                 entities["ipc_sections"].append({
-                    "section": f"Section {match}",
-                    "number": match.strip(),
+                    "section": f"Section {m['value']}",
+                    "number": m["value"],
                     "details": None
                 })
-        
-        # Extract case citations
-        for pattern in CASE_CITATION_PATTERNS:
-            citations = pattern.findall(text)
-            entities["case_citations"].extend(citations)
-        
-        # Extract court names
-        for court_pattern in COURT_PATTERNS:
-            matches = re.finditer(court_pattern, text, re.IGNORECASE)
-            for match in matches:
-                entities["court_names"].append(match.group(0))
-        
-        # Extract legal terms
-        text_lower = text.lower()
-        for term in LEGAL_TERMS:
-            if term.lower() in text_lower:
-                entities["legal_terms"].append(term)
+            elif m["type"] == "case_citation":
+                entities["case_citations"].append(m["text"])
+            elif m["type"] == "court_name":
+                entities["court_names"].append(m["text"])
+            elif m["type"] == "legal_term":
+                entities["legal_terms"].append(m["value"])
         
         # Use spaCy for persons, organizations, dates, locations
-        if self.spacy_model:
-            doc = self.spacy_model(text)
-            for ent in doc.ents:
+        if ents is not None:
+            for ent in ents:
                 if ent.label_ == "PERSON":
                     entities["persons"].append(ent.text)
                 elif ent.label_ in ("ORG", "GPE"):
@@ -165,53 +365,50 @@ class LegalNER:
                     entities["dates"].append(ent.text)
                 elif ent.label_ in ("LOC", "GPE"):
                     entities["locations"].append(ent.text)
+                matches.append(_match(ent.label_.lower(), text, ent.start_char, ent.end_char))
         
         # Remove duplicates
         for key in entities:
             if isinstance(entities[key], list) and key not in ["ipc_sections", "bns_sections"]:
                 entities[key] = list(set(entities[key]))
         
+        # Character offsets of every match, in text order
+        entities["offsets"] = sorted(matches, key=lambda m: (m["start"], -m["end"]))
+        
         return entities
     
     def _get_section_details(self, section: str, section_type: str) -> Optional[Dict]:
         """Get details for a specific section"""
-        sections_db = self.ipc_sections if section_type == "ipc" else self.bns_sections
-        
-        for sec in sections_db.get("sections", []):
-            if sec.get("section") == section:
-                return {
-                    "title": sec.get("title"),
-                    "description": sec.get("description"),
-                    "punishment": sec.get("punishment"),
-                    "bailable": sec.get("bailable"),
-                    "cognizable": sec.get("cognizable"),
-                    "category": sec.get("category")
-                }
-        return None
+        sec = self.section_index.by_key(section_type, section)
+        if sec is None:
+            return None
+        return {
+            "title": sec.get("title"),
+            "description": sec.get("description"),
+            "punishment": sec.get("punishment"),
+            "bailable": sec.get("bailable"),
+            "cognizable": sec.get("cognizable"),
+            "category": sec.get("category")
+        }
     
-    def extract_and_redact(self, text: str) -> Dict[str, Any]:
+    def extract_and_redact(self, text: str, latency_budget_ms: Optional[float] = None) -> Dict[str, Any]:
         """
         Extract entities and create redacted version
         
+        Args:
+            text: Document text
+            latency_budget_ms: Latency budget used to pick the model tier
+        
         Returns:
-            Dictionary with entities and redacted text
+            Dictionary with entities, redacted text and the NER tier used
         """
-        entities = self.extract_entities(text)
-        
-        # Create redacted text
-        redacted_text = text
-        
-        # Redact persons
-        for person in entities["persons"]:
-            redacted_text = redacted_text.replace(person, "[REDACTED_PERSON]")
-        
-        # Redact phone numbers
-        phone_pattern = re.compile(r"\b\d{10,13}\b")
-        redacted_text = phone_pattern.sub("[REDACTED_PHONE]", redacted_text)
+        entities, ner_tier = self._extract(text, latency_budget_ms)
         
-        # Redact email addresses
-        email_pattern = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
-        redacted_text = email_pattern.sub("[REDACTED_EMAIL]", redacted_text)
+        # Gather person mentions, phones and emails as spans and rebuild the text once
+        spans = literal_spans(text, entities["persons"], "[REDACTED_PERSON]")
+        spans += pattern_spans(text, PHONE_PATTERN, "[REDACTED_PHONE]")
+        spans += pattern_spans(text, EMAIL_PATTERN, "[REDACTED_EMAIL]")
+        redacted_text = apply_spans(text, spans)
         
         return {
             "entities": entities,
@@ -223,7 +420,8 @@ class LegalNER:
                 "court_names": len(entities["court_names"]),
                 "legal_terms": len(entities["legal_terms"]),
                 "persons": len(entities["persons"])
-            }
+            },
+            "ner_tier": ner_tier
         }
 
 
@@ -236,3 +434,25 @@ def get_legal_ner() -> LegalNER:
     if _legal_ner_instance is None:
         _legal_ner_instance = LegalNER()
     return _legal_ner_instance
+
+
+def reload_legal_ner(section_index: Optional[SectionIndex] = None) -> Optional[LegalNER]:
+    """
+    Build a new Legal NER instance over section_index and swap it in
+
+    Measured tier throughputs carry over. Nothing is built if no instance has
+    been created yet.
+    """
+    global _legal_ner_instance
+    previous = _legal_ner_instance
+    if previous is None:
+        return None
+    legal_ner = LegalNER(section_index)
+    legal_ner.throughput = dict(previous.throughput)
+    _legal_ner_instance = legal_ner
+    return legal_ner
+
+
+def extract_legal_entities(text: str, latency_budget_ms: Optional[float] = None) -> Dict[str, Any]:
+    """Extract legal entities and the redacted text using the shared LegalNER instance"""
+    return get_legal_ner().extract_and_redact(text, latency_budget_ms)
@@ -3,11 +3,20 @@ Multilingual OCR Support
 Supports English, Hindi, and other Indian regional languages
 """
 import os
-from typing import Dict, Any, Optional, List
-from PIL import Image
-import pytesseract
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, Optional, List, Tuple, Union, BinaryIO
+import pdfplumber
+from PIL import Image, ImageSequence
 from pathlib import Path
 
+from config import OCR_TILE_MIN_PIXELS, OCR_TILE_TARGET_PIXELS, OCR_TILE_WORKERS
+from .extractors import PDF_RENDER_RESOLUTION, is_pdf, read_head
+from .ocr_engine import get_ocr_engine
+from .ocr_tiling import plan_tiles, merge_tile_lines
+
 # Language detection
 try:
     from langdetect import detect, DetectorFactory
@@ -47,35 +56,35 @@ LANGUAGE_COMBINATIONS = {
 class MultilingualOCR:
     """Enhanced OCR with multilingual support"""
     
-    def __init__(self):
+    def __init__(self, engine_name: Optional[str] = None):
+        self.engine = get_ocr_engine(engine_name)
         self.available_languages = self._check_available_languages()
+        self.tile_workers = OCR_TILE_WORKERS or os.cpu_count() or 1
+        self._tile_pool = None
+        self._tile_pool_lock = threading.Lock()
     
     def _check_available_languages(self) -> List[str]:
         """Check which Tesseract languages are installed"""
         try:
-            langs = pytesseract.get_languages()
+            langs = self.engine.get_languages()
             return langs
         except Exception as e:
             print(f"Warning: Could not get Tesseract languages: {e}")
             return ["eng"]  # Default to English
     
-    def detect_language(self, image_path: str) -> Optional[str]:
+    def detect_language(self, image: Union[str, Image.Image]) -> Optional[str]:
         """
         Detect the language of text in image using OSD (Orientation and Script Detection)
         
+        Args:
+            image: Path to image file or an already opened PIL image
+        
         Returns:
             Language code (e.g., 'hin', 'eng') or None
         """
         try:
             # First, try script detection
-            osd = pytesseract.image_to_osd(image_path)
-            
-            # Parse script from OSD output
-            script_match = None
-            for line in osd.split('\n'):
-                if 'Script:' in line:
-                    script_match = line.split(':')[1].strip()
-                    break
+            script_match = self.engine.detect_script(image)
             
             # Map script to language
             script_to_lang = {
@@ -138,7 +147,7 @@ class MultilingualOCR:
     
     def extract_text(
         self,
-        image_path: str,
+        image_path: Union[str, BinaryIO],
         language: Optional[str] = None,
         auto_detect: bool = True
     ) -> Dict[str, Any]:
@@ -146,7 +155,7 @@ class MultilingualOCR:
         Extract text from image with multilingual support
         
         Args:
-            image_path: Path to image file
+            image_path: Path to image file, or a seekable binary file (e.g. a spooled upload)
             language: Tesseract language code (e.g., 'eng', 'hin', 'eng+hin')
             auto_detect: Automatically detect language if True
         
@@ -154,63 +163,18 @@ class MultilingualOCR:
             Dictionary with extracted text and metadata
         """
         try:
-            # Load image
+            # Load image (PIL reads lazily from the path or file object)
+            if hasattr(image_path, "seek"):
+                image_path.seek(0)
             image = Image.open(image_path)
             
-            # Auto-detect language if requested
-            detected_lang = None
-            if auto_detect and language is None:
-                detected_lang = self.detect_language(image_path)
-                if detected_lang:
-                    language = detected_lang
-            
-            # Default to English if no language specified
-            if language is None:
-                language = 'eng'
-            
-            # Check if language is available
-            if language not in self.available_languages:
-                # Try with English + detected language
-                if '+' not in language and 'eng' in self.available_languages:
-                    language = f'eng+{language}'
-                else:
-                    print(f"Warning: Language '{language}' not available. Using English.")
-                    language = 'eng'
-            
-            # Perform OCR
-            custom_config = r'--oem 3 --psm 6'
-            text = pytesseract.image_to_string(
-                image,
-                lang=language,
-                config=custom_config
-            )
-            
-            # Get detailed data
-            data = pytesseract.image_to_data(
-                image,
-                lang=language,
-                output_type=pytesseract.Output.DICT
-            )
-            
-            # Calculate confidence
-            confidences = [int(conf) for conf in data['conf'] if int(conf) > 0]
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0
-            
-            # Detect text language if possible
-            text_language = None
-            if LANGDETECT_AVAILABLE:
-                text_language = self.detect_text_language(text)
-            
-            return {
-                "text": text.strip(),
-                "language_used": language,
+            language, detected_lang = self._resolve_language(image, language, auto_detect)
+            result = self._ocr_image(image, language)
+            result.update({
                 "detected_script": detected_lang,
-                "detected_text_language": text_language,
-                "confidence": round(avg_confidence, 2),
                 "available_languages": self.available_languages,
-                "word_count": len(text.split()),
-                "char_count": len(text)
-            }
+            })
+            return result
             
         except Exception as e:
             return {
@@ -219,6 +183,160 @@ class MultilingualOCR:
                 "confidence": 0
             }
     
+    def _resolve_language(
+        self,
+        image: Image.Image,
+        language: Optional[str],
+        auto_detect: bool
+    ) -> Tuple[str, Optional[str]]:
+        """Pick the Tesseract language for an image; returns (language, detected script language)"""
+        # Auto-detect language if requested
+        detected_lang = None
+        if auto_detect and language is None:
+            detected_lang = self.detect_language(image)
+            if detected_lang:
+                language = detected_lang
+        
+        # Default to English if no language specified
+        if language is None:
+            language = 'eng'
+        
+        # Check if language is available
+        if language not in self.available_languages:
+            # Try with English + detected language
+            if '+' not in language and 'eng' in self.available_languages:
+                language = f'eng+{language}'
+            else:
+                print(f"Warning: Language '{language}' not available. Using English.")
+                language = 'eng'
+        
+        return language, detected_lang
+    
+    def _ocr_image(self, image: Image.Image, language: str) -> Dict[str, Any]:
+        """OCR one page image with a resolved language"""
+        # Perform OCR (text plus per-word confidences); oversized scans are tiled
+        tiles_used = 1
+        if image.width * image.height >= OCR_TILE_MIN_PIXELS and self.tile_workers > 1:
+            text, word_confidences, tiles_used = self._recognize_tiled(image, language)
+        else:
+            text, word_confidences = self.engine.recognize(image, lang=language, psm=6)
+        
+        # Calculate confidence
+        confidences = [conf for conf in word_confidences if conf > 0]
+        avg_confidence = sum(confidences) / len(confidences) if confidences else 0
+        
+        # Detect text language if possible
+        text_language = None
+        if LANGDETECT_AVAILABLE:
+            text_language = self.detect_text_language(text)
+        
+        return {
+            "text": text.strip(),
+            "language_used": language,
+            "detected_text_language": text_language,
+            "confidence": round(avg_confidence, 2),
+            "ocr_engine": self.engine.name,
+            "tiles": tiles_used,
+            "word_count": len(text.split()),
+            "char_count": len(text)
+        }
+    
+    def iter_pages(
+        self,
+        source: Union[str, BinaryIO],
+        language: Optional[str] = None,
+        auto_detect: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        OCR a multi-page document, yielding each page's result as soon as it is ready
+        
+        PDFs are read page by page: the text layer is used when a page has one,
+        otherwise the rendered page is OCR'd. Images yield one result per frame
+        (multi-page TIFFs). Language auto-detection runs on the first OCR'd page
+        and is reused for the remaining pages.
+        
+        Yields:
+            Per-page dictionaries with page number, total pages, text and confidence
+        """
+        if is_pdf(read_head(source)):
+            with pdfplumber.open(source) as pdf:
+                total = len(pdf.pages)
+                for number, page in enumerate(pdf.pages, start=1):
+                    started = time.perf_counter()
+                    try:
+                        text = page.extract_text() or ""
+                        if text.strip():
+                            result = {
+                                "text": text.strip(),
+                                "confidence": 100.0,
+                                "source": "text_layer",
+                                "word_count": len(text.split()),
+                                "char_count": len(text)
+                            }
+                        else:
+                            image = page.to_image(resolution=PDF_RENDER_RESOLUTION).original
+                            language, _ = self._resolve_language(image, language, auto_detect)
+                            result = self._ocr_image(image, language)
+                            result["source"] = "ocr"
+                    except Exception as e:
+                        result = {"error": str(e), "text": "", "confidence": 0}
+                    result.update({
+                        "page": number,
+                        "total_pages": total,
+                        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2)
+                    })
+                    yield result
+            return
+        
+        with Image.open(source) as image:
+            total = getattr(image, "n_frames", 1)
+            for number, frame in enumerate(ImageSequence.Iterator(image), start=1):
+                started = time.perf_counter()
+                try:
+                    page_image = frame.copy()
+                    language, _ = self._resolve_language(page_image, language, auto_detect)
+                    result = self._ocr_image(page_image, language)
+                    result["source"] = "ocr"
+                except Exception as e:
+                    result = {"error": str(e), "text": "", "confidence": 0}
+                result.update({
+                    "page": number,
+                    "total_pages": total,
+                    "elapsed_ms": round((time.perf_counter() - started) * 1000, 2)
+                })
+                yield result
+    
+    def _recognize_tiled(self, image: Image.Image, language: str) -> Tuple[str, List[int], int]:
+        """
+        OCR a very large image as overlapping tiles in parallel
+        
+        Tiles are cut along whitespace gutters (see utils/ocr_tiling.py) and
+        recognised concurrently; tesseract runs outside the GIL for both engine
+        backends, so this spreads a single upload across all cores.
+        
+        Returns:
+            (merged text, word confidences, number of tiles)
+        """
+        tiles = min(self.tile_workers, math.ceil(image.width * image.height / OCR_TILE_TARGET_PIXELS))
+        planned = plan_tiles(image, max(2, tiles))
+        image.load()  # decode once up front; concurrent crops must not race on lazy loading
+        
+        def recognize_tile(tile):
+            return self.engine.recognize_lines(image.crop(tile.box), lang=language, psm=6)
+        
+        results = list(self._get_tile_pool().map(recognize_tile, planned))
+        text = merge_tile_lines(planned, [lines for lines, _ in results])
+        confidences = [conf for _, tile_confs in results for conf in tile_confs]
+        return text, confidences, len(planned)
+    
+    def _get_tile_pool(self) -> ThreadPoolExecutor:
+        """Thread pool for tile OCR, created once on first use"""
+        if self._tile_pool is None:
+            with self._tile_pool_lock:
+                if self._tile_pool is None:
+                    self._tile_pool = ThreadPoolExecutor(max_workers=self.tile_workers, thread_name_prefix="ocr-tile")
+        return self._tile_pool
+    
     def extract_text_multilingual(
         self,
         image_path: str,
@@ -280,3 +398,12 @@ def get_multilingual_ocr() -> MultilingualOCR:
     if _multilingual_ocr_instance is None:
         _multilingual_ocr_instance = MultilingualOCR()
     return _multilingual_ocr_instance
+
+
+def extract_text_multilingual(
+    source: Union[str, BinaryIO],
+    language: Optional[str] = None,
+    auto_detect: bool = True
+) -> Dict[str, Any]:
+    """Run multilingual OCR on an image path or seekable file using the shared instance"""
+    return get_multilingual_ocr().extract_text(source, language=language, auto_detect=auto_detect)
@@ -1,47 +1,32 @@
 import re
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, List
+
+from config import NER_BATCH_SIZE
+from utils.nlp_models import get_ner_pipeline
+from utils.redaction import apply_spans, literal_spans, pattern_spans
 
 IPC_REGEX = re.compile(r"IPC\s*\d{1,4}", re.IGNORECASE)
 DATE_REGEX = re.compile(r"\b\d{4}-\d{2}-\d{2}\b")
 PHONE_REGEX = re.compile(r"\b\d{10,13}\b")
 
 
-def _redact_names(text: str, names: list) -> str:
-    redacted = text
-    for name in sorted(set(names), key=len, reverse=True):
-        if not name.strip():
-            continue
-        redacted = re.sub(re.escape(name), "[REDACTED]", redacted)
-    return redacted
+def _doc_names(doc) -> List[str]:
+    return [ent.text for ent in doc.ents if ent.label_ in ("PERSON", "ORG")]
 
 
-def extract_entities(text: str) -> Dict[str, Any]:
-    """Extract simple entities (sections, dates, phones, names) and return
-    a dict with entities and a redacted_text field."""
+def _build_result(text: str, names: List[str]) -> Dict[str, Any]:
+    """Regex entities plus the spaCy names, and the redacted text"""
     entities = {
         "sections": IPC_REGEX.findall(text),
         "dates": DATE_REGEX.findall(text),
         "phones": PHONE_REGEX.findall(text),
-        "names": [],
+        "names": names,
     }
 
-    # Try to use spaCy if installed
-    try:
-        import spacy
-        nlp = spacy.load("en_core_web_sm")
-        doc = nlp(text)
-        names = [ent.text for ent in doc.ents if ent.label_ in ("PERSON", "ORG")]
-        entities["names"] = names
-    except Exception:
-        # spaCy not available or model not installed; skip names
-        entities["names"] = []
-
-    # Create redacted text by replacing phones and names
-    redacted = text
-    for phone in entities["phones"]:
-        redacted = redacted.replace(phone, "[REDACTED_PHONE]")
-
-    redacted = _redact_names(redacted, entities.get("names", []))
+    # Redact phones and every mention of a detected name in one pass over the text
+    spans = pattern_spans(text, PHONE_REGEX, "[REDACTED_PHONE]")
+    spans += literal_spans(text, names, "[REDACTED]")
+    redacted = apply_spans(text, spans)
 
     result = {
         "entities": entities,
@@ -50,3 +35,48 @@ def extract_entities(text: str) -> Dict[str, Any]:
     }
     return result
 
+
+def extract_entities(text: str) -> Dict[str, Any]:
+    """Extract simple entities (sections, dates, phones, names) and return
+    a dict with entities and a redacted_text field."""
+    names = []
+
+    # Use the cached spaCy pipeline if spaCy and the model are installed
+    nlp = get_ner_pipeline()
+    if nlp is not None:
+        try:
+            names = _doc_names(nlp(text))
+        except Exception:
+            # e.g. text longer than nlp.max_length; skip names
+            names = []
+
+    return _build_result(text, names)
+
+
+def extract_entities_bulk(
+    texts: Iterable[str],
+    batch_size: int = NER_BATCH_SIZE,
+    n_process: int = 1
+) -> Iterator[Dict[str, Any]]:
+    """
+    Bulk counterpart of extract_entities that streams texts through nlp.pipe
+
+    Args:
+        texts: Any iterable of texts; it is consumed lazily
+        batch_size: Texts per spaCy batch
+        n_process: Worker processes for nlp.pipe (1 = in-process)
+
+    Returns:
+        Iterator of results in input order, same shape as extract_entities()
+    """
+    nlp = get_ner_pipeline()
+    if nlp is None:
+        for text in texts:
+            yield _build_result(text, [])
+        return
+
+    # Texts spaCy would reject get no names, like the single-document path;
+    # the original text rides along as the context of each pipe item
+    items = ((text if len(text) <= nlp.max_length else "", text) for text in texts)
+    for doc, text in nlp.pipe(items, as_tuples=True, batch_size=batch_size, n_process=n_process):
+        yield _build_result(text, _doc_names(doc))
@@ -0,0 +1,140 @@
+"""
+Chunked NER for Long Documents
+Splits long texts at paragraph or sentence boundaries with a small overlap, runs the
+chunks through nlp.pipe (in-process by default) and maps entities back to
+document offsets. Each entity comes from a chunk that sees it whole: views cut off
+at a chunk boundary are dropped, and so are duplicates found twice in an overlap
+"""
+import os
+import re
+from typing import Iterator, List, NamedTuple
+
+from config import NER_CHUNK_CHARS, NER_CHUNK_OVERLAP, NER_CHUNK_WORKERS
+
+# Preferred cut points, best first: blank line, line break, sentence end, any whitespace
+_BOUNDARIES = [re.compile(r"\n\s*\n"), re.compile(r"\n"), re.compile(r"[.!?]\s"), re.compile(r"\s")]
+
+
+class Entity(NamedTuple):
+    """spaCy-like entity with document-level character offsets"""
+    text: str
+    label_: str
+    start_char: int
+    end_char: int
+
+
+def _cut_point(text: str, start: int, limit: int) -> int:
+    """Last boundary in the second half of text[start:limit], or limit if there is none"""
+    window_start = start + (limit - start) // 2
+    for boundary in _BOUNDARIES:
+        last = None
+        for last in boundary.finditer(text, window_start, limit):
+            pass
+        if last is not None:
+            return last.end()
+    return limit
+
+
+class Chunk(NamedTuple):
+    """Span of the text parsed as one chunk"""
+    start: int
+    end: int
+    # Entities touching a cut may be truncated: first non-space character (-1 for the
+    # first chunk) and end of the last one (past the text for the last chunk)
+    lead: int
+    trail: int
+
+    def sees_whole(self, start_char: int, end_char: int) -> bool:
+        """Whether an entity (document offsets) found in this chunk cannot have been cut off"""
+        return self.lead < start_char and end_char < self.trail
+
+
+def chunk_text(
+    text: str,
+    max_chars: int = NER_CHUNK_CHARS,
+    overlap: int = NER_CHUNK_OVERLAP
+) -> List[Chunk]:
+    """
+    Plan chunks of at most max_chars characters, cut at natural boundaries
+
+    Each chunk after the first starts `overlap` characters before the previous
+    cut (moved forward to the next whitespace), so an entity shorter than the
+    overlap lies inside one of the two chunks without touching its cuts.
+
+    Returns:
+        Chunks in text order
+    """
+    if len(text) <= max_chars:
+        return [Chunk(0, len(text), -1, len(text) + 1)]
+
+    overlap = min(overlap, max_chars // 4)
+    spans = []
+    start = 0
+    while True:
+        if len(text) - start <= max_chars:
+            spans.append((start, len(text)))
+            break
+        cut = _cut_point(text, start, start + max_chars)
+        spans.append((start, cut))
+        next_start = max(start + 1, cut - overlap)
+        space = _BOUNDARIES[-1].search(text, next_start, cut)
+        start = space.end() if space is not None else next_start
+
+    chunks = []
+    for i, (start, end) in enumerate(spans):
+        chunk = text[start:end]
+        lead = -1 if i == 0 else end - len(chunk.lstrip())
+        trail = len(text) + 1 if i == len(spans) - 1 else start + len(chunk.rstrip())
+        chunks.append(Chunk(start, end, lead, trail))
+    return chunks
+
+
+def chunked_entities(
+    nlp,
+    text: str,
+    max_chars: int = NER_CHUNK_CHARS,
+    overlap: int = NER_CHUNK_OVERLAP,
+    workers: int = NER_CHUNK_WORKERS,
+    batch_size: int = 4
+) -> Iterator[Entity]:
+    """
+    Run NER over a long text chunk by chunk
+
+    Chunks are generated lazily and each parsed Doc is dropped as soon as its
+    entities are read, so at most a batch of Docs is alive at once (the text
+    and the entities found are still held in full).
+
+    Args:
+        nlp: spaCy pipeline
+        text: Full document text
+        max_chars: Maximum chunk length (kept below nlp.max_length)
+        overlap: Characters shared by neighbouring chunks
+        workers: nlp.pipe processes; 1 (default) runs in-process. More processes
+            (0 = one per CPU core) start a worker pool per call, which forks the
+            server process and ships the model to each worker, so keep it for
+            offline jobs, not request handlers
+        batch_size: Chunks per nlp.pipe batch
+
+    Returns:
+        Iterator of entities in document order with document offsets. Entities
+        at least as long as the overlap may be dropped when they cross a cut
+    """
+    max_chars = min(max_chars, nlp.max_length)
+    chunks = chunk_text(text, max_chars, overlap)
+    n_process = workers or os.cpu_count() or 1
+    n_process = max(1, min(n_process, len(chunks)))
+
+    items = ((text[chunk.start:chunk.end], chunk) for chunk in chunks)
+    previous = set()
+    for doc, chunk in nlp.pipe(items, as_tuples=True, batch_size=batch_size, n_process=n_process):
+        reported = set()
+        for ent in doc.ents:
+            start_char = ent.start_char + chunk.start
+            end_char = ent.end_char + chunk.start
+            # Entities touching a cut are reported by the neighbouring chunk that sees them
+            # whole; one seen whole by both (inside the overlap) only by the first
+            key = (start_char, end_char, ent.label_)
+            if chunk.sees_whole(start_char, end_char) and key not in previous:
+                reported.add(key)
+                yield Entity(ent.text, ent.label_, start_char, end_char)
+        previous = reported
@@ -0,0 +1,44 @@
+"""
+Shared spaCy Pipeline Cache
+Loads each spaCy model once per process with the components entity recognition
+does not need excluded, so NER calls never pay for a model load
+"""
+import threading
+from typing import Iterable, Optional
+
+from config import NER_MODEL
+
+# Components never used by our NER code; excluded pipes are not even loaded from disk
+NER_EXCLUDED_COMPONENTS = ["parser", "tagger", "lemmatizer", "attribute_ruler", "morphologizer", "senter"]
+
+_pipelines = {}
+_lock = threading.Lock()
+
+
+def get_ner_pipeline(model_name: Optional[str] = None):
+    """
+    Get the cached NER-only pipeline for a spaCy model
+
+    Returns:
+        spaCy Language object, or None if spaCy or the model is not installed
+        (failed loads are cached too so they are not retried on every call)
+    """
+    model_name = model_name or NER_MODEL
+    nlp = _pipelines.get(model_name)
+    if nlp is not None or model_name in _pipelines:
+        return nlp
+    with _lock:
+        if model_name not in _pipelines:
+            try:
+                import spacy
+                _pipelines[model_name] = spacy.load(model_name, exclude=NER_EXCLUDED_COMPONENTS)
+            except Exception as e:
+                print(f"Warning: Could not load spaCy model '{model_name}': {e}")
+                _pipelines[model_name] = None
+        return _pipelines[model_name]
+
+
+def preload_ner_pipelines(model_names: Optional[Iterable[str]] = None):
+    """Load pipelines up front (e.g. at service startup) so the first request is not slow"""
+    for name in model_names or [NER_MODEL]:
+        get_ner_pipeline(name)
@@ -1,33 +1,15 @@
-from PIL import Image
-import pytesseract
-import io
-import pdfplumber
+from utils.extractors import extract_document
 
 
-def image_to_text(file_bytes: bytes) -> str:
-    """Run OCR on image bytes or extract text from a PDF. Returns extracted text."""
-    # Try image OCR first
-    try:
-        img = Image.open(io.BytesIO(file_bytes))
-        text = pytesseract.image_to_string(img)
-        if text and text.strip():
-            return text
-    except Exception:
-        pass
-
-    # Try PDF text extraction
-    try:
-        with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
-            pages = [p.extract_text() or "" for p in pdf.pages]
-            text = "\n".join(pages)
-            if text.strip():
-                return text
-    except Exception:
-        pass
+def image_to_text(file_or_bytes) -> str:
+    """Run OCR on an image or extract text from a PDF. Returns extracted text.
 
-    # Fallback: try plain text decode
+    Accepts raw bytes, a filesystem path or a seekable binary file. The format
+    is sniffed from its magic bytes and handled by a single extractor (see
+    utils/extractors.py); use extract_document() directly for the format and
+    timing details.
+    """
     try:
-        return file_bytes.decode("utf-8", errors="ignore")
+        return extract_document(file_or_bytes)["text"]
     except Exception:
         return ""
-
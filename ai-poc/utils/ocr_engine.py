@@ -0,0 +1,216 @@
+"""
+OCR Engine Backends
+Pluggable Tesseract backends selected through config.OCR_ENGINE:
+
+- "pytesseract": spawns a tesseract process per call (default, no extra dependency)
+- "tesserocr": keeps initialised in-process API handles, one per worker thread and
+  language set (at most TESSEROCR_HANDLES_PER_THREAD per thread), and feeds them
+  in-memory PIL images
+"""
+import threading
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import pytesseract
+from PIL import Image
+
+from config import OCR_ENGINE, TESSEROCR_HANDLES_PER_THREAD
+
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+
+class OcrLine(NamedTuple):
+    """A recognised text line and its bounding box in image pixels"""
+    text: str
+    left: int
+    top: int
+    right: int
+    bottom: int
+    paragraph_start: bool
+
+
+class PytesseractEngine:
+    """Subprocess-per-call backend built on pytesseract"""
+
+    name = "pytesseract"
+
+    def get_languages(self) -> List[str]:
+        return pytesseract.get_languages()
+
+    def image_to_string(self, image: Image.Image, lang: str = "eng", psm: Optional[int] = None) -> str:
+        config = f"--oem 3 --psm {psm}" if psm is not None else ""
+        return pytesseract.image_to_string(image, lang=lang, config=config)
+
+    def word_confidences(self, image: Image.Image, lang: str = "eng") -> List[int]:
+        data = pytesseract.image_to_data(image, lang=lang, output_type=pytesseract.Output.DICT)
+        return [int(float(conf)) for conf in data["conf"]]
+
+    def recognize(self, image: Image.Image, lang: str = "eng", psm: Optional[int] = None) -> Tuple[str, List[int]]:
+        """Return (text, word confidences); two tesseract runs with this backend"""
+        return self.image_to_string(image, lang=lang, psm=psm), self.word_confidences(image, lang=lang)
+
+    def recognize_lines(self, image: Image.Image, lang: str = "eng",
+                        psm: Optional[int] = None) -> Tuple[List[OcrLine], List[int]]:
+        """Return (text lines with boxes, word confidences) from a single tesseract run"""
+        config = f"--oem 3 --psm {psm}" if psm is not None else ""
+        data = pytesseract.image_to_data(image, lang=lang, config=config, output_type=pytesseract.Output.DICT)
+        grouped: Dict[Tuple[int, int, int], List[int]] = {}
+        for i, word in enumerate(data["text"]):
+            if data["level"][i] == 5 and str(word).strip():
+                grouped.setdefault((data["block_num"][i], data["par_num"][i], data["line_num"][i]), []).append(i)
+        lines = []
+        previous_paragraph = None
+        for (block, paragraph, _), words in grouped.items():
+            lines.append(OcrLine(
+                text=" ".join(str(data["text"][i]).strip() for i in words),
+                left=min(data["left"][i] for i in words),
+                top=min(data["top"][i] for i in words),
+                right=max(data["left"][i] + data["width"][i] for i in words),
+                bottom=max(data["top"][i] + data["height"][i] for i in words),
+                paragraph_start=(block, paragraph) != previous_paragraph,
+            ))
+            previous_paragraph = (block, paragraph)
+        return lines, [int(float(conf)) for conf in data["conf"]]
+
+    def detect_script(self, image: Image.Image) -> Optional[str]:
+        osd = pytesseract.image_to_osd(image)
+        for line in osd.split('\n'):
+            if 'Script:' in line:
+                return line.split(':')[1].strip()
+        return None
+
+
+class TesserocrEngine:
+    """
+    In-process backend that reuses initialised tesserocr API handles
+
+    Handles are only ever used and released by the thread that created them;
+    each thread keeps its most recently used (lang, psm) handles and ends the
+    oldest beyond max_handles_per_thread.
+    """
+
+    name = "tesserocr"
+
+    def __init__(self, max_handles_per_thread: int = TESSEROCR_HANDLES_PER_THREAD):
+        self.max_handles_per_thread = max(1, max_handles_per_thread)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._live_handles = set()
+
+    def _api(self, lang: str, psm: Optional[int]) -> "tesserocr.PyTessBaseAPI":
+        """Get this thread's handle for (lang, psm), initialising it on first use"""
+        handles: Dict[Tuple[str, int], "tesserocr.PyTessBaseAPI"] = getattr(self._local, "handles", None)
+        if handles is None:
+            handles = self._local.handles = OrderedDict()
+        key = (lang, psm if psm is not None else tesserocr.PSM.AUTO)
+        api = handles.get(key)
+        if api is not None:
+            handles.move_to_end(key)
+            return api
+        while len(handles) >= self.max_handles_per_thread:
+            _, oldest = handles.popitem(last=False)
+            with self._lock:
+                self._live_handles.discard(oldest)
+            oldest.End()
+        api = tesserocr.PyTessBaseAPI(lang=lang, psm=key[1])
+        handles[key] = api
+        with self._lock:
+            self._live_handles.add(api)
+        return api
+
+    def get_languages(self) -> List[str]:
+        _, languages = tesserocr.get_languages()
+        return languages
+
+    def recognize(self, image: Image.Image, lang: str = "eng", psm: Optional[int] = None) -> Tuple[str, List[int]]:
+        """Return (text, word confidences) from a single recognition pass"""
+        api = self._api(lang, psm)
+        try:
+            api.SetImage(image)
+            text = api.GetUTF8Text()
+            confidences = list(api.AllWordConfidences())
+        finally:
+            api.Clear()
+        return text, confidences
+
+    def recognize_lines(self, image: Image.Image, lang: str = "eng",
+                        psm: Optional[int] = None) -> Tuple[List[OcrLine], List[int]]:
+        """Return (text lines with boxes, word confidences) from a single recognition pass"""
+        api = self._api(lang, psm)
+        level = tesserocr.RIL.TEXTLINE
+        lines = []
+        try:
+            api.SetImage(image)
+            api.Recognize()
+            confidences = list(api.AllWordConfidences())
+            iterator = api.GetIterator()
+            if iterator is not None:
+                for item in tesserocr.iterate_level(iterator, level):
+                    text = item.GetUTF8Text(level)
+                    box = item.BoundingBox(level)
+                    if text and text.strip() and box:
+                        lines.append(OcrLine(text.strip(), *box, item.IsAtBeginningOf(tesserocr.RIL.PARA)))
+        finally:
+            api.Clear()
+        return lines, confidences
+
+    def image_to_string(self, image: Image.Image, lang: str = "eng", psm: Optional[int] = None) -> str:
+        return self.recognize(image, lang=lang, psm=psm)[0]
+
+    def word_confidences(self, image: Image.Image, lang: str = "eng") -> List[int]:
+        return self.recognize(image, lang=lang)[1]
+
+    def detect_script(self, image: Image.Image) -> Optional[str]:
+        api = self._api("osd", tesserocr.PSM.OSD_ONLY)
+        try:
+            api.SetImage(image)
+            osd = api.DetectOrientationScript()
+        finally:
+            api.Clear()
+        return osd.get("script_name") if osd else None
+
+    def close(self):
+        """
+        Release every handle created by any thread
+
+        Only call at shutdown, once no request is running: the handles belong
+        to other threads and must not be ended while they recognise.
+        """
+        with self._lock:
+            handles, self._live_handles = self._live_handles, set()
+        for api in handles:
+            api.End()
+        self._local = threading.local()
+
+
+# Engine instances, one per backend name
+_engines = {}
+_engines_lock = threading.Lock()
+
+def get_ocr_engine(name: Optional[str] = None):
+    """Get the configured OCR engine, falling back to pytesseract if tesserocr is missing"""
+    name = (name or OCR_ENGINE).lower()
+    with _engines_lock:
+        if name not in _engines:
+            if name == "tesserocr" and TESSEROCR_AVAILABLE:
+                _engines[name] = TesserocrEngine()
+            else:
+                if name == "tesserocr":
+                    print("Warning: tesserocr not installed. Falling back to pytesseract engine.")
+                _engines[name] = PytesseractEngine()
+        return _engines[name]
+
+
+def close_ocr_engines():
+    """Release the resources of every engine created so far (application shutdown only)"""
+    with _engines_lock:
+        engines = list(_engines.values())
+        _engines.clear()
+    for engine in engines:
+        close = getattr(engine, "close", None)
+        if close is not None:
+            close()
@@ -0,0 +1,155 @@
+"""
+Tile Planning for Oversized Scans
+Splits very large page images into overlapping tiles along whitespace gutters so they
+can be OCR'd in parallel, and merges the recognised lines back in reading order
+"""
+import math
+from typing import List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+# Tuning constants (pixels are measured on the full-resolution image)
+PROFILE_MAX_SIDE = 2000      # downsample so the ink profile is computed on at most this many pixels per side
+INK_THRESHOLD = 128          # grayscale values below this count as ink
+GUTTER_MAX_INK = 0.002       # a row/column with at most this fraction of ink is whitespace
+MIN_GUTTER = 12              # minimum whitespace run (in px) that counts as a gutter
+TILE_OVERLAP = 48            # overlap added on both sides of every cut
+COLUMN_MIN_ASPECT = 1.2      # only look for a column split on images wider than tall by this factor
+
+Box = Tuple[int, int, int, int]
+
+
+class Tile(NamedTuple):
+    """A tile to OCR (box, including the overlap) and the region it owns (box without the overlap)"""
+    box: Box
+    own: Box
+
+
+def _ink_mask(image: Image.Image) -> Tuple[np.ndarray, int]:
+    """Return a downsampled boolean ink mask and the downsampling factor"""
+    factor = max(1, math.ceil(max(image.size) / PROFILE_MAX_SIDE))
+    small = image.reduce(factor) if factor > 1 else image
+    gray = np.asarray(small.convert("L"))
+    return gray < INK_THRESHOLD, factor
+
+
+def find_gutters(ink_profile: np.ndarray, span: int, min_run: int) -> List[Tuple[int, int]]:
+    """
+    Find whitespace runs in an ink profile
+
+    Args:
+        ink_profile: Ink pixel count per row (or column)
+        span: Number of pixels each profile entry was summed over
+        min_run: Minimum run length to report
+
+    Returns:
+        List of (start, end) index pairs, end exclusive
+    """
+    blank = ink_profile <= max(1, span * GUTTER_MAX_INK)
+    # Pad so runs touching either edge are closed off
+    edges = np.diff(np.concatenate(([0], blank.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return [(int(s), int(e)) for s, e in zip(starts, ends) if e - s >= min_run]
+
+
+def plan_cuts(length: int, gutters: List[Tuple[int, int]], parts: int) -> List[int]:
+    """
+    Choose up to parts-1 cut positions, snapping each to the nearest gutter centre
+
+    Positions with no gutter within half a part of the ideal cut fall back to
+    the ideal position; the tile overlap then keeps split lines readable.
+    """
+    if parts <= 1:
+        return []
+    step = length / parts
+    centres = [(s + e) // 2 for s, e in gutters if 0 < s and e < length]
+    cuts = []
+    for i in range(1, parts):
+        ideal = int(i * step)
+        nearby = [c for c in centres if abs(c - ideal) <= step / 2]
+        cut = min(nearby, key=lambda c: abs(c - ideal)) if nearby else ideal
+        if not cuts or cut > cuts[-1]:
+            cuts.append(cut)
+    return cuts
+
+
+def _spans(length: int, cuts: List[int]) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    """(span with overlap, owned span) per part between cuts"""
+    bounds = [0] + cuts + [length]
+    return [
+        ((max(0, start - TILE_OVERLAP), min(length, end + TILE_OVERLAP)), (start, end))
+        for start, end in zip(bounds, bounds[1:])
+    ]
+
+
+def plan_tiles(image: Image.Image, tiles: int) -> List[Tile]:
+    """
+    Plan roughly `tiles` overlapping tiles in reading order
+
+    Wide images (e.g. two pages stitched side by side) are first split into
+    columns at a full-height vertical gutter; each column is then cut into
+    horizontal bands at whitespace rows. Tiles are ordered column by column,
+    top to bottom; their owned regions partition the image.
+    """
+    width, height = image.size
+    mask, factor = _ink_mask(image)
+    min_run = max(1, MIN_GUTTER // factor)
+
+    columns = [((0, width), (0, width))]
+    if width >= height * COLUMN_MIN_ASPECT:
+        col_gutters = find_gutters(mask.sum(axis=0), mask.shape[0], min_run)
+        col_cuts = [c * factor for c in plan_cuts(mask.shape[1], col_gutters, 2)]
+        if col_cuts and any(s * factor < col_cuts[0] < e * factor for s, e in col_gutters):
+            columns = _spans(width, col_cuts)
+
+    bands_per_column = max(1, round(tiles / len(columns)))
+    planned = []
+    for (left, right), (own_left, own_right) in columns:
+        sub = mask[:, left // factor:max(left // factor + 1, right // factor)]
+        row_gutters = find_gutters(sub.sum(axis=1), sub.shape[1], min_run)
+        row_cuts = [c * factor for c in plan_cuts(mask.shape[0], row_gutters, bands_per_column)]
+        for (top, bottom), (own_top, own_bottom) in _spans(height, row_cuts):
+            planned.append(Tile((left, top, right, bottom), (own_left, own_top, own_right, own_bottom)))
+    return planned
+
+
+def merge_tile_lines(tiles: Sequence[Tile], tile_lines: Sequence[Sequence]) -> str:
+    """
+    Join the lines recognised in each tile in reading order
+
+    A line read inside the overlap of two tiles is kept only by the tile whose
+    owned region contains the line's centre, so overlap duplicates are dropped
+    by position while lines that genuinely repeat are kept. Paragraph breaks
+    (and column changes) become blank lines; the first line of a tile always
+    starts a paragraph for tesseract, so there the vertical gap to the line
+    above decides instead.
+
+    Args:
+        tiles: Planned tiles, in reading order
+        tile_lines: Per tile, its lines (OcrLine) with boxes relative to the tile
+    """
+    merged: List[str] = []
+    previous_column = None
+    previous_bottom = None
+    for tile, lines in zip(tiles, tile_lines):
+        left, top = tile.box[0], tile.box[1]
+        own_left, own_top, own_right, own_bottom = tile.own
+        column = (own_left, own_right)
+        new_column = previous_column is not None and column != previous_column
+        previous_column = column
+        for position, line in enumerate(lines):
+            centre_x = left + (line.left + line.right) / 2
+            centre_y = top + (line.top + line.bottom) / 2
+            if not (own_left <= centre_x < own_right and own_top <= centre_y < own_bottom):
+                continue
+            paragraph_start = line.paragraph_start
+            if position == 0 and previous_bottom is not None and not new_column:
+                paragraph_start = top + line.top - previous_bottom > line.bottom - line.top
+            if merged and (paragraph_start or new_column):
+                merged.append("")
+            new_column = False
+            previous_bottom = top + line.bottom
+            merged.append(line.text)
+    return "\n".join(merged)
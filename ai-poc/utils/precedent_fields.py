@@ -0,0 +1,62 @@
+"""
+Structured Precedent Fields
+Title, sections, court, year and description of an indexed case, parsed from its
+snippet once when the case is indexed and stored as typed columns on its metadata
+row, so building a search result is a plain lookup
+"""
+import re
+from typing import Any, Dict, List, Optional
+
+# Bump when the parsing below changes; rows carrying an older version are re-parsed on load
+FIELDS_VERSION = 1
+
+_SECTION_PATTERN = re.compile(r'(?:IPC|BNS)\s*\d+')
+_YEAR_PATTERN = re.compile(r'20\d{2}')
+
+
+def _title_from_snippet(snippet: str) -> str:
+    if "Nature of Offence:" in snippet:
+        return snippet.split("Nature of Offence:")[-1].split('\n')[0].strip()
+    if "FIR Number:" in snippet:
+        return snippet.split("FIR Number:")[-1].split('\n')[0].strip()
+    return snippet[:100] + "..."
+
+
+def _court_from_snippet(snippet: str) -> Optional[str]:
+    for line in snippet.split('\n'):
+        if "Police Station:" in line:
+            return line.split("Police Station:")[-1].strip()
+    return None
+
+
+def extract_precedent_fields(item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Parse the structured fields of a metadata row from its snippet
+
+    Sections, court and year found in the snippet win over values already on
+    the row; an existing row title wins over one derived from the snippet.
+
+    Returns:
+        {"title": str, "description": str, "sections": List[str],
+         "court": str, "year": Optional[int], "fieldsVersion": int}
+    """
+    snippet = item.get("snippet") or ""
+    # Unique sections in order of first mention
+    sections: List[str] = list(dict.fromkeys(_SECTION_PATTERN.findall(snippet)))
+    year = _YEAR_PATTERN.search(snippet)
+    return {
+        "title": item.get("title") or _title_from_snippet(snippet),
+        "description": snippet[:300] + ("..." if len(snippet) > 300 else ""),
+        "sections": sections or item.get("sections", []),
+        "court": _court_from_snippet(snippet) or item.get("court", ""),
+        "year": int(year.group()) if year else item.get("year"),
+        "fieldsVersion": FIELDS_VERSION,
+    }
+
+
+def backfill_precedent_fields(items: List[Dict[str, Any]]) -> int:
+    """Add missing or outdated structured fields to metadata rows; returns how many were parsed"""
+    stale = [item for item in items if item.get("fieldsVersion") != FIELDS_VERSION]
+    for item in stale:
+        item.update(extract_precedent_fields(item))
+    return len(stale)
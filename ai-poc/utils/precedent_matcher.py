@@ -1,49 +1,43 @@
 """
 Precedent Matcher - Find similar cases using FAISS semantic search
 """
-import os
-import json
 from typing import Dict, List, Any, Optional
-from pathlib import Path
+from config import PRECEDENT_MIN_SIMILARITY
+from .faiss_index import load_facets, load_index_state, load_section_postings, search_above
+from .section_postings import normalize_section, section_keys
+
+
+def precedent_result(case_meta: Dict[str, Any], similarity: float) -> Dict[str, Any]:
+    """Search result for a metadata row carrying the structured precedent fields"""
+    return {
+        "case_id": case_meta.get("id"),
+        "title": case_meta["title"] or case_meta.get("sourceFile", "Unknown Case"),
+        "description": case_meta["description"],
+        "sections": case_meta["sections"],
+        "year": case_meta["year"],
+        "court": case_meta["court"],
+        "similarity": round(similarity, 3),
+        "file_path": case_meta.get("file_path") or case_meta.get("sourceFile")
+    }
 
 
 class PrecedentMatcher:
     """Find similar cases and precedents using semantic search"""
     
     def __init__(self):
-        self.faiss_index = None
-        self.embeddings_model = None
-        self.metadata = []
-        self.min_similarity_threshold = 0.35  # Minimum 35% similarity
-        self._load_models()
+        self.min_similarity_threshold = PRECEDENT_MIN_SIMILARITY  # Minimum cosine similarity
     
-    def _load_models(self):
-        """Load FAISS index and embedding model"""
-        try:
-            # Load embedding model
-            from sentence_transformers import SentenceTransformer
-            self.embeddings_model = SentenceTransformer('all-MiniLM-L6-v2')
-            
-            # Try to load existing FAISS index
-            storage_dir = Path(__file__).parent.parent / "storage" / "indexes"
-            index_path = storage_dir / "faiss.index"
-            meta_path = storage_dir / "meta.json"
-            
-            if index_path.exists() and meta_path.exists():
-                import faiss
-                self.faiss_index = faiss.read_index(str(index_path))
-                
-                with open(meta_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Extract items list from the meta JSON structure
-                    self.metadata = data.get('items', []) if isinstance(data, dict) else data
-                
-                print(f"Loaded FAISS index with {len(self.metadata)} documents")
-            else:
-                print("Warning: FAISS index not found. Create one first.")
-                
-        except Exception as e:
-            print(f"Warning: Could not load precedent matcher: {e}")
+    @property
+    def faiss_index(self):
+        """The live FAISS index shared with utils.faiss_index (None until one is built)"""
+        state = load_index_state()
+        return state.index if state is not None else None
+    
+    @property
+    def metadata(self) -> List[Dict[str, Any]]:
+        """Metadata rows of the live index"""
+        state = load_index_state()
+        return state.meta if state is not None else []
     
     def find_similar_cases(
         self,
@@ -54,98 +48,45 @@ class PrecedentMatcher:
         """
         Find similar cases based on case description
         
+        Every case at or above min_similarity_threshold is found with a range
+        search on the live index (so cases indexed since startup are included
+        and filters never starve the result), then the best top_k are returned.
+        
         Args:
             query: Case description or facts
             top_k: Number of similar cases to return
             filters: Optional filters (e.g., {"section": "IPC 302"})
         
         Returns:
-            Dictionary with similar cases and similarity scores
+            Dictionary with similar cases and cosine similarity scores
         """
-        if not self.faiss_index or not self.embeddings_model:
+        # One snapshot for the whole query: a concurrent upsert cannot shift rows under it
+        state = load_index_state()
+        if state is None:
             return {
-                "error": "FAISS index or embedding model not loaded",
+                "error": "FAISS index not found. Create one first.",
                 "similar_cases": []
             }
         
         try:
-            # Generate embedding for query
-            query_embedding = self.embeddings_model.encode([query])
-            
-            # Search FAISS index
-            distances, indices = self.faiss_index.search(query_embedding, top_k * 2)
+            positions, scores = search_above(state, query, self.min_similarity_threshold)
             
             # Get results with metadata
             results = []
-            for idx, distance in zip(indices[0], distances[0]):
+            for idx, similarity in zip(positions, scores):
                 idx = int(idx)  # Convert numpy int to Python int
-                distance = float(distance)  # Convert numpy float to Python float
+                if idx >= len(state.meta):
+                    continue
+                case_meta = state.meta[idx]
+                
+                # Apply filters if provided
+                if filters and not self._matches_filters(case_meta, filters):
+                    continue
+                
+                results.append(precedent_result(case_meta, float(similarity)))
                 
-                if idx < len(self.metadata):
-                    case_meta = self.metadata[idx]
-                    
-                    # Apply filters if provided
-                    if filters:
-                        if not self._matches_filters(case_meta, filters):
-                            continue
-                    
-                    similarity = float(1 / (1 + distance))  # Convert distance to similarity
-                    
-                    # CRITICAL: Filter out low-relevance results
-                    if similarity < self.min_similarity_threshold:
-                        continue
-                    
-                    # Extract info from snippet if structured fields don't exist
-                    snippet = case_meta.get("snippet", "")
-                    sections_list = []
-                    court_name = None
-                    year_val = None
-                    title = case_meta.get("title", "")
-                    
-                    # Try to extract sections from snippet
-                    if "Sections:" in snippet or "IPC" in snippet or "BNS" in snippet:
-                        import re
-                        # Find IPC/BNS sections in snippet
-                        ipc_matches = re.findall(r'IPC\s*\d+', snippet)
-                        bns_matches = re.findall(r'BNS\s*\d+', snippet)
-                        sections_list = list(set(ipc_matches + bns_matches))  # Remove duplicates
-                    
-                    # Extract court if present
-                    if "Police Station:" in snippet:
-                        lines = snippet.split('\n')
-                        for line in lines:
-                            if "Police Station:" in line:
-                                court_name = line.split("Police Station:")[-1].strip()
-                                break
-                    
-                    # Extract year from dates in snippet
-                    import re
-                    year_matches = re.findall(r'20\d{2}', snippet)
-                    if year_matches:
-                        year_val = int(year_matches[0])
-                    
-                    # Generate title from snippet if not present
-                    if not title:
-                        if "Nature of Offence:" in snippet:
-                            title = snippet.split("Nature of Offence:")[-1].split('\n')[0].strip()
-                        elif "FIR Number:" in snippet:
-                            title = snippet.split("FIR Number:")[-1].split('\n')[0].strip()
-                        else:
-                            title = snippet[:100] + "..."
-                    
-                    results.append({
-                        "case_id": case_meta.get("id"),
-                        "title": title or case_meta.get("sourceFile", "Unknown Case"),
-                        "description": snippet[:300] + ("..." if len(snippet) > 300 else ""),
-                        "sections": sections_list or case_meta.get("sections", []),
-                        "year": year_val or case_meta.get("year"),
-                        "court": court_name or case_meta.get("court", ""),
-                        "similarity": round(similarity, 3),
-                        "file_path": case_meta.get("file_path") or case_meta.get("sourceFile")
-                    })
-                    
-                    if len(results) >= top_k:
-                        break
+                if len(results) >= top_k:
+                    break
             
             return {
                 "query": query,
@@ -166,12 +107,12 @@ class PrecedentMatcher:
         """Check if case matches the given filters"""
         for key, value in filters.items():
             if key == "section":
-                # Check if section is in the case
-                sections = case_meta.get("sections", [])
-                if value not in sections:
+                # Check if section is in the case ("ipc302" matches "IPC 302"; a bare number any code)
+                keys = {k for section in case_meta.get("sections", []) for k in section_keys(section)}
+                if normalize_section(value) not in keys:
                     return False
             elif key == "year":
-                if case_meta.get("year") != value:
+                if str(case_meta.get("year")) != str(value):
                     return False
             elif key == "court":
                 if case_meta.get("court") != value:
@@ -190,35 +131,62 @@ class PrecedentMatcher:
         Find precedents that cite a specific section
         
         Args:
-            section: Section number (e.g., "IPC 302", "BNS 103")
+            section: Section reference (e.g., "IPC 302", "ipc302", "BNS 103"; a bare
+                number matches it in any code)
             top_k: Number of cases to return
         
         Returns:
-            List of cases citing this section
+            List of cases citing this section, in index order
         """
-        results = []
+        return self.find_precedents_by_sections([section], top_k)
+    
+    def find_precedents_by_sections(
+        self,
+        sections: List[str],
+        top_k: int = 10
+    ) -> List[Dict]:
+        """
+        Find precedents citing every one of several sections
         
-        for case_meta in self.metadata:
-            sections = case_meta.get("sections", [])
-            if section in sections or any(section in s for s in sections):
-                results.append({
-                    "case_id": case_meta.get("id"),
-                    "title": case_meta.get("title"),
-                    "description": case_meta.get("description", ""),
-                    "sections": sections,
-                    "year": case_meta.get("year"),
-                    "court": case_meta.get("court"),
-                    "file_path": case_meta.get("file_path")
-                })
-                
-                if len(results) >= top_k:
-                    break
+        Uses the section posting lists kept with the FAISS metadata, so the cost
+        depends on the shortest posting list rather than the corpus size.
+        
+        Args:
+            sections: Section references that must all be cited
+            top_k: Number of cases to return
+        
+        Returns:
+            List of matching cases, in index order
+        """
+        postings = load_section_postings()
+        if postings is None:
+            return []
+        
+        results = []
+        for position in postings.intersect(sections)[:top_k]:
+            case_meta = postings.rows[position]
+            results.append({
+                "case_id": case_meta.get("id"),
+                "title": case_meta.get("title"),
+                "description": case_meta.get("description", ""),
+                "sections": case_meta.get("sections", []),
+                "year": case_meta.get("year"),
+                "court": case_meta.get("court"),
+                "file_path": case_meta.get("file_path")
+            })
         
         return results
     
-    def get_case_statistics(self) -> Dict[str, Any]:
-        """Get statistics about indexed cases"""
-        if not self.metadata:
+    def get_case_statistics(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Get statistics about indexed cases
+        
+        Counts come from the facet bitmaps maintained with the FAISS metadata,
+        so they cost nothing per case; filters (e.g. {"section": "IPC 302",
+        "year": 2021}) restrict them to the matching cases.
+        """
+        facets = load_facets()
+        if facets is None:
             return {
                 "total_cases": 0,
                 "sections": {},
@@ -226,30 +194,9 @@ class PrecedentMatcher:
                 "years": {}
             }
         
-        sections_count = {}
-        courts_count = {}
-        years_count = {}
-        
-        for case in self.metadata:
-            # Count sections
-            for section in case.get("sections", []):
-                sections_count[section] = sections_count.get(section, 0) + 1
-            
-            # Count courts
-            court = case.get("court", "Unknown")
-            courts_count[court] = courts_count.get(court, 0) + 1
-            
-            # Count years
-            year = case.get("year", "Unknown")
-            years_count[year] = years_count.get(year, 0) + 1
-        
-        return {
-            "total_cases": len(self.metadata),
-            "sections": dict(sorted(sections_count.items(), key=lambda x: x[1], reverse=True)[:10]),
-            "courts": courts_count,
-            "years": years_count,
-            "index_loaded": self.faiss_index is not None
-        }
+        stats = facets.stats(filters)
+        stats["index_loaded"] = self.faiss_index is not None
+        return stats
 
 
 # Singleton instance
@@ -261,3 +208,22 @@ def get_precedent_matcher() -> PrecedentMatcher:
     if _precedent_matcher_instance is None:
         _precedent_matcher_instance = PrecedentMatcher()
     return _precedent_matcher_instance
+
+
+def get_precedents_for_section(section: str, top_k: int = 10) -> Dict[str, Any]:
+    """
+    Precedents citing a section, or all of several comma-separated sections
+    ("IPC 302, IPC 34"), using the shared Precedent Matcher
+    """
+    sections = [part.strip() for part in section.split(",") if part.strip()]
+    cases = get_precedent_matcher().find_precedents_by_sections(sections, top_k)
+    return {"sections": sections, "cases": cases, "total_found": len(cases)}
+
+
+def find_precedents(query: str, top_k: int = 5, section: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Cases similar to query using the shared Precedent Matcher, optionally
+    only those citing section
+    """
+    filters = {"section": section} if section else None
+    return get_precedent_matcher().find_similar_cases(query, top_k, filters)
@@ -2,7 +2,7 @@
 Query Expander - Expands search queries with legal synonyms
 """
 import json
-from typing import List, Set
+from typing import List, Optional, Set
 from pathlib import Path
 
 
@@ -115,3 +115,13 @@ def get_query_expander() -> QueryExpander:
     if _query_expander_instance is None:
         _query_expander_instance = QueryExpander()
     return _query_expander_instance
+
+
+def reload_query_expander() -> Optional[QueryExpander]:
+    """Re-read legal_synonyms.json into a new Query Expander and swap it in (if one was created)"""
+    global _query_expander_instance
+    if _query_expander_instance is None:
+        return None
+    expander = QueryExpander()
+    _query_expander_instance = expander
+    return expander
@@ -0,0 +1,71 @@
+"""
+Span-Based Redaction
+Collects (start, end, replacement) spans from literal strings and regexes, merges
+overlapping spans and rebuilds the text in a single pass, instead of rescanning the
+whole document once per entity.
+
+Names detected by spaCy are redacted as literals (one alternation over all of them)
+rather than from the entity offsets, so every mention of a detected name is removed,
+including mentions spaCy did not tag itself, as the per-name re.sub did before.
+"""
+import re
+from typing import Iterable, List, Optional, Pattern, Tuple
+
+# (start, end, replacement), end exclusive
+Span = Tuple[int, int, str]
+
+
+def compile_literals(literals: Iterable[str]) -> Optional[Pattern]:
+    """
+    One alternation matching any of the literals
+
+    Longer literals are tried first so "Ravi Kumar" wins over "Ravi" at the same position.
+    Returns None when there is nothing to match.
+    """
+    unique = sorted({lit for lit in literals if lit and lit.strip()}, key=len, reverse=True)
+    if not unique:
+        return None
+    return re.compile("|".join(re.escape(lit) for lit in unique))
+
+
+def literal_spans(text: str, literals: Iterable[str], replacement: str) -> List[Span]:
+    """Spans for every occurrence of any literal (e.g. each mention of a detected name)"""
+    pattern = compile_literals(literals)
+    if pattern is None:
+        return []
+    return pattern_spans(text, pattern, replacement)
+
+
+def pattern_spans(text: str, pattern: Pattern, replacement: str) -> List[Span]:
+    """Spans for every match of a compiled regex"""
+    return [(m.start(), m.end(), replacement) for m in pattern.finditer(text)]
+
+
+def merge_spans(spans: Iterable[Span]) -> List[Span]:
+    """
+    Sort spans and merge any that overlap
+
+    A merged span covers the union of its parts and keeps the replacement of the
+    span that starts first (the longest one when several start together).
+    Touching spans are not merged, so each keeps its own replacement.
+    """
+    merged: List[Span] = []
+    for start, end, replacement in sorted(spans, key=lambda s: (s[0], -s[1])):
+        if merged and start < merged[-1][1]:
+            prev_start, prev_end, prev_replacement = merged[-1]
+            merged[-1] = (prev_start, max(prev_end, end), prev_replacement)
+        else:
+            merged.append((start, end, replacement))
+    return merged
+
+
+def apply_spans(text: str, spans: Iterable[Span]) -> str:
+    """Rebuild text once, substituting each merged span with its replacement"""
+    parts = []
+    pos = 0
+    for start, end, replacement in merge_spans(spans):
+        parts.append(text[pos:start])
+        parts.append(replacement)
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
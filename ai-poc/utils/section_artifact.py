@@ -0,0 +1,131 @@
+"""
+Prebuilt Section Index Artifact
+The parsed section databases, their lookup tables and the BM25 indexes serialised
+into one binary file, data/section_index.pkl, keyed by a hash of the source JSON
+files. Processes load it instead of parsing the JSON and rebuilding BM25, and it
+is rebuilt only when the data files change (or by build_section_index.py).
+"""
+import os
+import pickle
+import threading
+from typing import Dict, Optional
+
+from .bm25_sparse import SparseBM25, StackedBM25, build_bm25
+from .section_index import CODES, DATA_DIR, SECTION_FILES, SectionIndex, data_files_hash, load_sections, section_text
+
+ARTIFACT_FILE = DATA_DIR / "section_index.pkl"
+# Bump when the artifact layout or the BM25 tokenisation changes
+ARTIFACT_VERSION = "1"
+
+
+class SectionArtifact:
+    """
+    Everything derived from the section databases at startup
+
+    Attributes:
+        source_hash: data_files_hash() of the JSON files it was built from
+        index: SectionIndex with the lookup tables
+        bm25: {"ipc": index, "bns": index} (None for an empty database)
+        bm25_stacked: StackedBM25 over both, or None without scipy
+    """
+
+    def __init__(self, source_hash: str, index: SectionIndex, bm25: Dict, bm25_stacked: Optional[StackedBM25]):
+        self.source_hash = source_hash
+        self.index = index
+        self.bm25 = bm25
+        self.bm25_stacked = bm25_stacked
+
+
+def artifact_source_hash() -> str:
+    """Hash the artifact must carry to match the current data files and layout"""
+    return data_files_hash("section-artifact", ARTIFACT_VERSION)
+
+
+def build_section_artifact(source_hash: Optional[str] = None) -> SectionArtifact:
+    """Parse the JSON databases and build the lookup tables and BM25 indexes"""
+    source_hash = source_hash or artifact_source_hash()
+    index = SectionIndex(load_sections(SECTION_FILES["ipc"]), load_sections(SECTION_FILES["bns"]))
+    bm25 = {}
+    for code in CODES:
+        # Combine keywords, title, and description for indexing
+        corpus = [section_text(section).lower().split() for section in index.sections[code]]
+        bm25[code] = build_bm25(corpus) if corpus else None
+
+    # IPC and BNS side by side, so batches are scored against both in one product
+    bm25_stacked = None
+    if all(isinstance(bm25[code], SparseBM25) for code in CODES):
+        bm25_stacked = StackedBM25([bm25[code] for code in CODES])
+    return SectionArtifact(source_hash, index, bm25, bm25_stacked)
+
+
+def save_section_artifact(artifact: SectionArtifact, path=ARTIFACT_FILE):
+    """Write the artifact atomically (temporary file + rename), so readers never see a partial file"""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")  # workers may build concurrently
+    with open(tmp_path, "wb") as f:
+        pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def read_section_artifact(source_hash: str, path=ARTIFACT_FILE) -> Optional[SectionArtifact]:
+    """The artifact at path if it was built from the current data files, else None"""
+    if not path.exists():
+        return None
+    try:
+        with open(path, "rb") as f:
+            artifact = pickle.load(f)
+    except Exception as e:
+        # Corrupt file, or built where scipy was installed and read where it is not
+        print(f"Warning: Could not read {path.name}, rebuilding: {e}")
+        return None
+    if not isinstance(artifact, SectionArtifact) or artifact.source_hash != source_hash:
+        return None
+    return artifact
+
+
+def load_section_artifact() -> SectionArtifact:
+    """
+    Load the prebuilt artifact, rebuilding and saving it when the data changed
+
+    Returns:
+        SectionArtifact for the current data files
+    """
+    source_hash = artifact_source_hash()
+    artifact = read_section_artifact(source_hash)
+    if artifact is not None:
+        return artifact
+
+    artifact = build_section_artifact(source_hash)
+    if DATA_DIR.exists():
+        try:
+            save_section_artifact(artifact)
+        except Exception as e:
+            print(f"Warning: Could not save {ARTIFACT_FILE.name}: {e}")
+    return artifact
+
+
+_artifact = None
+_lock = threading.Lock()
+
+
+def get_section_artifact() -> SectionArtifact:
+    """Get or load the shared section artifact"""
+    global _artifact
+    if _artifact is None:
+        with _lock:
+            if _artifact is None:
+                _artifact = load_section_artifact()
+    return _artifact
+
+
+def reload_section_artifact() -> SectionArtifact:
+    """
+    Load the artifact for the current data files and make it the shared one
+
+    The new artifact is fully built before the swap; callers still holding the
+    previous one keep using it unchanged.
+    """
+    global _artifact
+    artifact = load_section_artifact()
+    with _lock:
+        _artifact = artifact
+    return artifact
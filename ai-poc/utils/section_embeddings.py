@@ -0,0 +1,108 @@
+"""
+Dense Section Embeddings
+Sentence embeddings of every IPC/BNS section (keywords, title and description, the
+same text BM25 indexes), computed once and persisted next to the section databases
+in data/section_embeddings.npz. The file records a hash of the data files and the
+model name and is rebuilt automatically when either changes.
+"""
+import os
+from typing import Dict, Optional
+
+import numpy as np
+
+from config import SECTION_DENSE_MIN_SIMILARITY, SECTION_DENSE_WEIGHT
+from .section_index import CODES, DATA_DIR, SectionIndex, data_files_hash, section_text
+
+EMBEDDINGS_FILE = DATA_DIR / "section_embeddings.npz"
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"  # utils/embeddings model
+
+
+class SectionEmbeddings:
+    """
+    Normalized (sections x dim) embedding matrix per code
+
+    Vectors are unit length, so cosine similarity against every section of a
+    code is a single matrix-vector product.
+    """
+
+    def __init__(self, matrices: Dict[str, np.ndarray]):
+        self.matrices = matrices
+
+    def cosine(self, code: str, query_vector: np.ndarray) -> np.ndarray:
+        """Cosine similarity of one normalized query vector to every section of a code"""
+        return self.matrices[code] @ query_vector
+
+    def cosine_batch(self, code: str, query_vectors: np.ndarray) -> np.ndarray:
+        """(queries x sections) cosine similarities for a matrix of normalized query vectors"""
+        return query_vectors @ self.matrices[code].T
+
+
+def fuse_scores(bm25_scores: np.ndarray, cosine_scores: np.ndarray) -> np.ndarray:
+    """
+    BM25 scores plus a dense bonus for semantically close sections
+
+    Only similarity above SECTION_DENSE_MIN_SIMILARITY counts, so unrelated
+    sections (which still have small positive cosines) are not promoted.
+    """
+    bonus = np.maximum(cosine_scores - SECTION_DENSE_MIN_SIMILARITY, 0.0)
+    return np.asarray(bm25_scores) + SECTION_DENSE_WEIGHT * bonus
+
+
+def _read_cached(source_hash: str, index: SectionIndex) -> Optional[Dict[str, np.ndarray]]:
+    """Matrices from EMBEDDINGS_FILE if it was built from the current data and model"""
+    if not EMBEDDINGS_FILE.exists():
+        return None
+    try:
+        with np.load(EMBEDDINGS_FILE) as cached:
+            if str(cached["source_hash"]) != source_hash:
+                return None
+            matrices = {code: cached[code] for code in CODES}
+    except Exception as e:
+        print(f"Warning: Could not read {EMBEDDINGS_FILE.name}: {e}")
+        return None
+    if any(len(matrices[code]) != len(index.sections[code]) for code in CODES):
+        return None
+    return matrices
+
+
+def _write_cached(source_hash: str, matrices: Dict[str, np.ndarray]):
+    """Save the matrices atomically (temporary file + rename)"""
+    tmp_path = EMBEDDINGS_FILE.with_name(EMBEDDINGS_FILE.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            np.savez(f, source_hash=np.array(source_hash), **matrices)
+        os.replace(tmp_path, EMBEDDINGS_FILE)
+    except Exception as e:
+        print(f"Warning: Could not save {EMBEDDINGS_FILE.name}: {e}")
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def load_section_embeddings(index: SectionIndex) -> Optional[SectionEmbeddings]:
+    """
+    Load the persisted section embeddings, computing and saving them if stale
+
+    Args:
+        index: Section index the matrices must line up with
+
+    Returns:
+        SectionEmbeddings, or None if they cannot be computed (e.g.
+        sentence-transformers is not installed)
+    """
+    source_hash = data_files_hash(EMBEDDING_MODEL)
+    matrices = _read_cached(source_hash, index)
+    if matrices is not None:
+        return SectionEmbeddings(matrices)
+
+    try:
+        from .embeddings import embed_texts
+        matrices = {
+            code: embed_texts([section_text(section) for section in index.sections[code]])
+            for code in CODES
+        }
+    except Exception as e:
+        print(f"Warning: Section embeddings unavailable, using BM25 only: {e}")
+        return None
+    if DATA_DIR.exists():
+        _write_cached(source_hash, matrices)
+    return SectionEmbeddings(matrices)
@@ -0,0 +1,169 @@
+"""
+Shared IPC/BNS Section Index
+Loads the section databases once and builds read-only lookup tables (by section key,
+by number, by category, and IPC<->BNS equivalence both ways) so every section lookup
+in LegalNER and SectionSuggester is a dict hit instead of a scan over the whole list
+"""
+import json
+import hashlib
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+CODES = ("ipc", "bns")
+SECTION_FILES = {"ipc": "ipc_sections.json", "bns": "bns_sections.json"}
+
+
+def load_sections(filename: str) -> List[Dict]:
+    """Load the "sections" list of a section database in data/ (empty if missing or unreadable)"""
+    try:
+        file_path = DATA_DIR / filename
+        if file_path.exists():
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return json.load(f).get("sections", [])
+    except Exception as e:
+        print(f"Warning: Could not load {filename}: {e}")
+    return []
+
+
+def section_text(section: Dict) -> str:
+    """Searchable text of a section: keywords, title and description"""
+    return " ".join([
+        " ".join(section.get("keywords", [])),
+        section.get("title", ""),
+        section.get("description", "")
+    ])
+
+
+def data_files_hash(*extra: str) -> str:
+    """
+    SHA-256 over the section database files (missing files count as empty)
+
+    Artifacts derived from the data store this to detect when they are stale;
+    extra strings (e.g. a model name) are mixed in as well.
+    """
+    digest = hashlib.sha256()
+    for code in CODES:
+        file_path = DATA_DIR / SECTION_FILES[code]
+        digest.update(file_path.read_bytes() if file_path.exists() else b"")
+        digest.update(b"\x00")
+    for value in extra:
+        digest.update(value.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _first_positions(sections: Tuple[Dict, ...], field: str) -> Mapping:
+    """{value of field: position of the first section having it}, like a linear scan would find"""
+    positions = {}
+    for pos, section in enumerate(sections):
+        value = section.get(field)
+        if value is not None:
+            positions.setdefault(value, pos)
+    return MappingProxyType(positions)
+
+
+def _to_dict(table, depth: int):
+    """Read-only mapping nested depth levels deep -> plain dicts (picklable)"""
+    return {key: _to_dict(value, depth - 1) for key, value in table.items()} if depth else table
+
+
+def _to_proxy(table, depth: int):
+    """Inverse of _to_dict"""
+    return MappingProxyType({key: _to_proxy(value, depth - 1) for key, value in table.items()}) if depth else table
+
+
+class SectionIndex:
+    """
+    Immutable lookup tables over the IPC and BNS section lists
+
+    The section lists are tuples and every table is a read-only mapping, so one
+    instance can be shared by all modules and threads. Returned section dicts are
+    the loaded records themselves and must be treated as read-only.
+    """
+
+    # Nesting depth of the read-only mappings in each table; pickling stores the
+    # tables as plain dicts (MappingProxyType is not picklable) and rewraps them
+    _TABLE_DEPTHS = {
+        "sections": 1, "_by_key": 2, "_by_number": 2, "_by_category": 2, "ipc_to_bns": 1, "bns_to_ipc": 1
+    }
+
+    def __init__(self, ipc_sections: List[Dict], bns_sections: List[Dict]):
+        self.sections = MappingProxyType({"ipc": tuple(ipc_sections), "bns": tuple(bns_sections)})
+        self._by_key = MappingProxyType({code: _first_positions(self.sections[code], "section") for code in CODES})
+        self._by_number = MappingProxyType({code: _first_positions(self.sections[code], "number") for code in CODES})
+
+        by_category = {}
+        for code in CODES:
+            groups = {}
+            for section in self.sections[code]:
+                if section.get("category"):
+                    groups.setdefault(section["category"], []).append(section)
+            by_category[code] = MappingProxyType({cat: tuple(secs) for cat, secs in groups.items()})
+        self._by_category = MappingProxyType(by_category)
+
+        # IPC number -> first BNS section naming it as ipc_equivalent, and
+        # BNS number -> the IPC section its ipc_equivalent points to
+        bns = self.sections["bns"]
+        self.ipc_to_bns = MappingProxyType({
+            ipc_number: bns[pos] for ipc_number, pos in _first_positions(bns, "ipc_equivalent").items()
+        })
+        bns_to_ipc = {}
+        for section in bns:
+            ipc_section = self.by_number("ipc", section.get("ipc_equivalent"))
+            if ipc_section is not None and section.get("number") is not None:
+                bns_to_ipc.setdefault(section["number"], ipc_section)
+        self.bns_to_ipc = MappingProxyType(bns_to_ipc)
+
+    def __getstate__(self):
+        return {name: _to_dict(getattr(self, name), depth) for name, depth in self._TABLE_DEPTHS.items()}
+
+    def __setstate__(self, state):
+        for name, depth in self._TABLE_DEPTHS.items():
+            setattr(self, name, _to_proxy(state[name], depth))
+
+    @property
+    def ipc_sections(self) -> Tuple[Dict, ...]:
+        return self.sections["ipc"]
+
+    @property
+    def bns_sections(self) -> Tuple[Dict, ...]:
+        return self.sections["bns"]
+
+    def by_key(self, code: str, key: str) -> Optional[Dict]:
+        """Section whose "section" field equals key (e.g. "IPC 302")"""
+        pos = self._by_key[code.lower()].get(key)
+        return None if pos is None else self.sections[code.lower()][pos]
+
+    def by_number(self, code: str, number: str) -> Optional[Dict]:
+        """Section whose "number" field equals number (e.g. "302")"""
+        if number is None:
+            return None
+        pos = self._by_number[code.lower()].get(number)
+        return None if pos is None else self.sections[code.lower()][pos]
+
+    def lookup(self, code: str, number: str) -> Optional[Dict]:
+        """
+        Section matching "<CODE> <number>" by key or number by plain number
+
+        When both match different records the one listed first wins, as with a
+        linear scan testing both fields.
+        """
+        code = code.lower()
+        positions = [
+            pos for pos in (
+                self._by_key[code].get(f"{code.upper()} {number}"),
+                self._by_number[code].get(number),
+            ) if pos is not None
+        ]
+        return self.sections[code][min(positions)] if positions else None
+
+    def in_category(self, code: str, category: str) -> Tuple[Dict, ...]:
+        """Sections of a code in a category, in database order"""
+        return self._by_category[code.lower()].get(category, ())
+
+
+def get_section_index() -> SectionIndex:
+    """Get the shared section index (from the prebuilt section artifact)"""
+    from .section_artifact import get_section_artifact
+    return get_section_artifact().index
@@ -0,0 +1,102 @@
+"""
+Section Posting Lists
+Inverted index from normalised section key to the sorted row positions of the indexed
+cases citing it, so "which cases cite IPC 302 (and IPC 34)" is a dict lookup plus
+a sorted-list intersection instead of a scan over every metadata row
+"""
+import re
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Sequence
+
+_CODE_FIRST = re.compile(r"^([A-Z]+)(\d+[A-Z]?)$")
+_NUMBER_FIRST = re.compile(r"^(\d+[A-Z]?)(IPC|BNSS|BNS|CRPC|BSA)$")
+
+
+def normalize_section(section: str) -> str:
+    """
+    Canonical posting key of a section reference
+
+    Case, spaces and punctuation are ignored and the code comes first:
+    "IPC 302", "ipc302", "IPC-302" and "302 IPC" all give "IPC302". A bare
+    number ("302") stays "302" and matches that number in any code.
+    """
+    key = re.sub(r"[^A-Z0-9]", "", str(section).upper())
+    match = _NUMBER_FIRST.match(key)
+    if match:
+        key = match.group(2) + match.group(1)
+    return key
+
+
+def format_section(key: str) -> str:
+    """Display form of a normalised key ("IPC302" -> "IPC 302")"""
+    match = _CODE_FIRST.match(key)
+    return f"{match.group(1)} {match.group(2)}" if match else key
+
+
+def section_keys(section: str) -> List[str]:
+    """Keys a cited section is filed under: its normalised key and its bare number"""
+    key = normalize_section(section)
+    match = _CODE_FIRST.match(key)
+    return [key, match.group(2)] if match else [key]
+
+
+class SectionPostings:
+    """
+    Immutable section -> sorted row positions index over a metadata list
+
+    Updates return a new instance (copy-on-write), so readers holding one see
+    a consistent snapshot while an upsert builds the next. `rows` is the
+    metadata list the positions refer to.
+    """
+
+    def __init__(self, rows: List[Dict[str, Any]], postings: Dict[str, List[int]]):
+        self.rows = rows
+        self._postings = postings
+
+    @classmethod
+    def build(cls, rows: List[Dict[str, Any]]) -> "SectionPostings":
+        """Index the "sections" column of every row"""
+        return cls(rows, cls._index_rows(rows, 0, {}))
+
+    @staticmethod
+    def _index_rows(rows: Sequence[Dict[str, Any]], start: int, postings: Dict[str, List[int]]) -> Dict[str, List[int]]:
+        """File rows (at positions start, start + 1, ...) into postings, keeping each list sorted"""
+        for position, row in enumerate(rows, start):
+            keys = {key for section in row.get("sections") or [] for key in section_keys(section)}
+            for key in keys:
+                postings.setdefault(key, []).append(position)
+        return postings
+
+    def updated(self, rows: List[Dict[str, Any]], removed: Iterable[int], added: int) -> "SectionPostings":
+        """
+        Postings for rows after an upsert
+
+        Args:
+            rows: New metadata list (old rows minus removed, then the added rows)
+            removed: Old positions that were deleted (later rows shift down)
+            added: Number of rows appended at the end of rows
+        """
+        removed = sorted(set(removed))
+        removed_set = set(removed)
+        postings = {}
+        for key, positions in self._postings.items():
+            if removed:
+                positions = [p - bisect_left(removed, p) for p in positions if p not in removed_set]
+            else:
+                positions = list(positions)
+            if positions:
+                postings[key] = positions
+        self._index_rows(rows[len(rows) - added:], len(rows) - added, postings)
+        return SectionPostings(rows, postings)
+
+    def lookup(self, section: str) -> List[int]:
+        """Sorted row positions of cases citing section"""
+        return self._postings.get(normalize_section(section), [])
+
+    def intersect(self, sections: Iterable[str]) -> List[int]:
+        """Sorted row positions of cases citing every one of sections"""
+        lists = sorted((self.lookup(section) for section in sections), key=len)
+        if not lists:
+            return []
+        others = [set(positions) for positions in lists[1:]]
+        return [p for p in lists[0] if all(p in other for other in others)]
@@ -2,12 +2,13 @@
 Section Suggester - Recommends IPC/BNS sections based on case facts
 Uses keyword matching and semantic similarity
 """
-import json
 import re
 from typing import Dict, List, Any, Optional
-from pathlib import Path
-from rank_bm25 import BM25Okapi
+from config import SECTION_DENSE_WEIGHT
+from .bm25_sparse import tokenize_batch, top_k_indices
 from .logger import get_logger
+from .section_artifact import SectionArtifact, get_section_artifact
+from .section_embeddings import fuse_scores, load_section_embeddings
 
 logger = get_logger(__name__)
 
@@ -15,57 +16,19 @@ logger = get_logger(__name__)
 class SectionSuggester:
     """Suggest relevant IPC/BNS sections based on case description"""
     
-    def __init__(self):
+    def __init__(self, artifact: Optional[SectionArtifact] = None):
         logger.info("Initializing Section Suggester")
-        self.ipc_sections = self._load_sections("ipc_sections.json")
-        self.bns_sections = self._load_sections("bns_sections.json")
+        artifact = artifact or get_section_artifact()
+        self.section_index = artifact.index
+        self.ipc_sections = self.section_index.ipc_sections
+        self.bns_sections = self.section_index.bns_sections
         logger.info("Sections loaded", ipc_count=len(self.ipc_sections), bns_count=len(self.bns_sections))
-        self.bm25_index_ipc = None
-        self.bm25_index_bns = None
-        self._build_bm25_indexes()
-        logger.info("Section Suggester initialized successfully")
-    
-    def _load_sections(self, filename: str) -> List[Dict]:
-        """Load section database"""
-        try:
-            data_dir = Path(__file__).parent.parent / "data"
-            file_path = data_dir / filename
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get("sections", [])
-        except Exception as e:
-            print(f"Warning: Could not load {filename}: {e}")
-        return []
-    
-    def _build_bm25_indexes(self):
-        """Build BM25 indexes for fast retrieval"""
-        # Tokenize IPC sections
-        ipc_corpus = []
-        for section in self.ipc_sections:
-            # Combine keywords, title, and description for indexing
-            text = " ".join([
-                " ".join(section.get("keywords", [])),
-                section.get("title", ""),
-                section.get("description", "")
-            ])
-            ipc_corpus.append(text.lower().split())
-        
-        if ipc_corpus:
-            self.bm25_index_ipc = BM25Okapi(ipc_corpus)
-        
-        # Tokenize BNS sections
-        bns_corpus = []
-        for section in self.bns_sections:
-            text = " ".join([
-                " ".join(section.get("keywords", [])),
-                section.get("title", ""),
-                section.get("description", "")
-            ])
-            bns_corpus.append(text.lower().split())
-        
-        if bns_corpus:
-            self.bm25_index_bns = BM25Okapi(bns_corpus)
+        # BM25 indexes for fast retrieval, prebuilt in data/section_index.pkl
+        self.bm25_index_ipc = artifact.bm25["ipc"]
+        self.bm25_index_bns = artifact.bm25["bns"]
+        self.bm25_stacked = artifact.bm25_stacked
+        self.section_embeddings = load_section_embeddings(self.section_index) if SECTION_DENSE_WEIGHT > 0 else None
+        logger.info("Section Suggester initialized successfully", dense=self.section_embeddings is not None)
     
     def suggest_sections(
         self,
@@ -85,27 +48,117 @@ class SectionSuggester:
             Dictionary with suggested sections and confidence scores
         """
         query_tokens = case_description.lower().split()
+        ipc_scores = None
+        bns_scores = None
+        if code_type in ["ipc", "both"] and self.bm25_index_ipc:
+            ipc_scores = self.bm25_index_ipc.get_scores(query_tokens)
+        if code_type in ["bns", "both"] and self.bm25_index_bns:
+            bns_scores = self.bm25_index_bns.get_scores(query_tokens)
+        
+        ipc_lexical, bns_lexical = ipc_scores, bns_scores
+        query_vectors = self._embed_queries([case_description])
+        if query_vectors is not None:
+            if ipc_scores is not None:
+                ipc_scores = fuse_scores(ipc_scores, self.section_embeddings.cosine("ipc", query_vectors[0]))
+            if bns_scores is not None:
+                bns_scores = fuse_scores(bns_scores, self.section_embeddings.cosine("bns", query_vectors[0]))
+        return self._rank_suggestions(case_description, ipc_scores, bns_scores, top_k, ipc_lexical, bns_lexical)
+    
+    def suggest_sections_batch(
+        self,
+        case_descriptions: List[str],
+        top_k: int = 5,
+        code_type: str = "both"
+    ) -> List[Dict[str, Any]]:
+        """
+        Suggest sections for many case descriptions at once
+        
+        All descriptions are tokenised together and scored against the IPC and
+        BNS indexes with one sparse matrix product (per-query scoring is used
+        when scipy is not installed); dense similarities, when enabled, are
+        likewise one matrix product per code after one encoder pass.
+        
+        Returns:
+            One suggest_sections() result per description, in input order
+        """
+        if not case_descriptions:
+            return []
+        tokens = tokenize_batch(case_descriptions)
+        if self.bm25_stacked is not None:
+            ipc_matrix, bns_matrix = self.bm25_stacked.get_scores_batch(tokens)
+        else:
+            ipc_matrix = [self.bm25_index_ipc.get_scores(q) for q in tokens] if self.bm25_index_ipc else None
+            bns_matrix = [self.bm25_index_bns.get_scores(q) for q in tokens] if self.bm25_index_bns else None
+        
+        ipc_lexical, bns_lexical = ipc_matrix, bns_matrix
+        query_vectors = self._embed_queries(case_descriptions)
+        if query_vectors is not None:
+            if ipc_matrix is not None:
+                ipc_matrix = fuse_scores(ipc_matrix, self.section_embeddings.cosine_batch("ipc", query_vectors))
+            if bns_matrix is not None:
+                bns_matrix = fuse_scores(bns_matrix, self.section_embeddings.cosine_batch("bns", query_vectors))
+        
+        results = []
+        for i, description in enumerate(case_descriptions):
+            use_ipc = code_type in ["ipc", "both"] and ipc_matrix is not None
+            use_bns = code_type in ["bns", "both"] and bns_matrix is not None
+            results.append(self._rank_suggestions(
+                description,
+                ipc_matrix[i] if use_ipc else None,
+                bns_matrix[i] if use_bns else None,
+                top_k,
+                ipc_lexical[i] if use_ipc else None,
+                bns_lexical[i] if use_bns else None
+            ))
+        return results
+    
+    def _embed_queries(self, case_descriptions: List[str]):
+        """Normalized query embeddings, or None when dense scoring is off or unavailable"""
+        if self.section_embeddings is None:
+            return None
+        try:
+            from .embeddings import embed_texts
+            return embed_texts(case_descriptions)
+        except Exception as e:
+            logger.warning("Query embedding failed, using BM25 only", error=str(e))
+            return None
+    
+    def _rank_suggestions(
+        self,
+        case_description: str,
+        ipc_scores,
+        bns_scores,
+        top_k: int,
+        ipc_lexical=None,
+        bns_lexical=None
+    ) -> Dict[str, Any]:
+        """
+        Top sections from per-code score arrays (None skips a code)
+        
+        ipc_lexical/bns_lexical are the BM25 parts of fused scores; they decide
+        the matched keywords and explanation (same as the scores without fusion).
+        """
         suggestions = []
         
         # Get IPC suggestions
-        if code_type in ["ipc", "both"] and self.bm25_index_ipc:
-            ipc_scores = self.bm25_index_ipc.get_scores(query_tokens)
+        if ipc_scores is not None:
             ipc_suggestions = self._get_top_sections(
                 self.ipc_sections,
                 ipc_scores,
                 top_k,
-                "IPC"
+                "IPC",
+                ipc_lexical
             )
             suggestions.extend(ipc_suggestions)
         
         # Get BNS suggestions
-        if code_type in ["bns", "both"] and self.bm25_index_bns:
-            bns_scores = self.bm25_index_bns.get_scores(query_tokens)
+        if bns_scores is not None:
             bns_suggestions = self._get_top_sections(
                 self.bns_sections,
                 bns_scores,
                 top_k,
-                "BNS"
+                "BNS",
+                bns_lexical
             )
             suggestions.extend(bns_suggestions)
         
@@ -124,20 +177,26 @@ class SectionSuggester:
         sections: List[Dict],
         scores: List[float],
         top_k: int,
-        code_prefix: str
+        code_prefix: str,
+        lexical_scores=None
     ) -> List[Dict]:
-        """Get top k sections with highest scores"""
-        # Get top indices
-        import numpy as np
-        top_indices = np.argsort(scores)[-top_k:][::-1]
+        """Get top k sections with highest scores (lexical_scores: their BM25 part, if fused)"""
+        if lexical_scores is None:
+            lexical_scores = scores
+        # Get top indices (partial selection, no full sort)
+        top_indices = top_k_indices(scores, top_k)
         
         results = []
         for idx in top_indices:
             if scores[idx] > 0:  # Only include sections with positive scores
                 section = sections[idx]
                 
-                # Find matching keywords from query for explanation
-                matched_keywords = self._find_matched_keywords(section.get("keywords", []), scores[idx])
+                # Find matching keywords from query for explanation (none for purely semantic hits)
+                lexical_score = lexical_scores[idx]
+                matched_keywords = (
+                    self._find_matched_keywords(section.get("keywords", []), lexical_score)
+                    if lexical_score > 0 else []
+                )
                 
                 # Get corresponding IPC/BNS equivalent
                 equivalent_section = None
@@ -161,7 +220,10 @@ class SectionSuggester:
                     "confidence": round(min(scores[idx] / 10.0, 1.0), 2),  # Normalize to 0-1
                     "code_type": code_prefix,
                     "equivalent": equivalent_section,
-                    "explanation": self._generate_explanation(matched_keywords, section.get("title"), code_prefix)
+                    "explanation": (
+                        self._generate_explanation(matched_keywords, section.get("title"), code_prefix)
+                        if lexical_score > 0 else f"Semantically similar to the case description → {section.get('title')}"
+                    )
                 })
         
         return results
@@ -176,26 +238,21 @@ class SectionSuggester:
     
     def _find_section_by_number(self, number: str, code_type: str) -> Optional[Dict]:
         """Find section details by number"""
-        sections = self.ipc_sections if code_type == "IPC" else self.bns_sections
-        for section in sections:
-            if section.get("number") == number:
-                return {
-                    "section": section.get("section"),
-                    "title": section.get("title"),
-                    "number": section.get("number")
-                }
-        return None
+        section = self.section_index.by_number("ipc" if code_type == "IPC" else "bns", number)
+        return self._section_summary(section)
     
     def _find_bns_for_ipc(self, ipc_number: str) -> Optional[Dict]:
         """Find BNS equivalent for an IPC section"""
-        for section in self.bns_sections:
-            if section.get("ipc_equivalent") == ipc_number:
-                return {
-                    "section": section.get("section"),
-                    "title": section.get("title"),
-                    "number": section.get("number")
-                }
-        return None
+        return self._section_summary(self.section_index.ipc_to_bns.get(ipc_number))
+    
+    def _section_summary(self, section: Optional[Dict]) -> Optional[Dict]:
+        if section is None:
+            return None
+        return {
+            "section": section.get("section"),
+            "title": section.get("title"),
+            "number": section.get("number")
+        }
     
     def _generate_explanation(self, matched_keywords: List[str], title: str, code_type: str) -> str:
         """Generate explanation for why this section was suggested"""
@@ -256,14 +313,7 @@ class SectionSuggester:
     
     def get_section_details(self, section_number: str, code_type: str = "ipc") -> Optional[Dict]:
         """Get detailed information about a specific section"""
-        sections = self.ipc_sections if code_type.lower() == "ipc" else self.bns_sections
-        section_key = f"{code_type.upper()} {section_number}"
-        
-        for section in sections:
-            if section.get("section") == section_key or section.get("number") == section_number:
-                return section
-        
-        return None
+        return self.section_index.lookup("ipc" if code_type.lower() == "ipc" else "bns", section_number)
     
     def get_related_sections(self, section_number: str, code_type: str = "ipc") -> List[Dict]:
         """Get sections related to a given section (same category)"""
@@ -275,12 +325,11 @@ class SectionSuggester:
         if not category:
             return []
         
-        sections = self.ipc_sections if code_type.lower() == "ipc" else self.bns_sections
+        sections = self.section_index.in_category("ipc" if code_type.lower() == "ipc" else "bns", category)
         related = []
         
         for sec in sections:
-            if (sec.get("category") == category and 
-                sec.get("section") != section.get("section")):
+            if sec.get("section") != section.get("section"):
                 related.append({
                     "section": sec.get("section"),
                     "number": sec.get("number"),
@@ -300,3 +349,29 @@ def get_section_suggester() -> SectionSuggester:
     if _section_suggester_instance is None:
         _section_suggester_instance = SectionSuggester()
     return _section_suggester_instance
+
+
+def reload_section_suggester(artifact: Optional[SectionArtifact] = None) -> Optional[SectionSuggester]:
+    """
+    Build a new Section Suggester from artifact and swap it in
+
+    Requests already holding the old instance finish on it; the next
+    get_section_suggester() call returns the new one. Nothing is built if no
+    suggester has been created yet (the first call will load current data).
+    """
+    global _section_suggester_instance
+    if _section_suggester_instance is None:
+        return None
+    suggester = SectionSuggester(artifact)
+    _section_suggester_instance = suggester
+    return suggester
+
+
+def suggest_sections(case_description: str, top_k: int = 5, code_type: str = "both") -> Dict[str, Any]:
+    """Suggest sections for one case description using the shared SectionSuggester"""
+    return get_section_suggester().suggest_sections(case_description, top_k, code_type)
+
+
+def suggest_sections_batch(case_descriptions: List[str], top_k: int = 5, code_type: str = "both") -> List[Dict[str, Any]]:
+    """Suggest sections for many case descriptions using the shared SectionSuggester"""
+    return get_section_suggester().suggest_sections_batch(case_descriptions, top_k, code_type)
@@ -0,0 +1,228 @@
+"""
+Section Typeahead
+Ranked IPC/BNS completions for the case form, served from two in-memory indexes over
+section numbers, titles and keywords: a prefix table (a trie flattened to one dict
+keyed by prefix) for as-you-type matches and a trigram index for typos and infix
+matches. Sections come from the legal catalog and the section databases.
+"""
+import re
+import threading
+from collections import Counter
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
+
+from .legal_catalog import get_legal_catalog
+from .section_index import CODES, SectionIndex, get_section_index
+
+# Match strength by field; an entry's score for a prefix is the best field it matches in,
+# minus a small penalty per character the completed term is longer than the prefix.
+# Whole titles/keywords beat single words inside them ("mur": Murder before Attempt to Murder)
+FIELD_WEIGHTS = {
+    "number": 100.0, "section": 90.0, "title": 60.0, "title_word": 55.0, "keyword": 40.0, "keyword_word": 35.0
+}
+_LENGTH_PENALTY = 0.5
+
+# Trigram fallback: minimum share of the query's trigrams a term must contain
+MIN_TRIGRAM_SIMILARITY = 0.5
+_TRIGRAM_WEIGHT = 30.0
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase and collapse everything but letters and digits to single spaces"""
+    return _NON_ALNUM.sub(" ", text.lower()).strip()
+
+
+def trigrams(term: str) -> List[str]:
+    """Trigrams of a word padded with a space on both sides ("ab" -> " ab", "ab ")"""
+    padded = f" {term} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def _merge_sections(index: SectionIndex, catalog_entries: Dict[str, Tuple[Dict, ...]]) -> List[Dict[str, Any]]:
+    """One record per (code, number): catalog fields first, gaps and keywords from the databases"""
+    records = []
+    for code in CODES:
+        by_number = {}
+        for entry in catalog_entries.get(code, ()):
+            by_number[entry["value"]] = {
+                "section": entry.get("section"), "number": entry["value"], "title": entry.get("title"),
+                "code": code, "category": entry.get("category"), "label": entry.get("label"), "keywords": [],
+            }
+        for section in index.sections[code]:
+            number = section.get("number")
+            if number is None:
+                continue
+            record = by_number.setdefault(number, {
+                "section": None, "number": number, "title": None, "code": code,
+                "category": None, "label": None, "keywords": [],
+            })
+            for field in ("section", "title", "category"):
+                record[field] = record[field] or section.get(field)
+            record["keywords"] = list(section.get("keywords", []))
+        for record in by_number.values():
+            record["section"] = record["section"] or f"{code.upper()} {record['number']}"
+            record["label"] = record["label"] or f"{record['section']} - {record['title'] or ''}".rstrip(" -")
+            records.append(record)
+    return records
+
+
+class SectionTypeahead:
+    """
+    Prefix + trigram completion index over both codes
+
+    Built once per section data version and read-only afterwards, so lookups
+    need no locking.
+    """
+
+    def __init__(self, index: SectionIndex, catalog_entries: Dict[str, Tuple[Dict, ...]]):
+        records = _merge_sections(index, catalog_entries)
+        self.results = tuple(
+            MappingProxyType({k: v for k, v in record.items() if k != "keywords"}) for record in records
+        )
+        self.codes = tuple(record["code"] for record in records)
+
+        prefixes: Dict[str, Dict[int, float]] = {}
+        grams: Dict[str, set] = {}
+        for entry_id, record in enumerate(records):
+            for field, term in self._terms(record):
+                for end in range(1, len(term) + 1):
+                    score = FIELD_WEIGHTS[field] - _LENGTH_PENALTY * (len(term) - end)
+                    candidates = prefixes.setdefault(term[:end], {})
+                    if score > candidates.get(entry_id, float("-inf")):
+                        candidates[entry_id] = score
+                if " " not in term:
+                    for gram in trigrams(term):
+                        grams.setdefault(gram, set()).add(entry_id)
+
+        # Best entries first within every prefix, ties in database order
+        self.prefixes = MappingProxyType({
+            prefix: MappingProxyType(dict(sorted(candidates.items(), key=lambda item: (-item[1], item[0]))))
+            for prefix, candidates in prefixes.items()
+        })
+        self.trigrams = MappingProxyType({gram: tuple(sorted(ids)) for gram, ids in grams.items()})
+
+    @staticmethod
+    def _terms(record: Dict[str, Any]):
+        """(field, normalized term) pairs indexed for a record"""
+        yield "number", normalize(record["number"])
+        yield "section", normalize(record["section"])
+        title = normalize(record["title"] or "")
+        if title:
+            yield "title", title
+            for word in title.split():
+                yield "title_word", word
+        for keyword in record["keywords"]:
+            keyword = normalize(keyword)
+            if keyword:
+                yield "keyword", keyword
+                for word in keyword.split():
+                    yield "keyword_word", word
+
+    def search(self, query: str, limit: int = 10, code_type: str = "both") -> List[Dict[str, Any]]:
+        """
+        Ranked completions for a partially typed query
+
+        Every query word must prefix-match a term of the section ("crim bre"
+        finds "Criminal Breach of Trust"); when that yields fewer than limit
+        sections, trigram matches on the words fill the rest.
+
+        Args:
+            query: Text typed so far
+            limit: Maximum completions
+            code_type: "ipc", "bns" or "both"
+
+        Returns:
+            Section summaries (section, number, title, code, category, label) with a score
+        """
+        tokens = normalize(query).split()
+        if not tokens or limit <= 0:
+            return []
+        code_type = code_type.lower()
+
+        def wanted(entry_id: int) -> bool:
+            return code_type not in CODES or self.codes[entry_id] == code_type
+
+        ranked = []
+        # The whole query as one prefix (e.g. "ipc 30", "criminal breach") or per-word matches
+        phrase = self.prefixes.get(" ".join(tokens))
+        if phrase is not None:
+            ranked = [(entry_id, score) for entry_id, score in phrase.items() if wanted(entry_id)][:limit]
+        if len(ranked) < limit and len(tokens) > 1:
+            ranked = self._merge(ranked, self._all_words(tokens, wanted), limit)
+        if len(ranked) < limit:
+            ranked = self._merge(ranked, self._fuzzy(tokens, wanted), limit)
+        return [dict(self.results[entry_id], score=round(score, 2)) for entry_id, score in ranked]
+
+    def _all_words(self, tokens: List[str], wanted) -> List[Tuple[int, float]]:
+        """Entries prefix-matching every word, scored by the mean of their word scores"""
+        tables = [self.prefixes.get(token) for token in tokens]
+        if any(table is None for table in tables):
+            return []
+        tables.sort(key=len)
+        matches = [
+            (entry_id, sum(table[entry_id] for table in tables) / len(tables))
+            for entry_id in tables[0]
+            if wanted(entry_id) and all(entry_id in table for table in tables[1:])
+        ]
+        matches.sort(key=lambda item: (-item[1], item[0]))
+        return matches
+
+    def _fuzzy(self, tokens: List[str], wanted) -> List[Tuple[int, float]]:
+        """Entries sharing enough trigrams with the query words (typos, infixes)"""
+        query_grams = set()
+        for token in tokens:
+            query_grams.update(trigrams(token))
+        shared = Counter()
+        for gram in query_grams:
+            shared.update(self.trigrams.get(gram, ()))
+        threshold = MIN_TRIGRAM_SIMILARITY * len(query_grams)
+        matches = [
+            (entry_id, _TRIGRAM_WEIGHT * count / len(query_grams))
+            for entry_id, count in shared.items() if count >= threshold and wanted(entry_id)
+        ]
+        matches.sort(key=lambda item: (-item[1], item[0]))
+        return matches
+
+    @staticmethod
+    def _merge(ranked: List[Tuple[int, float]], more: List[Tuple[int, float]], limit: int) -> List[Tuple[int, float]]:
+        """Append entries from more that are not ranked yet, up to limit"""
+        seen = {entry_id for entry_id, _ in ranked}
+        for entry_id, score in more:
+            if len(ranked) >= limit:
+                break
+            if entry_id not in seen:
+                ranked.append((entry_id, score))
+                seen.add(entry_id)
+        return ranked
+
+
+# Singleton instance
+_section_typeahead_instance = None
+_lock = threading.Lock()
+
+
+def get_section_typeahead() -> SectionTypeahead:
+    """Get or build the Section Typeahead index for the current section data"""
+    global _section_typeahead_instance
+    if _section_typeahead_instance is None:
+        with _lock:
+            if _section_typeahead_instance is None:
+                _section_typeahead_instance = SectionTypeahead(get_section_index(), get_legal_catalog().entries)
+    return _section_typeahead_instance
+
+
+def reload_section_typeahead(index: Optional[SectionIndex] = None) -> Optional[SectionTypeahead]:
+    """Rebuild the index over new section data and swap it in (if one was built)"""
+    global _section_typeahead_instance
+    if _section_typeahead_instance is None:
+        return None
+    typeahead = SectionTypeahead(index or get_section_index(), get_legal_catalog().entries)
+    _section_typeahead_instance = typeahead
+    return typeahead
+
+
+def section_typeahead(query: str, limit: int = 10, code_type: str = "both") -> List[Dict[str, Any]]:
+    """Ranked section completions from the shared Section Typeahead index"""
+    return get_section_typeahead().search(query, limit, code_type)
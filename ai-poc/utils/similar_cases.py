@@ -0,0 +1,314 @@
+"""
+Similar-Case Graph
+Top-k nearest neighbours of every indexed case, computed offline by blocked matrix
+multiplication over the vectors stored in the FAISS index and saved as uncompressed
+.npy arrays in a directory named by storage/indexes/similar_cases.json. The server
+memory-maps them, so "similar cases" for a case is a dict lookup plus one row read
+from the page cache instead of an embedding and a search.
+
+Refreshing an existing graph only computes rows for new or re-indexed cases (and for
+cases that lost a neighbour to a removal); every other row is merged with its scores
+against the new cases, so the neighbour lists equal a full rebuild (scores are kept as
+float32 for that; they may differ from a rebuild only by matrix-product rounding).
+"""
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config import SIMILAR_CASES_BLOCK_SIZE, SIMILAR_CASES_K, SIMILAR_CASES_RELOAD_INTERVAL
+from .faiss_index import META_DIR, load_index_state
+from .precedent_matcher import precedent_result
+
+# Pointer to the current graph directory; replacing it switches graphs atomically
+GRAPH_FILE = os.path.join(META_DIR, "similar_cases.json")
+_ARRAYS = ("ids", "fingerprints", "neighbors", "scores")
+
+# Refresh rebuilds from scratch once more than this share of the rows must be recomputed
+_FULL_REBUILD_SHARE = 0.5
+
+
+def vector_fingerprints(vectors: np.ndarray) -> np.ndarray:
+    """64-bit hash per vector row; a re-indexed case gets a new one when its text changed"""
+    return np.array([
+        int.from_bytes(hashlib.blake2b(row.tobytes(), digest_size=8).digest(), "little", signed=True)
+        for row in np.ascontiguousarray(vectors, dtype=np.float32)
+    ], dtype=np.int64)
+
+
+def _top_k(scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Columns and values of the k largest scores per row, best first (-1 / -inf padded)"""
+    rows, cols = scores.shape
+    if cols > k:
+        part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        part = np.tile(np.arange(cols), (rows, 1))
+    part_scores = np.take_along_axis(scores, part, axis=1)
+    order = np.argsort(-part_scores, axis=1, kind="stable")
+    neighbors = np.take_along_axis(part, order, axis=1)
+    values = np.take_along_axis(part_scores, order, axis=1)
+    neighbors = np.where(np.isneginf(values), -1, neighbors)
+    if cols < k:
+        neighbors = np.pad(neighbors, ((0, 0), (0, k - cols)), constant_values=-1)
+        values = np.pad(values, ((0, 0), (0, k - cols)), constant_values=-np.inf)
+    return neighbors, values
+
+
+def knn_rows(vectors: np.ndarray, rows: np.ndarray, k: int,
+             block_size: int = SIMILAR_CASES_BLOCK_SIZE) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Top-k neighbours (by inner product) of the given rows among all vectors, excluding themselves
+
+    Rows are processed block_size at a time, so memory is block_size x n scores.
+
+    Returns:
+        (neighbors int32 [len(rows), k], scores float32 [len(rows), k]), -1 / -inf padded
+    """
+    neighbors = np.full((len(rows), k), -1, dtype=np.int32)
+    scores = np.full((len(rows), k), -np.inf, dtype=np.float32)
+    for start in range(0, len(rows), block_size):
+        block = rows[start:start + block_size]
+        sims = vectors[block] @ vectors.T
+        sims[np.arange(len(block)), block] = -np.inf
+        neighbors[start:start + len(block)], scores[start:start + len(block)] = _top_k(sims, k)
+    return neighbors, scores
+
+
+def _merge_candidates(neighbors: np.ndarray, scores: np.ndarray, vectors: np.ndarray,
+                      rows: np.ndarray, candidates: np.ndarray, k: int,
+                      block_size: int = SIMILAR_CASES_BLOCK_SIZE):
+    """Update the top-k lists of rows (in place) with their scores against the candidate vectors"""
+    for start in range(0, len(rows), block_size):
+        block = rows[start:start + block_size]
+        sims = vectors[block] @ vectors[candidates].T
+        both_scores = np.concatenate([scores[block], sims], axis=1)
+        both_neighbors = np.concatenate([neighbors[block], np.broadcast_to(candidates, sims.shape)], axis=1)
+        cols, values = _top_k(both_scores, k)
+        neighbors[block] = np.where(cols >= 0, np.take_along_axis(both_neighbors, np.maximum(cols, 0), axis=1), -1)
+        scores[block] = values
+
+
+class SimilarCaseGraph:
+    """
+    Read-only kNN adjacency over the indexed cases
+
+    ids[i] is the case id of row i; neighbors[i] / scores[i] are its k most
+    similar rows, best first (-1 padded when fewer cases exist).
+    """
+
+    def __init__(self, ids: np.ndarray, fingerprints: np.ndarray, neighbors: np.ndarray, scores: np.ndarray):
+        self.ids = ids
+        self.fingerprints = fingerprints
+        self.neighbors = neighbors
+        self.scores = scores
+        self.rows = {case_id: row for row, case_id in enumerate(ids.tolist())}
+
+    @property
+    def k(self) -> int:
+        return self.neighbors.shape[1]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def similar(self, case_id: str, top_k: Optional[int] = None) -> Optional[List[Tuple[str, float]]]:
+        """(case id, similarity) of the nearest cases, best first; None for an unknown case"""
+        row = self.rows.get(case_id)
+        if row is None:
+            return None
+        pairs = []
+        for neighbor, score in zip(self.neighbors[row][:top_k], self.scores[row][:top_k]):
+            if neighbor < 0:
+                break
+            pairs.append((str(self.ids[neighbor]), float(score)))
+        return pairs
+
+    def save(self, path: str = GRAPH_FILE) -> str:
+        """
+        Write the arrays to a new directory, then point path at it
+
+        Older graph directories are deleted; processes that still map them keep
+        reading (on Windows the delete fails and is retried by the next save).
+
+        Returns:
+            The new graph directory
+        """
+        parent = os.path.dirname(path)
+        stem = os.path.splitext(os.path.basename(path))[0]
+        name = f"{stem}.{time.time_ns()}"
+        directory = os.path.join(parent, name)
+        os.makedirs(directory)
+        arrays = {"ids": self.ids, "fingerprints": self.fingerprints,
+                  "neighbors": self.neighbors, "scores": self.scores.astype(np.float32)}
+        for key, array in arrays.items():
+            np.save(os.path.join(directory, f"{key}.npy"), np.ascontiguousarray(array), allow_pickle=False)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"dir": name}, f)
+        os.replace(tmp_path, path)
+        for entry in os.listdir(parent):
+            if entry.startswith(f"{stem}.") and entry != name and os.path.isdir(os.path.join(parent, entry)):
+                shutil.rmtree(os.path.join(parent, entry), ignore_errors=True)
+        return directory
+
+    @classmethod
+    def load(cls, path: str = GRAPH_FILE) -> "SimilarCaseGraph":
+        """Memory-map the graph path points at (only the id -> row dict is built in memory)"""
+        with open(path, "r", encoding="utf-8") as f:
+            directory = os.path.join(os.path.dirname(path), json.load(f)["dir"])
+        arrays = [np.load(os.path.join(directory, f"{key}.npy"), mmap_mode="r", allow_pickle=False) for key in _ARRAYS]
+        return cls(*arrays)
+
+
+def build_similar_case_graph(ids: List[str], vectors: np.ndarray, k: int = SIMILAR_CASES_K) -> SimilarCaseGraph:
+    """Full all-pairs graph over the given cases"""
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    neighbors, scores = knn_rows(vectors, np.arange(len(ids)), k)
+    return SimilarCaseGraph(np.array(ids, dtype=str), vector_fingerprints(vectors), neighbors, scores)
+
+
+def refresh_similar_case_graph(graph: Optional[SimilarCaseGraph], ids: List[str], vectors: np.ndarray,
+                               k: int = SIMILAR_CASES_K) -> Tuple[SimilarCaseGraph, int]:
+    """
+    Graph for the current cases, reusing the rows of graph that are still valid
+
+    Args:
+        graph: Previous graph (None for a full build)
+        ids: Case ids of the current index rows
+        vectors: Their vectors
+        k: Neighbours per case
+
+    Returns:
+        (new graph, number of rows computed from scratch)
+    """
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    fingerprints = vector_fingerprints(vectors)
+    # kept rows are merged by score, so they need the exact float32 scores (older graphs stored float16)
+    if graph is None or graph.k != k or graph.scores.dtype != np.float32:
+        return build_similar_case_graph(ids, vectors, k), len(ids)
+
+    # old row of each current row whose case and vector are unchanged
+    old_rows = np.full(len(ids), -1, dtype=np.int64)
+    for row, (case_id, fingerprint) in enumerate(zip(ids, fingerprints)):
+        old = graph.rows.get(case_id)
+        if old is not None and graph.fingerprints[old] == fingerprint:
+            old_rows[row] = old
+    kept = np.flatnonzero(old_rows >= 0)
+
+    # carry kept rows over, renumbering neighbours; lists that lost a neighbour are recomputed
+    renumber = np.full(len(graph) + 1, -1, dtype=np.int64)
+    renumber[old_rows[kept]] = kept
+    neighbors = np.full((len(ids), k), -1, dtype=np.int32)
+    scores = np.full((len(ids), k), -np.inf, dtype=np.float32)
+    old_neighbors = graph.neighbors[old_rows[kept]]
+    neighbors[kept] = renumber[old_neighbors]
+    scores[kept] = graph.scores[old_rows[kept]]
+    lost = ((old_neighbors >= 0) & (neighbors[kept] < 0)).any(axis=1)
+
+    fresh = np.flatnonzero(old_rows < 0)
+    dirty = np.union1d(fresh, kept[lost])
+    if len(dirty) > _FULL_REBUILD_SHARE * len(ids):
+        return build_similar_case_graph(ids, vectors, k), len(ids)
+
+    if len(fresh):
+        clean = np.setdiff1d(kept, dirty)
+        _merge_candidates(neighbors, scores, vectors, clean, fresh, k)
+    if len(dirty):
+        neighbors[dirty], scores[dirty] = knn_rows(vectors, dirty, k)
+    return SimilarCaseGraph(np.array(ids, dtype=str), fingerprints, neighbors, scores), len(dirty)
+
+
+def index_cases() -> Tuple[List[str], np.ndarray]:
+    """Case ids and stored vectors of the live FAISS index (empty without an index)"""
+    state = load_index_state()
+    if state is None or state.index.ntotal == 0:
+        return [], np.zeros((0, 0), dtype=np.float32)
+    vectors = state.index.reconstruct_n(0, state.index.ntotal)
+    return [str(row.get("id")) for row in state.meta], vectors
+
+
+def read_similar_case_graph(path: str = GRAPH_FILE) -> Optional[SimilarCaseGraph]:
+    """The saved graph, or None if it is missing or unreadable"""
+    if not os.path.exists(path):
+        return None
+    try:
+        return SimilarCaseGraph.load(path)
+    except Exception as e:
+        print(f"Warning: Could not read similar-case graph {path}: {e}")
+        return None
+
+
+# Singleton instance, reloaded when the job rewrites the file
+_graph = None
+_graph_signature = None
+_graph_checked = None
+_lock = threading.Lock()
+_case_rows = (None, {})
+
+
+def _graph_check_due() -> bool:
+    checked = _graph_checked
+    return checked is None or time.monotonic() - checked >= SIMILAR_CASES_RELOAD_INTERVAL
+
+
+def get_similar_case_graph() -> Optional[SimilarCaseGraph]:
+    """
+    The current graph, or None if none was built
+
+    The pointer file is checked at most every SIMILAR_CASES_RELOAD_INTERVAL
+    seconds, so a graph written by the job is picked up within that interval.
+    """
+    global _graph, _graph_signature, _graph_checked
+    if not _graph_check_due():
+        return _graph
+    with _lock:
+        if _graph_check_due():
+            try:
+                stat = os.stat(GRAPH_FILE)
+                signature = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                signature = None
+            if signature != _graph_signature:
+                _graph = read_similar_case_graph() if signature is not None else None
+                _graph_signature = signature
+            _graph_checked = time.monotonic()
+    return _graph
+
+
+def _rows_by_id(meta: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Metadata row per case id, rebuilt only when the live metadata list changes"""
+    global _case_rows
+    cached_meta, rows = _case_rows
+    if cached_meta is not meta:
+        rows = {str(row.get("id")): row for row in meta}
+        _case_rows = (meta, rows)
+    return rows
+
+
+def get_similar_cases(case_id: str, top_k: int = SIMILAR_CASES_K) -> Optional[Dict[str, Any]]:
+    """
+    Precomputed similar cases of an indexed case
+
+    Args:
+        case_id: Case id (the "id" of its index row)
+        top_k: Number of cases to return (at most the graph's k)
+
+    Returns:
+        {"case_id", "similar_cases", "total_found"}, or None if the case is not in the graph
+    """
+    graph = get_similar_case_graph()
+    pairs = graph.similar(case_id, top_k) if graph is not None else None
+    if pairs is None:
+        return None
+    state = load_index_state()
+    rows = _rows_by_id(state.meta) if state is not None else {}
+    results = []
+    for neighbor_id, similarity in pairs:
+        case_meta = rows.get(neighbor_id)
+        if case_meta is not None:
+            results.append(precedent_result(case_meta, similarity))
+    return {"case_id": case_id, "similar_cases": results, "total_found": len(results)}
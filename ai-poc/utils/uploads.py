@@ -0,0 +1,118 @@
+"""
+Streaming Upload Handling
+Copies multipart uploads to disk in fixed-size chunks so large scans are never held in memory whole
+"""
+import os
+import mmap
+import tempfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Union
+
+from config import UPLOAD_CHUNK_SIZE, UPLOAD_MAX_BYTES, UPLOAD_SPOOL_MAX_MEMORY
+
+
+class UploadTooLargeError(Exception):
+    """Raised when an upload exceeds the configured size limit"""
+
+    def __init__(self, limit: int):
+        super().__init__(f"Upload exceeds the maximum allowed size of {limit} bytes")
+        self.limit = limit
+
+
+class BatchLimitError(Exception):
+    """Raised when a batch (or the archives in it) exceeds the file count or extracted size limit"""
+
+
+async def _copy_chunks(upload, target: BinaryIO, max_bytes: int, chunk_size: int) -> int:
+    """Copy an UploadFile into target chunk by chunk, enforcing max_bytes"""
+    total = 0
+    while True:
+        chunk = await upload.read(chunk_size)
+        if not chunk:
+            break
+        total += len(chunk)
+        if max_bytes and total > max_bytes:
+            raise UploadTooLargeError(max_bytes)
+        target.write(chunk)
+    return total
+
+
+def copy_stream(
+    source: BinaryIO,
+    target: BinaryIO,
+    max_bytes: int = UPLOAD_MAX_BYTES,
+    chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> int:
+    """
+    Synchronous counterpart of _copy_chunks for plain file objects (e.g. zip members)
+
+    max_bytes caps what is actually read, so a member that inflates beyond its
+    declared size is stopped at that limit.
+    """
+    total = 0
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            break
+        total += len(chunk)
+        if max_bytes and total > max_bytes:
+            raise UploadTooLargeError(max_bytes)
+        target.write(chunk)
+    return total
+
+
+async def save_upload(
+    upload,
+    dest_path: str,
+    max_bytes: int = UPLOAD_MAX_BYTES,
+    chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> int:
+    """
+    Stream an upload straight to dest_path
+
+    Returns:
+        Number of bytes written. The partial file is removed if the copy fails.
+    """
+    try:
+        with open(dest_path, "wb") as f:
+            return await _copy_chunks(upload, f, max_bytes, chunk_size)
+    except Exception:
+        if os.path.exists(dest_path):
+            os.remove(dest_path)
+        raise
+
+
+async def spool_upload(
+    upload,
+    max_bytes: int = UPLOAD_MAX_BYTES,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+    max_memory: int = UPLOAD_SPOOL_MAX_MEMORY
+) -> tempfile.SpooledTemporaryFile:
+    """
+    Stream an upload into a spooled temp file
+
+    Small uploads stay in memory, anything above max_memory rolls over to disk.
+    The returned file is rewound and must be closed by the caller.
+    """
+    spooled = tempfile.SpooledTemporaryFile(max_size=max_memory)
+    try:
+        await _copy_chunks(upload, spooled, max_bytes, chunk_size)
+        spooled.seek(0)
+        return spooled
+    except Exception:
+        spooled.close()
+        raise
+
+
+@contextmanager
+def mapped_view(path: Union[str, os.PathLike]) -> Iterator[Union[mmap.mmap, bytes]]:
+    """Read-only memory-mapped view of a file on disk (empty files yield b"")"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        view = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield view
+        finally:
+            view.close()